@@ -0,0 +1,54 @@
+"""Instance Home Assistant minimale pour les benchmarks et essais de charge.
+
+Réutilise le cœur de test de ``tests/common.py`` (registres chargés comme au
+démarrage, entité météo et capteurs intérieurs de substitution, entrées
+créées par le config flow). Les scripts de benchmarks sont lancés depuis
+``benchmarks/``: la racine du dépôt est ajoutée à sys.path pour que le
+paquet ``tests`` et l'intégration (``custom_components.SmartHRT``) soient
+importables, comme sous pytest.
+
+Nécessite le paquet homeassistant (voir pyproject.toml).
+"""
+
+import importlib
+import sys
+from pathlib import Path
+from types import ModuleType
+
+REPOSITORY_PATH = Path(__file__).parents[1]
+if str(REPOSITORY_PATH) not in sys.path:
+    sys.path.insert(0, str(REPOSITORY_PATH))
+
+from tests.common import (  # noqa: E402
+    DOMAIN,
+    FORECAST_HOURS,
+    WEATHER_ENTITY,
+    async_add_entries,
+    async_start_hass,
+    async_stop_hass,
+    coordinator,
+    interior_sensor,
+    set_interior,
+    set_weather,
+)
+
+INTEGRATION_PACKAGE = "custom_components.SmartHRT"
+
+__all__ = [
+    "DOMAIN",
+    "FORECAST_HOURS",
+    "WEATHER_ENTITY",
+    "async_add_entries",
+    "async_start_hass",
+    "async_stop_hass",
+    "coordinator",
+    "integration_module",
+    "interior_sensor",
+    "set_interior",
+    "set_weather",
+]
+
+
+def integration_module(name: str) -> ModuleType:
+    """Module de l'intégration tel que chargé par Home Assistant."""
+    return importlib.import_module(f"{INTEGRATION_PACKAGE}.{name}")
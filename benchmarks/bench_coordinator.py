@@ -0,0 +1,247 @@
+"""Benchmarks des chemins critiques du coordinateur, avec seuils de régression.
+
+Mesure, sur une instance configurée dans un cœur Home Assistant réel (voir
+_harness.py), le coût par appel de:
+- calculate_recovery_time (solveur de Newton);
+- calculate_recovery_update_time;
+- _update_coefficients (RCth et RPth, relaxation ADR-006);
+- _check_temperature_thresholds (détection du lag, sans transition);
+- _notify_listeners: diffusion d'une modification de tous les champs à
+  l'ensemble des entités de l'instance, écritures d'état comprises;
+- _save_learned_data + écriture du stockage + _restore_learned_data.
+
+Chaque mesure est le meilleur de ``--repeat`` séries de ``--number`` appels,
+rapporté à un appel. Elle est comparée à la référence enregistrée dans
+baseline_coordinator.json: au-delà de ``(1 + seuil) x référence``, le cas est
+en régression et le script échoue (code 1). Les références dépendent de la
+machine: les régénérer sur la machine de référence avec --save-baseline.
+
+Usage:
+    python benchmarks/bench_coordinator.py [--save-baseline] [--threshold T]
+        [--number N] [--repeat R] [--baseline FICHIER]
+"""
+
+import argparse
+import asyncio
+import json
+import logging
+import platform
+import sys
+import time
+import timeit
+from collections.abc import Awaitable, Callable
+from dataclasses import fields
+from pathlib import Path
+from typing import Any
+
+import _harness
+from homeassistant.const import __version__ as HA_VERSION
+
+BASELINE_PATH = Path(__file__).with_name("baseline_coordinator.json")
+DEFAULT_THRESHOLD = 0.5
+
+SyncCase = Callable[[], object]
+AsyncCase = Callable[[], Awaitable[object]]
+
+
+def best_per_call_sync(action: SyncCase, number: int, repeat: int) -> float:
+    """Meilleure durée par appel (s) sur repeat séries de number appels."""
+    return min(timeit.repeat(action, number=number, repeat=repeat)) / number
+
+
+async def best_per_call_async(action: AsyncCase, number: int, repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for _ in range(number):
+            await action()
+        best = min(best, time.perf_counter() - start)
+    return best / number
+
+
+async def run_cases(number: int, repeat: int) -> dict[str, float]:
+    """Exécute tous les cas; retourne les durées par appel (µs)."""
+    hass = await _harness.async_start_hass()
+    try:
+        (entry,) = await _harness.async_add_entries(hass, 1)
+        coordinator = _harness.coordinator(hass, entry)
+        coordinator_module = _harness.integration_module("coordinator")
+        return await _measure(hass, coordinator, coordinator_module, number, repeat)
+    finally:
+        await _harness.async_stop_hass(hass)
+
+
+async def _measure(
+    hass: Any, coordinator: Any, module: Any, number: int, repeat: int
+) -> dict[str, float]:
+    data = coordinator.data
+    results: dict[str, float] = {}
+
+    def record(name: str, seconds: float) -> None:
+        results[name] = seconds * 1e6
+
+    # ── calculate_recovery_time ──────────────────────────────────────────
+    # Nuit typique: intérieur sous la consigne, relance de quelques heures
+    data.interior_temp = 17.0
+
+    record(
+        "calculate_recovery_time.solver",
+        best_per_call_sync(coordinator.calculate_recovery_time, number, repeat),
+    )
+
+    # ── calculate_recovery_update_time ───────────────────────────────────
+    record(
+        "calculate_recovery_update_time",
+        best_per_call_sync(
+            coordinator.calculate_recovery_update_time, number, repeat
+        ),
+    )
+
+    # ── _check_temperature_thresholds (lag actif, sans transition) ───────
+    data.temp_lag_detection_active = True
+    data.temp_recovery_calc = 20.0
+    data.rp_calc_mode = False
+    temperatures = [19.9, 19.85]
+    toggle = [0]
+
+    def thresholds() -> None:
+        toggle[0] ^= 1
+        data.interior_temp = temperatures[toggle[0]]
+        coordinator._check_temperature_thresholds()
+
+    record(
+        "_check_temperature_thresholds",
+        best_per_call_sync(thresholds, number, repeat),
+    )
+    data.temp_lag_detection_active = False
+
+    # ── _notify_listeners: diffusion à toutes les entités ────────────────
+    all_fields = [field.name for field in fields(module.SmartHRTData)]
+    all_fields.append(module.FIELD_CLOCK)
+
+    def fan_out() -> None:
+        toggle[0] ^= 1
+        data.interior_temp = 19.0 + toggle[0]
+        data.mark_dirty(*all_fields)
+        coordinator._notify_listeners()
+        handle = coordinator._notify_handle
+        coordinator._flush_listeners()
+        if handle is not None:
+            handle.cancel()
+
+    record(
+        f"_notify_listeners.fan_out_{len(coordinator._listeners)}",
+        best_per_call_sync(fan_out, max(number // 10, 1), repeat),
+    )
+
+    # ── Sauvegarde / restauration ────────────────────────────────────────
+    domain_store = coordinator._domain_store
+
+    async def save_restore() -> None:
+        data.rcth_fast += 0.001  # contenu modifié: l'écriture n'est pas évitée
+        await coordinator._save_learned_data()
+        if domain_store is not None:
+            await domain_store.async_flush()
+        await coordinator._restore_learned_data()
+
+    record(
+        "save_restore_roundtrip",
+        await best_per_call_async(save_restore, max(number // 20, 1), repeat),
+    )
+
+    # ── _update_coefficients (en dernier: modifie les coefficients) ──────
+    data.rcth_calculated = 45.0
+    data.rpth_calculated = 30.0
+    record(
+        "_update_coefficients.rcth",
+        best_per_call_sync(
+            lambda: coordinator._update_coefficients("rcth"), number, repeat
+        ),
+    )
+    record(
+        "_update_coefficients.rpth",
+        best_per_call_sync(
+            lambda: coordinator._update_coefficients("rpth"), number, repeat
+        ),
+    )
+    await hass.async_block_till_done()
+    return results
+
+
+def load_baseline(path: Path) -> dict[str, Any]:
+    try:
+        return json.loads(path.read_text(encoding="utf-8"))
+    except FileNotFoundError:
+        return {"cases": {}}
+
+
+def save_baseline(path: Path, results: dict[str, float], threshold: float) -> None:
+    baseline = {
+        "environment": {
+            "python": platform.python_version(),
+            "homeassistant": HA_VERSION,
+            "machine": platform.machine(),
+            "processor": platform.processor() or None,
+        },
+        "threshold": threshold,
+        "cases": {name: {"us": round(value, 3)} for name, value in results.items()},
+    }
+    path.write_text(json.dumps(baseline, indent=2) + "\n", encoding="utf-8")
+
+
+def report(
+    results: dict[str, float], baseline: dict[str, Any], threshold: float
+) -> int:
+    """Affiche la comparaison; retourne le nombre de régressions."""
+    regressions = 0
+    reference_cases = baseline.get("cases", {})
+    print(f"{'cas':<44}{'µs/appel':>12}{'référence':>12}{'ratio':>8}  statut")
+    for name, value in results.items():
+        reference = reference_cases.get(name, {}).get("us")
+        if reference is None:
+            print(f"{name:<44}{value:>12.2f}{'-':>12}{'-':>8}  nouveau")
+            continue
+        ratio = value / reference if reference else float("inf")
+        status = "ok"
+        if ratio > 1 + threshold:
+            status = "RÉGRESSION"
+            regressions += 1
+        print(f"{name:<44}{value:>12.2f}{reference:>12.2f}{ratio:>8.2f}  {status}")
+    return regressions
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--number", type=int, default=2000)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--threshold", type=float, help="écart toléré (0.5 = +50 %)")
+    parser.add_argument("--baseline", type=Path, default=BASELINE_PATH)
+    parser.add_argument("--save-baseline", action="store_true")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.WARNING)
+    logging.getLogger("homeassistant.loader").setLevel(logging.ERROR)
+
+    results = asyncio.run(run_cases(args.number, args.repeat))
+    baseline = load_baseline(args.baseline)
+    threshold = (
+        args.threshold
+        if args.threshold is not None
+        else baseline.get("threshold", DEFAULT_THRESHOLD)
+    )
+
+    if args.save_baseline:
+        save_baseline(args.baseline, results, threshold)
+        report(results, {"cases": {}}, threshold)
+        print(f"référence enregistrée dans {args.baseline}")
+        return 0
+
+    regressions = report(results, baseline, threshold)
+    if regressions:
+        print(f"{regressions} cas en régression (seuil +{threshold:.0%})")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
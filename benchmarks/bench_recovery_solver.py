@@ -0,0 +1,163 @@
+"""Benchmark du solveur de durée de relance face à la boucle YAML d'origine.
+
+Compare, sur un jeu d'entrées pseudo-aléatoires reproductible:
+- la boucle historique (20 itérations amorties, sans critère d'arrêt);
+- le solveur de Newton à froid (estimation initiale du YAML);
+- le solveur de Newton à chaud (solution d'un calcul précédent).
+
+Le package ``thermal`` n'importe rien de Home Assistant: ce script tourne
+hors ligne, sans environnement HA.
+
+Usage:
+    python benchmarks/bench_recovery_solver.py [--cases N] [--repeat R]
+
+Le script échoue (code 1) si un résultat diffère de plus d'une seconde
+alors que la boucle historique avait elle-même convergé. Les cas où les 20
+itérations amorties n'atteignent pas le point fixe (oscillation lorsque
+|g'| > 2, blocage sous le seuil de ratio) sont comptés à part.
+"""
+
+import argparse
+import math
+import random
+import sys
+import timeit
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parents[1] / "custom_components" / "SmartHRT"))
+
+from thermal import solve_recovery_duration  # noqa: E402
+
+# Écart maximal toléré entre les deux méthodes (heures)
+MAX_DIFFERENCE = 1 / 3600
+
+
+def legacy_recovery_duration(tint, text, tsp, rcth, rpth, time_remaining):
+    """Reproduction fidèle de l'ancien calculate_recovery_time (20 itérations)."""
+    max_duration = max(time_remaining - 1 / 6, 0)
+    try:
+        ratio = (rpth + text - tint) / (rpth + text - tsp)
+        duree_relance = min(max(rcth * math.log(max(ratio, 0.1)), 0), max_duration)
+    except (ValueError, ZeroDivisionError):
+        duree_relance = max_duration
+
+    for _ in range(20):
+        try:
+            tint_start = text + (tint - text) / math.exp(
+                (time_remaining - duree_relance) / rcth
+            )
+            ratio = (rpth + text - tint_start) / (rpth + text - tsp)
+            if ratio > 0.1:
+                duree_relance = min(
+                    (duree_relance + 2 * max(rcth * math.log(ratio), 0)) / 3,
+                    max_duration,
+                )
+        except (ValueError, ZeroDivisionError):
+            break
+    return duree_relance
+
+
+def legacy_residual(tint, text, tsp, rcth, rpth, time_remaining, duration):
+    """Résidu du point fixe atteint par la boucle YAML (inf si bloquée)."""
+    max_duration = max(time_remaining - 1 / 6, 0)
+    tint_start = text + (tint - text) * math.exp((duration - time_remaining) / rcth)
+    ratio = (rpth + text - tint_start) / (rpth + text - tsp)
+    if ratio <= 0.1:
+        return math.inf
+    return abs(duration - min(max(rcth * math.log(ratio), 0), max_duration))
+
+
+def generate_cases(count: int, seed: int = 42) -> list[tuple[float, ...]]:
+    """Génère des nuits réalistes (tint, text, tsp, rcth, rpth, time_remaining)."""
+    rng = random.Random(seed)
+    return [
+        (
+            rng.uniform(15.0, 21.0),
+            rng.uniform(-10.0, 12.0),
+            rng.uniform(18.0, 22.0),
+            rng.uniform(5.0, 150.0),
+            rng.uniform(5.0, 200.0),
+            rng.uniform(0.5, 9.0),
+        )
+        for _ in range(count)
+    ]
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--cases", type=int, default=2000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    cases = generate_cases(args.cases)
+    legacy = [legacy_recovery_duration(*case) for case in cases]
+
+    # Démarrage à chaud: solution d'une mise à jour précédente, 20 min plus tôt
+    # avec une température intérieure légèrement plus haute
+    warm = [
+        legacy_recovery_duration(tint + 0.1, text, tsp, rcth, rpth, t + 1 / 3)
+        for tint, text, tsp, rcth, rpth, t in cases
+    ]
+
+    def run_legacy() -> None:
+        for case in cases:
+            legacy_recovery_duration(*case)
+
+    def run_cold() -> None:
+        for tint, text, tsp, rcth, rpth, t in cases:
+            solve_recovery_duration(tint, text, tsp, rcth, rpth, t, max(t - 1 / 6, 0))
+
+    def run_warm() -> None:
+        for (tint, text, tsp, rcth, rpth, t), initial in zip(cases, warm, strict=True):
+            solve_recovery_duration(
+                tint, text, tsp, rcth, rpth, t, max(t - 1 / 6, 0), initial
+            )
+
+    failures = 0
+    legacy_unconverged = 0
+    iterations = {"cold": 0, "warm": 0}
+    max_difference = 0.0
+    for (tint, text, tsp, rcth, rpth, t), expected, initial in zip(
+        cases, legacy, warm, strict=True
+    ):
+        max_duration = max(t - 1 / 6, 0)
+        for mode, start in (("cold", None), ("warm", initial)):
+            solution = solve_recovery_duration(
+                tint, text, tsp, rcth, rpth, t, max_duration, start
+            )
+            iterations[mode] += solution.iterations
+            difference = abs(solution.duration - expected)
+            if difference <= MAX_DIFFERENCE:
+                max_difference = max(max_difference, difference)
+            elif (
+                legacy_residual(tint, text, tsp, rcth, rpth, t, expected)
+                > MAX_DIFFERENCE / 10
+            ):
+                legacy_unconverged += mode == "cold"
+            else:
+                failures += 1
+
+    print(f"Cas évalués        : {len(cases)}")
+    print(f"Écart maximal      : {max_difference * 3600:.4f} s")
+    print(f"YAML non convergé  : {legacy_unconverged} cas (écart attendu)")
+    print(f"Itérations (froid) : {iterations['cold'] / len(cases):.2f} / appel")
+    print(f"Itérations (chaud) : {iterations['warm'] / len(cases):.2f} / appel")
+
+    timings = {}
+    for label, func in (
+        ("YAML (20 itér.)", run_legacy),
+        ("Newton (froid)", run_cold),
+        ("Newton (chaud)", run_warm),
+    ):
+        best = min(timeit.repeat(func, number=1, repeat=args.repeat))
+        timings[label] = best / len(cases) * 1e6
+        print(f"{label:<19}: {timings[label]:.2f} µs / appel")
+
+    if failures:
+        print(f"ÉCHEC: {failures} résultats diffèrent de plus d'une seconde")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,280 @@
+"""Essai de charge: N instances SmartHRT dans un même cœur Home Assistant.
+
+Pour chaque nombre d'instances, un processus dédié (pic de mémoire propre à
+la mesure):
+1. démarre un cœur Home Assistant (voir _harness.py) avec une horloge
+   accélérée (ScaledClock, hass.data[DOMAIN][DATA_CLOCK]);
+2. crée les N entrées via le config flow (async_setup_entry,
+   plateformes, entités): durée mesurée;
+3. place l'heure de coupure quelques minutes virtuelles plus tard et l'heure
+   cible 7 h après (setters du coordinateur, comme les entités time), puis
+   simule la nuit: chaque maison (modèle RC du premier ordre) se refroidit
+   ou chauffe selon l'état de son instance, les capteurs intérieurs sont mis
+   à jour toutes les ``--sample`` secondes virtuelles, la météo toutes les
+   heures virtuelles.
+
+Pendant la nuit simulée, une sonde programmée toutes les ``--probe``
+millisecondes mesure le retard de la boucle d'événements: le pire retard est
+la latence maximale subie par un callback.
+
+Rapport par nombre d'instances: durée de configuration, pic de mémoire
+résidente (RSS), écritures d'état de l'intégration par minute simulée,
+écritures du stockage, retard maximal et 99e centile de la boucle, cycles
+de relance terminés.
+
+Usage:
+    python benchmarks/load_test.py [--counts 1,10,100,1000] [--speed S]
+        [--sample S] [--probe MS]
+"""
+
+import argparse
+import asyncio
+import json
+import logging
+import math
+import resource
+import subprocess
+import sys
+import time
+from collections import Counter
+from datetime import datetime, timedelta
+
+import _harness
+from homeassistant.const import EVENT_STATE_CHANGED
+from homeassistant.core import Event, HomeAssistant, callback
+from homeassistant.util import dt as dt_util
+
+TSP = 19.0
+# Maisons simulées: constante de refroidissement et puissance de chauffe (h, °C)
+HOUSE_RCTH = 60.0
+HOUSE_RPTH = 25.0
+NIGHT_HOURS = 7
+CUTOFF_DELAY = timedelta(minutes=5)
+END_MARGIN = timedelta(minutes=30)
+
+
+class LoopLagProbe:
+    """Mesure le retard de la boucle d'événements par un minuteur périodique."""
+
+    def __init__(self, hass: HomeAssistant, interval: float) -> None:
+        self._loop = hass.loop
+        self._interval = interval
+        self._expected = 0.0
+        self._handle: asyncio.TimerHandle | None = None
+        self.lags: list[float] = []
+
+    def start(self) -> None:
+        self._expected = self._loop.time() + self._interval
+        self._handle = self._loop.call_at(self._expected, self._tick)
+
+    def stop(self) -> None:
+        if self._handle is not None:
+            self._handle.cancel()
+            self._handle = None
+
+    def _tick(self) -> None:
+        now = self._loop.time()
+        self.lags.append(now - self._expected)
+        self._expected = now + self._interval
+        self._handle = self._loop.call_at(self._expected, self._tick)
+
+    def percentile(self, fraction: float) -> float:
+        if not self.lags:
+            return 0.0
+        ordered = sorted(self.lags)
+        return ordered[min(int(len(ordered) * fraction), len(ordered) - 1)]
+
+
+def exterior_temperature(moment: datetime) -> float:
+    """Température extérieure: minimum vers 5 h."""
+    hour = moment.hour + moment.minute / 60
+    return 4.0 - 3.0 * math.cos(2 * math.pi * (hour - 5) / 24)
+
+
+async def run_instances(
+    count: int, speed: float, sample: float, probe: float
+) -> dict[str, float]:
+    """Configure count instances, simule une nuit; retourne les mesures."""
+    hass = await _harness.async_start_hass()
+    try:
+        clock_module = _harness.integration_module("clock")
+        const = _harness.integration_module("const")
+        states = _harness.integration_module("coordinator").SmartHRTState
+
+        # Heures de coupure et cible juste derrière l'instant de départ: aucun
+        # déclencheur ne survient pendant la configuration (moins d'un jour
+        # virtuel)
+        start = dt_util.now().replace(hour=12, minute=0, second=0, microsecond=0)
+        clock = clock_module.ScaledClock(hass, speed, start)
+        hass.data.setdefault(_harness.DOMAIN, {})[const.DATA_CLOCK] = clock
+        behind = (start - timedelta(minutes=2)).time().isoformat()
+
+        began = time.perf_counter()
+        entries = await _harness.async_add_entries(
+            hass, count, target_hour=behind, recoverycalc_hour=behind
+        )
+        setup_seconds = time.perf_counter() - began
+        if clock.now() - start > timedelta(hours=23):
+            raise SystemExit(
+                "configuration plus longue qu'un jour virtuel: réduire --speed"
+            )
+        coordinators = [_harness.coordinator(hass, entry) for entry in entries]
+
+        # Nuit: coupure dans quelques minutes virtuelles, cible 7 h après
+        cutoff = (clock.now() + CUTOFF_DELAY).replace(second=0, microsecond=0)
+        target = cutoff + timedelta(hours=NIGHT_HOURS)
+        for coordinator in coordinators:
+            coordinator.set_recoverycalc_hour(cutoff.time())
+            coordinator.set_target_hour(target.time())
+        await hass.async_block_till_done()
+
+        writes = 0
+        inputs = {_harness.WEATHER_ENTITY}
+        inputs.update(_harness.interior_sensor(index) for index in range(count))
+
+        @callback
+        def count_write(event: Event) -> None:
+            nonlocal writes
+            if event.data["entity_id"] not in inputs:
+                writes += 1
+
+        unsubscribe = hass.bus.async_listen(EVENT_STATE_CHANGED, count_write)
+        store = hass.data[_harness.DOMAIN].get(const.DATA_DOMAIN_STORE)
+        store_writes = store.stats["writes"] if store is not None else 0
+        probe_timer = LoopLagProbe(hass, probe / 1000)
+        probe_timer.start()
+
+        night_start = clock.now()
+        interiors = [TSP] * count
+        last = night_start
+        last_weather_hour = -1
+        heated = (states.HEATING_ON, states.HEATING_PROCESS)
+        while (now := clock.now()) < target + END_MARGIN:
+            hours = (now - last).total_seconds() / 3600
+            last = now
+            text = exterior_temperature(now)
+            if now.hour != last_weather_hour:
+                last_weather_hour = now.hour
+                _harness.set_weather(hass, temperature=round(text, 1), wind_speed=15.0)
+            for index, coordinator in enumerate(coordinators):
+                state = coordinator.data.current_state
+                if state == states.HEATING_ON and interiors[index] >= TSP:
+                    # Thermostat de journée: maintien à la consigne
+                    interiors[index] = TSP
+                else:
+                    asymptote = text + (HOUSE_RPTH if state in heated else 0.0)
+                    interiors[index] = asymptote + (
+                        interiors[index] - asymptote
+                    ) * math.exp(-hours / HOUSE_RCTH)
+                _harness.set_interior(hass, index, interiors[index])
+                # Capteurs indépendants: chaque mise à jour est traitée dans sa
+                # propre itération de la boucle, comme en production
+                await asyncio.sleep(0)
+            await asyncio.sleep(sample / speed)
+
+        probe_timer.stop()
+        unsubscribe()
+        simulated_minutes = (clock.now() - night_start).total_seconds() / 60
+        if store is not None:
+            await store.async_flush()
+            store_writes = store.stats["writes"] - store_writes
+        else:
+            store_writes = sum(
+                coordinator.persistence_stats["writes"] for coordinator in coordinators
+            )
+
+        peak_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        if sys.platform == "darwin":  # octets sous macOS, kio sous Linux
+            peak_rss //= 1024
+        cycles = sum(
+            coordinator.persistence_stats["cycles_recorded"]
+            for coordinator in coordinators
+        )
+        final_states = Counter(c.data.current_state for c in coordinators)
+        return {
+            "entries": count,
+            "setup_s": setup_seconds,
+            "setup_ms_per_entry": setup_seconds * 1000 / count,
+            "peak_rss_mb": peak_rss / 1024,
+            "states": len(hass.states.async_all()),
+            "writes_per_min": writes / simulated_minutes,
+            "storage_writes": store_writes,
+            "lag_max_ms": max(probe_timer.lags, default=0.0) * 1000,
+            "lag_p99_ms": probe_timer.percentile(0.99) * 1000,
+            "cycles": cycles,
+            "triggers_fired": clock.fired,
+            "final_states": dict(final_states),
+        }
+    finally:
+        await _harness.async_stop_hass(hass)
+
+
+def run_child(args: argparse.Namespace, count: int) -> dict[str, float]:
+    """Exécute une mesure dans un processus dédié."""
+    command = [
+        sys.executable,
+        __file__,
+        "--entries",
+        str(count),
+        "--speed",
+        str(args.speed),
+        "--sample",
+        str(args.sample),
+        "--probe",
+        str(args.probe),
+    ]
+    completed = subprocess.run(command, capture_output=True, text=True, check=False)
+    if completed.returncode != 0:
+        sys.stderr.write(completed.stderr)
+        raise SystemExit(f"échec de la mesure pour {count} instances")
+    return json.loads(completed.stdout.strip().splitlines()[-1])
+
+
+def report(results: list[dict[str, float]]) -> None:
+    print(
+        f"{'entrées':>8}{'config s':>10}{'ms/entrée':>11}{'RSS Mo':>9}"
+        f"{'écr./min':>10}{'stockage':>10}{'retard max ms':>15}{'p99 ms':>9}"
+        f"{'cycles':>8}"
+    )
+    for result in results:
+        print(
+            f"{result['entries']:>8}{result['setup_s']:>10.2f}"
+            f"{result['setup_ms_per_entry']:>11.1f}{result['peak_rss_mb']:>9.0f}"
+            f"{result['writes_per_min']:>10.1f}{result['storage_writes']:>10}"
+            f"{result['lag_max_ms']:>15.1f}{result['lag_p99_ms']:>9.1f}"
+            f"{result['cycles']:>8}"
+        )
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--counts", default="1,10,100,1000")
+    parser.add_argument(
+        "--speed", type=float, default=600, help="accélération du temps virtuel"
+    )
+    parser.add_argument(
+        "--sample", type=float, default=300, help="période des capteurs (s virtuelles)"
+    )
+    parser.add_argument(
+        "--probe", type=float, default=10, help="période de la sonde de retard (ms)"
+    )
+    parser.add_argument("--entries", type=int, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.entries is not None:
+        logging.basicConfig(level=logging.ERROR)
+        result = asyncio.run(
+            run_instances(args.entries, args.speed, args.sample, args.probe)
+        )
+        print(json.dumps(result))
+        return 0
+
+    results = []
+    for count in (int(value) for value in args.counts.split(",")):
+        results.append(run_child(args, count))
+    report(results)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,174 @@
+"""Rejeu d'une année de nuits sur un coordinateur réel, en temps virtuel.
+
+Une instance SmartHRT est configurée dans un cœur Home Assistant réel (voir
+_harness.py) avec une horloge avancée à la main (tests/clock.py,
+ManualClock): le rejeu (tests/replay.py, ReplayEngine) fait sauter le temps d'un échantillon ou d'un
+déclencheur au suivant, et le coordinateur fait tourner sa propre machine à
+états.
+
+Une maison simulée (modèle RC du premier ordre, chauffage à puissance
+constante) réagit aux décisions de l'instance: chauffage maintenu à la
+consigne en journée, coupé à l'heure de coupure et relancé à l'heure
+calculée. La météo suit un cycle saisonnier et journalier avec du bruit
+reproductible; weather.get_forecasts renvoie le même modèle sans bruit.
+
+Usage:
+    python benchmarks/replay_year.py [--days N] [--step S] [--history FICHIER]
+
+Affiche la durée du rejeu, le nombre de cycles, les coefficients appris et
+l'écart moyen à la consigne à l'heure cible. Avec --history, l'historique
+des cycles de l'instance (CycleHistory) est copié dans FICHIER.
+"""
+
+import argparse
+import asyncio
+import logging
+import math
+import random
+import shutil
+import sys
+import time
+from datetime import datetime, timedelta
+from typing import Any
+
+import _harness
+from homeassistant.core import ServiceCall, SupportsResponse
+from homeassistant.util import dt as dt_util
+
+from tests.clock import ManualClock
+from tests.replay import ReplayEngine, Sample
+
+# Maison simulée: constante de refroidissement et puissance de chauffe (h, °C)
+HOUSE_RCTH = 60.0
+HOUSE_RPTH = 25.0
+FORECAST_HOURS = 24
+
+
+def exterior_temperature(moment: datetime, rng: random.Random | None = None) -> float:
+    """Température extérieure: saison, cycle journalier et bruit."""
+    day = moment.timetuple().tm_yday
+    seasonal = 8 - 7 * math.cos(2 * math.pi * (day - 15) / 365)
+    daily = -3 * math.cos(2 * math.pi * (moment.hour + moment.minute / 60 - 4) / 24)
+    return seasonal + daily + (rng.gauss(0, 0.3) if rng is not None else 0.0)
+
+
+def hourly_forecast(start: datetime, wind: float) -> list[dict[str, Any]]:
+    """Prévisions horaires depuis start: le modèle météo sans bruit."""
+    hours = (start + timedelta(hours=hour) for hour in range(FORECAST_HOURS))
+    return [
+        {
+            "datetime": moment.isoformat(),
+            "temperature": round(exterior_temperature(moment), 1),
+            "wind_speed": round(wind * 3.6, 1),  # km/h
+        }
+        for moment in hours
+    ]
+
+
+async def run(days: int, step: int, history_path: str | None) -> int:
+    hass = await _harness.async_start_hass()
+    try:
+        const = _harness.integration_module("const")
+        states = _harness.integration_module("coordinator").SmartHRTState
+
+        start = datetime(2025, 1, 1, 12, tzinfo=dt_util.get_default_time_zone())
+        clock = ManualClock(hass, start)
+        hass.data.setdefault(_harness.DOMAIN, {})[const.DATA_CLOCK] = clock
+        rng = random.Random(42)
+        wind = 3.0  # m/s
+
+        async def get_forecasts(call: ServiceCall) -> dict[str, Any]:
+            hour = clock.now().replace(minute=0, second=0, microsecond=0)
+            return {
+                entity_id: {"forecast": hourly_forecast(hour, wind)}
+                for entity_id in call.data.get("entity_id", [_harness.WEATHER_ENTITY])
+            }
+
+        hass.services.async_register(
+            "weather",
+            "get_forecasts",
+            get_forecasts,
+            supports_response=SupportsResponse.ONLY,
+        )
+        _harness.set_weather(
+            hass, temperature=exterior_temperature(start), wind_speed=wind * 3.6
+        )
+        (entry,) = await _harness.async_add_entries(hass, 1)
+        coordinator = _harness.coordinator(hass, entry)
+        tsp = coordinator.data.tsp
+        engine = ReplayEngine(hass, entry, clock)
+
+        interior = tsp
+        moment = clock.now()
+        end = start + timedelta(days=days)
+        dt_hours = step / 3600
+        began = time.perf_counter()
+        while moment < end:
+            text = exterior_temperature(moment, rng)
+            if rng.random() < 0.02:
+                wind = max(0.0, wind + rng.gauss(0, 2))
+            await engine.async_feed(
+                Sample(moment, round(interior, 2), round(text, 1), round(wind, 1))
+            )
+
+            state = coordinator.data.current_state
+            heating = state in (states.HEATING_ON, states.HEATING_PROCESS)
+            if state == states.HEATING_ON and interior >= tsp:
+                # Thermostat de journée: maintien à la consigne
+                interior = tsp
+            else:
+                asymptote = text + (HOUSE_RPTH if heating else 0.0)
+                interior = asymptote + (interior - asymptote) * math.exp(
+                    -dt_hours / HOUSE_RCTH
+                )
+            moment += timedelta(seconds=step)
+        result = await engine.async_result()
+        elapsed = time.perf_counter() - began
+        engine.async_close()
+
+        data = coordinator.data
+        recovery_engine = hass.data[_harness.DOMAIN][const.DATA_RECOVERY_ENGINE]
+        late = [
+            tsp - cycle.temp_recovery_end
+            for cycle in result.cycles
+            if cycle.temp_recovery_end < tsp
+        ]
+        print(f"{days} nuits, {result.samples} échantillons en {elapsed:.2f} s")
+        print(
+            f"cycles: {len(result.cycles)}, transitions: {len(result.transitions)}, "
+            f"déclencheurs: {result.triggers_fired}, "
+            f"calculs de relance: {recovery_engine.stats['evaluations']}"
+        )
+        print(
+            f"coefficients appris: rcth={data.rcth:.1f} "
+            f"(lw={data.rcth_lw:.1f}, hw={data.rcth_hw:.1f}), "
+            f"rpth={data.rpth:.1f} (lw={data.rpth_lw:.1f}, hw={data.rpth_hw:.1f})"
+        )
+        print(
+            f"consigne non atteinte à l'heure cible: {len(late)} nuits"
+            + (f", écart moyen {sum(late) / len(late):.2f} °C" if late else "")
+        )
+        if history_path:
+            await hass.async_add_executor_job(
+                shutil.copyfile, coordinator.cycle_history.path, history_path
+            )
+            print(f"historique: {len(result.cycles)} cycles copiés dans {history_path}")
+    finally:
+        await _harness.async_stop_hass(hass)
+    return 0
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--days", type=int, default=365)
+    parser.add_argument("--step", type=int, default=300, help="pas (s)")
+    parser.add_argument("--history", help="copie de l'historique des cycles")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.WARNING)
+    logging.getLogger("homeassistant.loader").setLevel(logging.ERROR)
+    return asyncio.run(run(args.days, args.step, args.history))
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -12,8 +12,21 @@ from homeassistant.core import HomeAssistant
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.helpers import entity_registry as er
 
-from .const import DOMAIN, PLATFORMS, DATA_COORDINATOR
+from .const import (
+    DOMAIN,
+    CONF_CONSOLIDATED_STORAGE,
+    DEFAULT_CONSOLIDATED_STORAGE,
+    CYCLE_HISTORY_SIZE,
+    PLATFORMS,
+    DATA_COORDINATOR,
+    DATA_DOMAIN_STORE,
+    DATA_FORECAST_CACHE,
+    DATA_RECOVERY_ENGINE,
+    DATA_TICK_SERVICE,
+)
 from .coordinator import SmartHRTCoordinator
+from .storage import async_get_domain_store, cycle_history_path
+from .thermal import CycleHistory
 from .services import async_setup_services, async_unload_services
 
 _LOGGER = logging.getLogger(__name__)
@@ -148,15 +161,54 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     # Désenregistrer les services si c'est la dernière instance
     await async_unload_services(hass)
 
+    # Libérer les services partagés (moteur de calcul, cache des prévisions)
+    # si c'est la dernière instance
+    if not any(
+        isinstance(data, dict) and DATA_COORDINATOR in data
+        for data in hass.data[DOMAIN].values()
+    ):
+        for key in (DATA_RECOVERY_ENGINE, DATA_FORECAST_CACHE, DATA_TICK_SERVICE):
+            if shared := hass.data[DOMAIN].pop(key, None):
+                shared.async_shutdown()
+        # Écrire le stockage consolidé avant de le libérer
+        if domain_store := hass.data[DOMAIN].pop(DATA_DOMAIN_STORE, None):
+            await domain_store.async_shutdown()
+
     return result
 
 
+async def async_remove_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Suppression d'une configEntry: retire ses données apprises.
+
+    L'historique des cycles de l'instance est supprimé et, avec l'option de
+    stockage consolidé, sa section est retirée du document commun.
+    """
+    await hass.async_add_executor_job(
+        CycleHistory(
+            cycle_history_path(hass, entry.entry_id), CYCLE_HISTORY_SIZE
+        ).remove
+    )
+    if not entry.options.get(CONF_CONSOLIDATED_STORAGE, DEFAULT_CONSOLIDATED_STORAGE):
+        return
+    domain_store = async_get_domain_store(hass)
+    await domain_store.async_remove_entry(entry.entry_id)
+    # Aucune autre instance chargée: écrire maintenant et libérer
+    if not any(
+        isinstance(data, dict) and DATA_COORDINATOR in data
+        for data in hass.data[DOMAIN].values()
+    ):
+        hass.data[DOMAIN].pop(DATA_DOMAIN_STORE, None)
+        await domain_store.async_shutdown()
+
+
 async def update_listener(hass: HomeAssistant, entry: ConfigEntry) -> None:
     """Applique les changements d'options sans recharger l'intégration.
 
     Les options dynamiques (target_hour, recoverycalc_hour, tsp) peuvent
     être appliquées à chaud via le coordinateur, évitant un rechargement
-    complet qui réinitialiserait l'état de la machine à états.
+    complet qui réinitialiserait l'état de la machine à états. Seul un
+    changement de l'option de stockage consolidé recharge l'entrée: les
+    données apprises sont déplacées au chargement.
     """
     from .const import CONF_TARGET_HOUR, CONF_RECOVERYCALC_HOUR, CONF_TSP
 
@@ -168,6 +220,11 @@ async def update_listener(hass: HomeAssistant, entry: ConfigEntry) -> None:
     options = entry.options
     _LOGGER.debug("Applying options update: %s", options)
 
+    consolidated = options.get(CONF_CONSOLIDATED_STORAGE, DEFAULT_CONSOLIDATED_STORAGE)
+    if consolidated != coordinator.consolidated_storage:
+        await hass.config_entries.async_reload(entry.entry_id)
+        return
+
     # Appliquer les changements d'options au coordinateur
     if CONF_TSP in options:
         coordinator.set_tsp(options[CONF_TSP])
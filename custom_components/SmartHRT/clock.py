@@ -0,0 +1,124 @@
+"""Horloge et programmation injectables dans le coordinateur.
+
+Le coordinateur lit l'heure (now), programme ses déclencheurs horaires
+(async_track_point_in_time) et ses délais (async_call_later: regroupement
+des sauvegardes) via une horloge, comme les services partagés (ticks,
+fenêtre de regroupement des calculs, écriture du stockage consolidé, durée
+de vie des prévisions en cache):
+- RealClock: heure de Home Assistant, minuteurs de la boucle d'événements;
+- ScaledClock: temps virtuel qui s'écoule ``speed`` fois plus vite que
+  l'horloge murale, à partir d'un instant de départ. Un déclencheur prévu
+  dans une heure virtuelle s'exécute après 3600 / speed secondes réelles:
+  une instance de préproduction enchaîne une semaine de cycles en une heure
+  avec speed=168.
+
+Les tests et le rejeu utilisent une horloge avancée à la main
+(tests/clock.py, ManualClock), qui implémente le même protocole.
+
+L'horloge utilisée par toutes les instances est celle enregistrée dans
+hass.data[DOMAIN][DATA_CLOCK] au moment de leur création, à défaut l'heure
+réelle. Les services partagés (TickService, RecoveryBatchEngine,
+ForecastCache, DomainStore) prennent celle enregistrée à leur création.
+"""
+
+from collections.abc import Callable
+from datetime import datetime, timedelta
+from typing import Protocol
+
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.helpers.event import async_track_point_in_time
+from homeassistant.util import dt as dt_util
+
+from .const import DATA_CLOCK, DOMAIN
+
+ClockAction = Callable[[datetime], None]
+DelayAction = Callable[[], None]
+
+
+class Clock(Protocol):
+    """Source de l'heure et programmation des déclencheurs."""
+
+    def now(self) -> datetime:
+        """Heure courante (avec fuseau horaire local)."""
+
+    def async_track_point_in_time(
+        self, action: ClockAction, when: datetime
+    ) -> CALLBACK_TYPE:
+        """Programme action(now) à l'instant when; retourne l'annulation."""
+
+    def async_call_later(self, delay: float, action: DelayAction) -> CALLBACK_TYPE:
+        """Programme action() dans delay secondes; retourne l'annulation."""
+
+
+class RealClock:
+    """Heure réelle de Home Assistant."""
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        self._hass = hass
+
+    def now(self) -> datetime:
+        return dt_util.now()
+
+    @callback
+    def async_track_point_in_time(
+        self, action: ClockAction, when: datetime
+    ) -> CALLBACK_TYPE:
+        return async_track_point_in_time(self._hass, action, when)
+
+    @callback
+    def async_call_later(self, delay: float, action: DelayAction) -> CALLBACK_TYPE:
+        return self._hass.loop.call_later(delay, action).cancel
+
+
+class ScaledClock:
+    """Temps virtuel accéléré d'un facteur ``speed`` (préproduction, essais)."""
+
+    def __init__(
+        self, hass: HomeAssistant, speed: float, start: datetime | None = None
+    ) -> None:
+        if speed <= 0:
+            raise ValueError("speed must be positive")
+        self._hass = hass
+        self._speed = speed
+        self._start = start if start is not None else dt_util.now()
+        # Instant de la boucle d'événements correspondant à start
+        self._loop_start = hass.loop.time()
+
+        # Statistiques (diagnostic)
+        self.scheduled = 0
+        self.fired = 0
+
+    @property
+    def speed(self) -> float:
+        return self._speed
+
+    def now(self) -> datetime:
+        elapsed = (self._hass.loop.time() - self._loop_start) * self._speed
+        return dt_util.as_local(self._start + timedelta(seconds=elapsed))
+
+    @callback
+    def async_track_point_in_time(
+        self, action: ClockAction, when: datetime
+    ) -> CALLBACK_TYPE:
+        delay = max((when - self.now()).total_seconds(), 0.0) / self._speed
+
+        @callback
+        def _fire() -> None:
+            self.fired += 1
+            action(self.now())
+
+        handle = self._hass.loop.call_later(delay, _fire)
+        self.scheduled += 1
+        return handle.cancel
+
+    @callback
+    def async_call_later(self, delay: float, action: DelayAction) -> CALLBACK_TYPE:
+        return self._hass.loop.call_later(delay / self._speed, action).cancel
+
+
+@callback
+def async_get_clock(hass: HomeAssistant) -> Clock:
+    """Retourne l'horloge enregistrée pour le domaine, à défaut l'heure réelle."""
+    if (clock := hass.data.get(DOMAIN, {}).get(DATA_CLOCK)) is not None:
+        return clock
+    return RealClock(hass)
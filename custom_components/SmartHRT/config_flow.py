@@ -27,6 +27,8 @@ from .const import (
     CONF_SENSOR_INTERIOR_TEMP,
     CONF_WEATHER_ENTITY,
     CONF_TSP,
+    CONF_CONSOLIDATED_STORAGE,
+    DEFAULT_CONSOLIDATED_STORAGE,
     DEFAULT_TSP,
     DEFAULT_TSP_MIN,
     DEFAULT_TSP_MAX,
@@ -184,6 +186,8 @@ STATIC_KEYS = {
 }
 # Clés stockées dans 'options' (réglages dynamiques - modifiables sans rechargement)
 DYNAMIC_KEYS = {CONF_TARGET_HOUR, CONF_RECOVERYCALC_HOUR, CONF_TSP}
+# Clés stockées dans 'options' appliquées par rechargement de l'entrée
+RELOAD_KEYS = {CONF_CONSOLIDATED_STORAGE}
 
 
 class SmartHRTOptionsFlow(OptionsFlow):
@@ -234,6 +238,10 @@ class SmartHRTOptionsFlow(OptionsFlow):
                         mode=selector.NumberSelectorMode.BOX,
                     ),
                 ),
+                # Données apprises dans le document commun aux instances
+                vol.Required(
+                    CONF_CONSOLIDATED_STORAGE, default=DEFAULT_CONSOLIDATED_STORAGE
+                ): selector.BooleanSelector(),
             }
         )
 
@@ -264,7 +272,7 @@ class SmartHRTOptionsFlow(OptionsFlow):
 
         Sépare les données en:
         - data: configuration statique (capteurs, nom, météo)
-        - options: réglages dynamiques (heures, consigne)
+        - options: réglages dynamiques (heures, consigne) et stockage consolidé
 
         Les données statiques nécessitent un rechargement de l'intégration.
         Les options dynamiques peuvent être appliquées sans rechargement.
@@ -279,7 +287,7 @@ class SmartHRTOptionsFlow(OptionsFlow):
         # Extraire les options dynamiques
         new_options = {
             key: self._user_inputs[key]
-            for key in DYNAMIC_KEYS
+            for key in DYNAMIC_KEYS | RELOAD_KEYS
             if key in self._user_inputs
         }
 
@@ -23,6 +23,7 @@ CONF_RECOVERYCALC_HOUR = "recoverycalc_hour"
 CONF_SENSOR_INTERIOR_TEMP = "sensor_interior_temperature"
 CONF_WEATHER_ENTITY = "weather_entity"
 CONF_TSP = "tsp"
+CONF_CONSOLIDATED_STORAGE = "consolidated_storage"
 
 # Default values
 DEFAULT_TSP = 19.0
@@ -38,6 +39,12 @@ DEFAULT_RCTH_MAX = 19999.0
 DEFAULT_RPTH_MIN = 0.0
 DEFAULT_RPTH_MAX = 19999.0
 DEFAULT_RELAXATION_FACTOR = 2.0
+# Recovery start rescheduling hysteresis (min): the armed trigger is kept when
+# a recalculation moves it by less than the tolerance, or when it is due within
+# the freeze horizon (adjustable with number entities)
+DEFAULT_RECOVERY_START_TOLERANCE = 2.0
+DEFAULT_RECOVERY_START_FREEZE = 10.0
+RECOVERY_START_HYSTERESIS_MAX = 120.0
 
 # ADR-007: Compensation météo - seuils de vent pour interpolation
 # WIND_LOW: vent faible (utilise rcth_lw), WIND_HIGH: vent fort (utilise rcth_hw)
@@ -50,6 +57,46 @@ DEVICE_MANUFACTURER = "SmartHRT"
 # Data keys for hass.data[DOMAIN][entry_id]
 DATA_COORDINATOR = "coordinator"
 
+# Data keys for hass.data[DOMAIN] (shared by all instances)
+DATA_RECOVERY_ENGINE = "recovery_engine"
+DATA_FORECAST_CACHE = "forecast_cache"
+DATA_TICK_SERVICE = "tick_service"
+DATA_DOMAIN_STORE = "domain_store"
+# Optional clock injected into new coordinators (default: real time)
+DATA_CLOCK = "clock"
+
+# Tick service: callbacks run per event-loop iteration within one tick
+TICK_CHUNK_SIZE = 50
+
+# Recovery batch engine: window collecting simultaneous recalculations (s)
+RECOVERY_BATCH_WINDOW = 0.05
+
+# Compute dispatcher: max estimated cost run inline on the event loop (s)
+COMPUTE_INLINE_BUDGET = 0.001
+# Compute dispatcher: max weight of a not yet measured computation run inline
+# (heavier first runs, e.g. a batch of many instances, go to the executor)
+COMPUTE_UNMEASURED_MAX_WEIGHT = 16
+
+# Learned data write-behind: saves requested within this window are
+# coalesced into one write (s)
+SAVE_DELAY = 10
+
+# Consolidated storage (entry option): learned data of the opted-in instances
+# in one document, one section per entry (off: one storage file per entry)
+DEFAULT_CONSOLIDATED_STORAGE = False
+# Consolidated storage: window grouping the saves of all instances (s)
+DOMAIN_STORE_DELAY = 5
+
+# Cycle history: completed recovery cycles kept per instance (ring buffer)
+CYCLE_HISTORY_SIZE = 730
+
+# Forecast cache: age below which a fetched forecast is reused (s)
+FORECAST_CACHE_TTL = 900
+
+# Refresh of time-dependent values (time to recovery, 4h wind average) (s);
+# weather data itself is updated on state changes of the weather entity
+TIME_REFRESH_INTERVAL = 60
+
 # Service names
 SERVICE_CALCULATE_RECOVERY_TIME = "calculate_recovery_time"
 SERVICE_CALCULATE_RECOVERY_UPDATE_TIME = "calculate_recovery_update_time"
@@ -95,8 +142,30 @@ PERSISTED_FIELDS: list[tuple[str, str, object, str]] = [
     ("time_recovery_calc", "time_recovery_calc", None, "datetime"),
     ("temp_recovery_calc", "temp_recovery_calc", 17.0, "float"),
     ("text_recovery_calc", "text_recovery_calc", 0.0, "float"),
+    # Réglages
+    (
+        "recovery_start_tolerance",
+        "recovery_start_tolerance",
+        DEFAULT_RECOVERY_START_TOLERANCE,
+        "float",
+    ),
+    (
+        "recovery_start_freeze",
+        "recovery_start_freeze",
+        DEFAULT_RECOVERY_START_FREEZE,
+        "float",
+    ),
 ]
 
+# ADR-013: Historique du vent (fenêtre de 4h), persisté en binaire compact
+# (base64) hors PERSISTED_FIELDS. Un échantillon par changement de vent, au plus
+# un par WIND_HISTORY_RESOLUTION (un changement plus rapproché remplace la
+# valeur précédente): l'anneau couvre toujours les 4h, même par vent en rafales
+STORAGE_KEY_WIND_SPEED_HISTORY = "wind_speed_history"
+WIND_HISTORY_MAX_AGE = 4 * 3600  # secondes, échantillons plus anciens ignorés
+WIND_HISTORY_RESOLUTION = 60  # secondes
+WIND_HISTORY_SIZE = WIND_HISTORY_MAX_AGE // WIND_HISTORY_RESOLUTION + 1
+
 # Legacy storage keys (kept for backward compatibility imports)
 STORAGE_KEY_RCTH = "rcth"
 STORAGE_KEY_RPTH = "rpth"
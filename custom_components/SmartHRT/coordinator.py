@@ -10,25 +10,32 @@ ADR implémentées dans ce module:
 - ADR-008: Validation arrêt par détection lag (TEMP_DECREASE_THRESHOLD)
 - ADR-009: Persistance coefficients (PERSISTED_FIELDS, Store)
 - ADR-013: Historique vent pour calcul (wind_speed_history, wind_speed_avg)
-- ADR-014: Format des dates (dt_util.now(), dt_util.as_local())
+- ADR-014: Format des dates (horloge injectable, dt_util.as_local())
+
+Les calculs thermiques (solveur, estimateurs RCth/RPth, interpolation vent,
+relaxation) sont des fonctions pures de thermal.model: le coordinateur
+rassemble leurs entrées depuis son état et applique leurs résultats.
 """
 
+import asyncio
+import base64
+import binascii
 import logging
-import math
-from datetime import datetime, timedelta, time as dt_time
+from datetime import date, datetime, timedelta, time as dt_time
 from dataclasses import dataclass, field
-from typing import Callable
-from collections import deque
+from collections.abc import Iterable
+from typing import Any, Callable, NamedTuple
 
-from homeassistant.core import HomeAssistant, callback
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, State, callback
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.helpers.event import (
-    async_track_time_interval,
-    async_track_state_change_event,
-    async_track_point_in_time,
-)
+from homeassistant.helpers.event import async_track_state_change_event
+from homeassistant.helpers.json import json_bytes
 from homeassistant.helpers.storage import Store
-from homeassistant.const import STATE_UNAVAILABLE, STATE_UNKNOWN
+from homeassistant.const import (
+    EVENT_HOMEASSISTANT_STOP,
+    STATE_UNAVAILABLE,
+    STATE_UNKNOWN,
+)
 from homeassistant.util import dt as dt_util
 
 from .const import (
@@ -39,9 +46,13 @@ from .const import (
     CONF_SENSOR_INTERIOR_TEMP,
     CONF_WEATHER_ENTITY,
     CONF_TSP,
+    CONF_CONSOLIDATED_STORAGE,
+    DEFAULT_CONSOLIDATED_STORAGE,
     DEFAULT_TSP,
     DEFAULT_RCTH,
     DEFAULT_RPTH,
+    DEFAULT_RECOVERY_START_FREEZE,
+    DEFAULT_RECOVERY_START_TOLERANCE,
     DEFAULT_RELAXATION_FACTOR,
     WIND_HIGH,
     WIND_LOW,
@@ -49,8 +60,43 @@ from .const import (
     FORECAST_HOURS,
     TEMP_DECREASE_THRESHOLD,
     DEFAULT_RECOVERYCALC_HOUR,
+    CYCLE_HISTORY_SIZE,
     PERSISTED_FIELDS,
+    SAVE_DELAY,
+    STORAGE_KEY_WIND_SPEED_HISTORY,
+    TIME_REFRESH_INTERVAL,
+    WIND_HISTORY_MAX_AGE,
+    WIND_HISTORY_RESOLUTION,
+    WIND_HISTORY_SIZE,
+)
+from .clock import Clock, async_get_clock
+from .dispatcher import ComputeDispatcher
+from .forecast_cache import async_get_forecast_cache
+from .recovery_engine import async_get_recovery_engine
+from .storage import (
+    DomainStore,
+    StoreSection,
+    async_get_domain_store,
+    async_load_entry_store,
+    cycle_history_path,
 )
+from .tick import async_get_tick_service
+from .triggers import TriggerRegistry
+from .thermal import (
+    CycleHistory,
+    CycleRecord,
+    ForecastTimeline,
+    RecoverySolution,
+    RollingStats,
+    interpolate_coefficient,
+    rcth_at_recovery_start,
+    rcth_fast,
+    recovery_duration,
+    recovery_update_delay,
+    relax_coefficients,
+    rpth_at_recovery_end,
+)
+from .thermal.model import COEFFICIENT_MAX
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -71,9 +117,24 @@ class SmartHRTState:
     HEATING_PROCESS = "heating_process"  # État 5: Montée en température, calcul RPth
 
 
+# Pseudo-champ marqué par le rafraîchissement périodique: entités dont la
+# valeur dépend de l'heure courante (temps avant relance, dates du jour...)
+FIELD_CLOCK = "clock"
+
+# Types de déclencheurs horaires (un emplacement chacun, cf. TriggerRegistry)
+TRIGGER_RECOVERYCALC_HOUR = "recoverycalc_hour"
+TRIGGER_TARGET_HOUR = "target_hour"
+TRIGGER_RECOVERY_START = "recovery_start"
+TRIGGER_RECOVERY_UPDATE = "recovery_update"
+
+
 @dataclass
 class SmartHRTData:
-    """Données du système SmartHRT"""
+    """Données du système SmartHRT
+
+    Les champs modifiés depuis la dernière notification sont mémorisés
+    (pop_dirty): seules les entités qui en dépendent sont réécrites.
+    """
 
     # Configuration
     name: str = "SmartHRT"
@@ -103,6 +164,10 @@ class SmartHRTData:
     rpth_calculated: float = 0.0
     relaxation_factor: float = DEFAULT_RELAXATION_FACTOR
 
+    # Hystérésis du démarrage de relance (min)
+    recovery_start_tolerance: float = DEFAULT_RECOVERY_START_TOLERANCE
+    recovery_start_freeze: float = DEFAULT_RECOVERY_START_FREEZE
+
     # Températures actuelles
     interior_temp: float | None = None
     exterior_temp: float | None = None
@@ -134,34 +199,119 @@ class SmartHRTData:
 
     # ADR-013: Historique vent pour calcul de moyenne sur 4h
     # Permet de lisser les variations de vent pour un calcul plus stable
-    wind_speed_history: deque = field(
-        default_factory=lambda: deque(maxlen=240)
-    )  # 4h à 1 sample/min
+    wind_speed_history: RollingStats = field(
+        default_factory=lambda: RollingStats(
+            WIND_HISTORY_SIZE,
+            max_age=WIND_HISTORY_MAX_AGE,
+            resolution=WIND_HISTORY_RESOLUTION,
+        )
+    )  # 4h, un échantillon par changement de vent, persisté (ADR-013)
 
     # Erreurs du dernier cycle (pour diagnostic)
     last_rcth_error: float = 0.0
     last_rpth_error: float = 0.0
 
+    # Diagnostic du dernier calcul de relance (solveur de Newton)
+    recovery_solver_iterations: int = 0
+    recovery_solver_residual: float = 0.0
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        """Affecte un champ et le marque modifié si sa valeur change."""
+        attributes = self.__dict__
+        if name in attributes and attributes[name] != value:
+            attributes.setdefault("_dirty", set()).add(name)
+        object.__setattr__(self, name, value)
+
+    def mark_dirty(self, *names: str) -> None:
+        """Marque des champs modifiés sans affectation (ex: FIELD_CLOCK)."""
+        self.__dict__.setdefault("_dirty", set()).update(names)
+
+    def pop_dirty(self) -> set[str]:
+        """Retourne les champs modifiés depuis le dernier appel."""
+        return self.__dict__.pop("_dirty", set())
+
+
+class RecoveryInputs(NamedTuple):
+    """Entrées du calcul de relance d'une instance (ADR-005)."""
+
+    target_dt: datetime
+    tint: float
+    text: float
+    tsp: float
+    wind_kmh: float
+    rcth_lw: float
+    rcth_hw: float
+    rpth_lw: float
+    rpth_hw: float
+    time_remaining: float  # heures
+    max_duration: float  # heures
+    initial: float | None  # durée précédente (démarrage à chaud)
+
 
 class SmartHRTCoordinator:
     """Coordinateur central pour SmartHRT"""
 
     STORAGE_VERSION = 1
 
-    def __init__(self, hass: HomeAssistant, entry: ConfigEntry) -> None:
+    def __init__(
+        self, hass: HomeAssistant, entry: ConfigEntry, clock: Clock | None = None
+    ) -> None:
         self._hass = hass
         self._entry = entry
-        self._listeners: list[Callable[[], None]] = []
+        # Heure et déclencheurs: heure réelle, ou horloge injectée (temps
+        # accéléré en préproduction, cf. clock.py)
+        self._clock: Clock = clock if clock is not None else async_get_clock(hass)
+        # (listener, champs dont il dépend ou None pour tous)
+        self._listeners: list[tuple[Callable[[], None], frozenset[str] | None]] = []
+        self._notified_listeners = 0
+        self._skipped_listeners = 0
+        # Diffusion différée regroupant les notifications d'une itération
+        self._notify_handle: asyncio.Handle | None = None
+        self._notify_requests = 0
+        self._notify_flushes = 0
+        # Écritures d'état évitées par les entités (valeur dans la zone morte)
+        self.suppressed_writes = 0
         self._unsub_listeners: list = []
-        self._unsub_time_triggers: list = []
-        self._unsub_recovery_update: Callable | None = (
-            None  # Tracker pour recovery_update
-        )
+        # Déclencheurs horaires, un par type: reprogrammer remplace
+        self._triggers = TriggerRegistry(hass, self._clock)
+        # Reprogrammations du démarrage de relance effectuées et évitées
+        self._recovery_start_rearms = 0
+        self._recovery_start_within_tolerance = 0
+        self._recovery_start_frozen = 0
+        self._unsub_hass_stop: Callable | None = None
+        # Sauvegarde différée (write-behind) et métriques d'écriture
+        self._save_handle: CALLBACK_TYPE | None = None
+        self._last_saved: dict[str, Any] | None = None
+        self._save_requests = 0
+        self._save_writes = 0
+        self._save_skipped = 0
+        self._save_bytes = 0
+        self._save_day: date | None = None
+        self._writes_today = 0
+        self._bytes_today = 0
         # ADR-004 & ADR-009: Stratégie hybride de persistance
         # Les coefficients appris (RCth, RPth) et l'état survivent aux redémarrages
-        self._store: Store = Store(
-            hass, self.STORAGE_VERSION, f"{DOMAIN}.{entry.entry_id}"
+        # Option stockage consolidé: une section du document commun aux
+        # instances (migration automatique depuis le fichier de l'instance, et
+        # inversement quand l'option est désactivée)
+        self.consolidated_storage: bool = entry.options.get(
+            CONF_CONSOLIDATED_STORAGE, DEFAULT_CONSOLIDATED_STORAGE
+        )
+        self._domain_store: DomainStore | None = None
+        self._store: Store | StoreSection
+        if self.consolidated_storage:
+            self._domain_store = async_get_domain_store(hass)
+            self._store = self._domain_store.section(entry.entry_id)
+        else:
+            self._store = Store(
+                hass, self.STORAGE_VERSION, f"{DOMAIN}.{entry.entry_id}"
+            )
+        # Historique des cycles terminés (fichier circulaire, ajout seul)
+        self._cycle_history = CycleHistory(
+            cycle_history_path(hass, entry.entry_id), CYCLE_HISTORY_SIZE
         )
+        self._cycles_recorded = 0
+        self._cycle_history_errors = 0
 
         self.data = SmartHRTData(
             name=entry.data.get(CONF_NAME, "SmartHRT"),
@@ -176,6 +326,22 @@ class SmartHRTCoordinator:
         # ADR-002: Entité météo sélectionnée explicitement par l'utilisateur
         self._weather_entity_id = entry.data.get(CONF_WEATHER_ENTITY)
 
+        # Moteur de calcul de relance partagé par toutes les instances
+        self._recovery_engine = async_get_recovery_engine(hass)
+        # Prévisions partagées par les instances utilisant la même entité météo
+        self._forecast_cache = async_get_forecast_cache(hass)
+        # Horloge partagée: un minuteur par cadence pour toutes les instances
+        self._tick = async_get_tick_service(hass)
+        # Série horaire complète des prévisions (moyennes sur fenêtre)
+        self._temperature_timeline = ForecastTimeline(())
+        self._wind_timeline = ForecastTimeline(())
+        # Calculs courts exécutés sur la boucle, délégués au-delà du budget
+        self._compute = ComputeDispatcher(hass)
+
+    def now(self) -> datetime:
+        """Heure courante de l'horloge du coordinateur."""
+        return self._clock.now()
+
     @staticmethod
     def _parse_time(time_str: str) -> dt_time:
         """Parse une chaîne de temps en objet time"""
@@ -207,23 +373,19 @@ class SmartHRTCoordinator:
         self._setup_time_triggers()
         await self._update_weather_forecasts()
 
-        # Calcul initial de l'heure de relance
-        await self._hass.async_add_executor_job(self.calculate_recovery_time)
+        # Calcul initial de l'heure de relance (groupé avec les autres
+        # instances), suivi de la programmation du trigger de relance et de
+        # la première mise à jour (_on_recovery_time_calculated)
+        self.async_request_recovery_time()
 
-        # Programmer le trigger de relance si nécessaire
-        now = dt_util.now()
-        if self.data.recovery_start_hour and self.data.recovery_start_hour > now:
-            self._schedule_recovery_start(self.data.recovery_start_hour)
-
-        # Programmer la première mise à jour de recovery_update_hour
-        # Le trigger est toujours programmé pour maintenir la chaîne de mises à jour active
-        if self.data.smartheating_mode and self.data.recovery_start_hour:
-            update_time = await self._hass.async_add_executor_job(
-                self.calculate_recovery_update_time
+        # Nouvelles prévisions (poussées par l'entité météo ou récupérées par
+        # n'importe quelle instance), une fois le calcul initial effectué
+        if self._weather_entity_id:
+            self._unsub_listeners.append(
+                self._forecast_cache.async_subscribe(
+                    self._weather_entity_id, self._on_forecast_update
+                )
             )
-            if update_time:
-                self.data.recovery_update_hour = update_time
-                self._schedule_recovery_update(update_time)
 
     async def _restore_learned_data(self) -> None:
         """Restore learned coefficients and state from persistent storage.
@@ -238,7 +400,12 @@ class SmartHRTCoordinator:
         Uses PERSISTED_FIELDS mapping for automatic serialization,
         reducing maintenance burden when adding new fields.
         """
-        stored_data = await self._store.async_load()
+        if self._domain_store is not None:
+            stored_data = await self._store.async_load()
+        else:
+            stored_data = await async_load_entry_store(
+                self._hass, self._store, self._entry.entry_id
+            )
         if stored_data:
             _LOGGER.info("Restoring learned data and state from storage")
 
@@ -260,6 +427,10 @@ class SmartHRTCoordinator:
                     # Direct assignment for float, bool, str
                     setattr(self.data, attr_name, stored_value)
 
+            self._restore_wind_speed_history(
+                stored_data.get(STORAGE_KEY_WIND_SPEED_HISTORY)
+            )
+
             _LOGGER.debug(
                 "Restored: state=%s, rcth=%.2f, rpth=%.2f, recovery_calc_mode=%s",
                 self.data.current_state,
@@ -270,15 +441,51 @@ class SmartHRTCoordinator:
         else:
             _LOGGER.debug("No stored learned data found, using defaults")
 
+    @callback
+    def _schedule_save(self) -> None:
+        """Demande la sauvegarde différée des données apprises (write-behind).
+
+        Les demandes reçues pendant SAVE_DELAY sont regroupées en une seule
+        écriture. Appelé après chaque transition et cycle d'apprentissage.
+        """
+        self._save_requests += 1
+        if self._save_handle is None:
+            self._save_handle = self._clock.async_call_later(
+                SAVE_DELAY, self._flush_save
+            )
+
+    @callback
+    def _flush_save(self) -> None:
+        """Fin de la fenêtre de regroupement: écrit les données."""
+        self._save_handle = None
+        self._hass.async_create_task(self._save_learned_data())
+
     async def _save_learned_data(self) -> None:
         """Save learned coefficients and state to persistent storage.
 
-        Called after each state transition and learning cycle to persist
-        the updated coefficients and state.
+        Writes immediately (end of the write-behind window, unload, Home
+        Assistant shutdown, reset) and cancels any pending delayed save.
+        Nothing is written if the data is unchanged since the last save.
 
         Uses PERSISTED_FIELDS mapping for automatic serialization,
         reducing maintenance burden when adding new fields.
         """
+        if self._save_handle is not None:
+            self._save_handle()
+            self._save_handle = None
+
+        data_to_store = self._learned_data_payload()
+        if data_to_store == self._last_saved:
+            self._save_skipped += 1
+            return
+
+        await self._store.async_save(data_to_store)
+        self._last_saved = data_to_store
+        self._record_save(len(json_bytes(data_to_store)))
+        _LOGGER.debug("Saved learned data and state to storage")
+
+    def _learned_data_payload(self) -> dict[str, Any]:
+        """Données persistées (PERSISTED_FIELDS et historique du vent)."""
         data_to_store = {}
 
         for storage_key, attr_name, _default_value, field_type in PERSISTED_FIELDS:
@@ -291,8 +498,69 @@ class SmartHRTCoordinator:
                 # Direct storage for float, bool, str
                 data_to_store[storage_key] = value
 
-        await self._store.async_save(data_to_store)
-        _LOGGER.debug("Saved learned data and state to storage")
+        data_to_store[STORAGE_KEY_WIND_SPEED_HISTORY] = base64.b64encode(
+            self.data.wind_speed_history.to_bytes()
+        ).decode("ascii")
+        return data_to_store
+
+    def _record_save(self, size: int) -> None:
+        """Comptabilise une écriture (totaux et compteurs du jour)."""
+        today = self._clock.now().date()
+        if today != self._save_day:
+            self._save_day = today
+            self._writes_today = 0
+            self._bytes_today = 0
+        self._writes_today += 1
+        self._bytes_today += size
+        self._save_writes += 1
+        self._save_bytes += size
+
+    @property
+    def persistence_stats(self) -> dict[str, Any]:
+        """Écritures du stockage: demandes, écritures, octets (diagnostic)."""
+        return {
+            "requests": self._save_requests,
+            "writes": self._save_writes,
+            "skipped_unchanged": self._save_skipped,
+            "bytes": self._save_bytes,
+            "writes_today": self._writes_today,
+            "bytes_today": self._bytes_today,
+            "pending": self._save_handle is not None,
+            "domain_store": (
+                self._domain_store.stats if self._domain_store is not None else None
+            ),
+            "cycles_recorded": self._cycles_recorded,
+            "cycle_history_errors": self._cycle_history_errors,
+        }
+
+    def _restore_wind_speed_history(self, encoded: str | None) -> None:
+        """Restaure l'historique du vent (ADR-013).
+
+        Les échantillons de plus de WIND_HISTORY_MAX_AGE sont écartés: après
+        un redémarrage, la moyenne sur 4h repart des mesures encore valides
+        au lieu de repartir de zéro.
+        """
+        if not encoded:
+            return
+        not_before = self._clock.now().timestamp() - WIND_HISTORY_MAX_AGE
+        try:
+            restored = self.data.wind_speed_history.load_bytes(
+                base64.b64decode(encoded, validate=True), not_before
+            )
+        except (ValueError, TypeError, binascii.Error) as err:
+            _LOGGER.warning("Ignoring invalid stored wind history: %s", err)
+            self.data.wind_speed_history.clear()
+            return
+        self._update_wind_speed_average()
+        _LOGGER.debug("Restored %d wind speed samples", restored)
+
+    async def _async_on_hass_stop(self, _event) -> None:
+        """Sauvegarde à l'arrêt de Home Assistant.
+
+        Écrit une éventuelle sauvegarde différée et l'historique du vent récent.
+        """
+        self._unsub_hass_stop = None
+        await self._save_learned_data()
 
     def _setup_listeners(self) -> None:
         """Configure les listeners pour les capteurs"""
@@ -305,24 +573,41 @@ class SmartHRTCoordinator:
                 )
             )
 
+        # Données météo: mises à jour aux changements d'état de l'entité
+        if self._weather_entity_id:
+            self._unsub_listeners.append(
+                async_track_state_change_event(
+                    self._hass,
+                    [self._weather_entity_id],
+                    self._on_weather_state_change,
+                )
+            )
+
+        # Valeurs dépendant de l'heure courante (horloge partagée)
         self._unsub_listeners.append(
-            async_track_time_interval(
-                self._hass, self._periodic_update, timedelta(minutes=1)
+            self._tick.async_register(
+                timedelta(seconds=TIME_REFRESH_INTERVAL), self._periodic_update
             )
         )
 
-        # Update weather forecasts every hour
+        # Update weather forecasts every hour (secours si l'entité météo ne
+        # pousse pas ses prévisions, cf. ForecastCache)
         self._unsub_listeners.append(
-            async_track_time_interval(
-                self._hass, self._hourly_forecast_update, timedelta(hours=1)
+            self._tick.async_register(
+                timedelta(hours=1), self._hourly_forecast_update
             )
         )
 
+        # Sauvegarde à l'arrêt (l'historique du vent évolue entre deux cycles)
+        self._unsub_hass_stop = self._hass.bus.async_listen_once(
+            EVENT_HOMEASSISTANT_STOP, self._async_on_hass_stop
+        )
+
     def _setup_time_triggers(self) -> None:
         """Configure les déclencheurs horaires selon le YAML"""
         self._cancel_time_triggers()
 
-        now = dt_util.now()
+        now = self._clock.now()
 
         # Trigger pour recoverycalc_hour (arrêt chauffage le soir)
         recoverycalc_dt = now.replace(
@@ -334,10 +619,8 @@ class SmartHRTCoordinator:
         if recoverycalc_dt <= now:
             recoverycalc_dt += timedelta(days=1)
 
-        self._unsub_time_triggers.append(
-            async_track_point_in_time(
-                self._hass, self._on_recoverycalc_hour, recoverycalc_dt
-            )
+        self._triggers.async_schedule(
+            TRIGGER_RECOVERYCALC_HOUR, self._on_recoverycalc_hour, recoverycalc_dt
         )
 
         # Trigger pour target_hour (fin de relance / réveil)
@@ -350,8 +633,8 @@ class SmartHRTCoordinator:
         if target_dt <= now:
             target_dt += timedelta(days=1)
 
-        self._unsub_time_triggers.append(
-            async_track_point_in_time(self._hass, self._on_target_hour, target_dt)
+        self._triggers.async_schedule(
+            TRIGGER_TARGET_HOUR, self._on_target_hour, target_dt
         )
 
         # Trigger pour recovery_start_hour (démarrage relance)
@@ -360,13 +643,7 @@ class SmartHRTCoordinator:
             if recovery_start.tzinfo is None:
                 recovery_start = dt_util.as_local(recovery_start)
             if recovery_start > now:
-                self._unsub_time_triggers.append(
-                    async_track_point_in_time(
-                        self._hass,
-                        self._on_recovery_start_hour,
-                        recovery_start,
-                    )
-                )
+                self._schedule_recovery_start(recovery_start)
 
         # Trigger pour recovery_update_hour (mise à jour calcul)
         if self.data.recovery_update_hour:
@@ -374,30 +651,26 @@ class SmartHRTCoordinator:
             if recovery_update.tzinfo is None:
                 recovery_update = dt_util.as_local(recovery_update)
             if recovery_update > now:
-                self._unsub_time_triggers.append(
-                    async_track_point_in_time(
-                        self._hass,
-                        self._on_recovery_update_hour,
-                        recovery_update,
-                    )
-                )
+                self._schedule_recovery_update(recovery_update)
 
     def _cancel_time_triggers(self) -> None:
         """Annule les déclencheurs horaires"""
-        for unsub in self._unsub_time_triggers:
-            unsub()
-        self._unsub_time_triggers.clear()
+        self._triggers.async_cancel_all()
 
     async def async_unload(self) -> None:
         """Déchargement du coordinateur"""
         self._cancel_time_triggers()
-        # Annuler le trigger de recovery_update
-        if self._unsub_recovery_update:
-            self._unsub_recovery_update()
-            self._unsub_recovery_update = None
+        if self._notify_handle is not None:
+            self._notify_handle.cancel()
+            self._notify_handle = None
+        await self._save_learned_data()
         for unsub in self._unsub_listeners:
             unsub()
         self._unsub_listeners.clear()
+        if self._unsub_hass_stop:
+            self._unsub_hass_stop()
+            self._unsub_hass_stop = None
+        self._recovery_engine.async_cancel(self)
 
     # ─────────────────────────────────────────────────────────────────────────
     # État initial et callbacks
@@ -433,15 +706,32 @@ class SmartHRTCoordinator:
 
         self._notify_listeners()
 
+    @callback
+    def _on_weather_state_change(self, event) -> None:
+        """Callback lors d'un changement d'état de l'entité météo.
+
+        Les entités ne sont notifiées que si température, vent ou
+        température ressentie ont changé.
+        """
+        new_state = event.data.get("new_state")
+        if not new_state or new_state.state in (STATE_UNAVAILABLE, STATE_UNKNOWN):
+            return
+        if self._update_weather_data(new_state):
+            self._update_wind_speed_average()
+            self._notify_listeners()
+
     @callback
     def _periodic_update(self, _now) -> None:
-        """Mise à jour périodique (chaque minute)
+        """Mise à jour périodique des valeurs dépendant du temps
 
-        Note: Les calculs de recovery_time sont gérés par recovery_update_hour
-        selon une fréquence dynamique (fidèle au YAML original).
+        Temps avant relance et moyenne du vent sur 4h (glissante dans le
+        temps). Les données météo suivent les changements d'état de l'entité
+        (_on_weather_state_change); les calculs de recovery_time sont gérés
+        par recovery_update_hour selon une fréquence dynamique (fidèle au
+        YAML original).
         """
-        self._update_weather_data()
         self._update_wind_speed_average()
+        self.data.mark_dirty(FIELD_CLOCK)
         self._notify_listeners()
 
     @callback
@@ -481,7 +771,7 @@ class SmartHRTCoordinator:
             _LOGGER.info("SmartHRT: Initialisation des constantes à 50")
 
         # Enregistre les valeurs courantes
-        self.data.time_recovery_calc = dt_util.now()
+        self.data.time_recovery_calc = self._clock.now()
         self.data.temp_recovery_calc = self.data.interior_temp or 17.0
         self.data.text_recovery_calc = self.data.exterior_temp or 0.0
 
@@ -490,34 +780,14 @@ class SmartHRTCoordinator:
         self.data.temp_lag_detection_active = True
         _LOGGER.debug("SmartHRT: Transition vers état DETECTING_LAG")
 
-        # Sauvegarder l'heure de relance avant calcul
-        prev_recovery_start = self.data.recovery_start_hour
-
-        # Exécuter les calculs lourds dans un exécuteur
-        await self._hass.async_add_executor_job(self.calculate_recovery_time)
-
-        # Programmer le trigger de relance si nécessaire (depuis le thread principal)
-        now = dt_util.now()
-        if (
-            self.data.recovery_start_hour
-            and prev_recovery_start != self.data.recovery_start_hour
-            and self.data.recovery_start_hour > now
-        ):
-            self._schedule_recovery_start(self.data.recovery_start_hour)
-
-        # Toujours programmer la mise à jour de recovery_update_hour
-        # pour maintenir la chaîne de mises à jour active
-        update_time = await self._hass.async_add_executor_job(
-            self.calculate_recovery_update_time
-        )
-        if update_time:
-            self.data.recovery_update_hour = update_time
-            self._schedule_recovery_update(update_time)
+        # Calcul groupé avec les autres instances; le trigger de relance et
+        # la mise à jour de recovery_update_hour suivent le calcul
+        self.async_request_recovery_time()
 
         self._reschedule_recoverycalc_hour()
 
         # Sauvegarder l'état après la transition
-        await self._save_learned_data()
+        self._schedule_save()
 
         self._notify_listeners()
 
@@ -559,27 +829,36 @@ class SmartHRTCoordinator:
 
     async def _async_on_recovery_update_hour(self) -> None:
         """Exécute les calculs lourds de mise à jour dans un exécuteur"""
-        # Sauvegarder l'heure de relance avant calcul
-        prev_recovery_start = self.data.recovery_start_hour
-
-        # N'exécuter les calculs que si recovery_calc_mode est actif
+        # N'exécuter les calculs que si recovery_calc_mode est actif: le
+        # trigger de relance (avec hystérésis) et le prochain trigger de mise
+        # à jour sont reprogrammés à la suite du calcul
         if self.data.recovery_calc_mode:
-            await self._hass.async_add_executor_job(self.calculate_rcth_fast)
-            await self._hass.async_add_executor_job(self.calculate_recovery_time)
-
-            # Programmer le trigger de relance si nécessaire (depuis le thread principal)
-            now = dt_util.now()
-            if (
-                self.data.recovery_start_hour
-                and prev_recovery_start != self.data.recovery_start_hour
-                and self.data.recovery_start_hour > now
-            ):
-                self._schedule_recovery_start(self.data.recovery_start_hour)
+            await self._compute.async_run("rcth_fast", self.calculate_rcth_fast)
+            self.async_request_recovery_time()
+            return
 
         # Toujours reprogrammer le prochain trigger de mise à jour
         # pour maintenir la chaîne active même si recovery_calc_mode est off
-        update_time = await self._hass.async_add_executor_job(
-            self.calculate_recovery_update_time
+        await self._async_schedule_recovery_update()
+
+    @callback
+    def _on_recovery_time_calculated(self) -> None:
+        """Suite d'un recalcul de l'heure de relance par le moteur partagé.
+
+        Reprogramme le trigger de relance (avec hystérésis) puis, en mode
+        chauffage intelligent, la prochaine mise à jour de recovery_update_hour:
+        le trigger est toujours programmé pour maintenir la chaîne active.
+        """
+        self._update_recovery_start_trigger()
+        if self.data.smartheating_mode:
+            self._hass.async_create_task(self._async_schedule_recovery_update())
+        else:
+            self._notify_listeners()
+
+    async def _async_schedule_recovery_update(self) -> None:
+        """Calcule et programme la prochaine mise à jour du calcul de relance."""
+        update_time = await self._compute.async_run(
+            "recovery_update_time", self.calculate_recovery_update_time
         )
 
         if update_time:
@@ -591,7 +870,7 @@ class SmartHRTCoordinator:
 
     def _reschedule_recoverycalc_hour(self) -> None:
         """Reprogramme le déclencheur recoverycalc_hour pour le lendemain"""
-        now = dt_util.now()
+        now = self._clock.now()
         next_trigger = now.replace(
             hour=self.data.recoverycalc_hour.hour,
             minute=self.data.recoverycalc_hour.minute,
@@ -599,15 +878,13 @@ class SmartHRTCoordinator:
             microsecond=0,
         ) + timedelta(days=1)
 
-        self._unsub_time_triggers.append(
-            async_track_point_in_time(
-                self._hass, self._on_recoverycalc_hour, next_trigger
-            )
+        self._triggers.async_schedule(
+            TRIGGER_RECOVERYCALC_HOUR, self._on_recoverycalc_hour, next_trigger
         )
 
     def _reschedule_target_hour(self) -> None:
         """Reprogramme le déclencheur target_hour pour le lendemain"""
-        now = dt_util.now()
+        now = self._clock.now()
         next_trigger = now.replace(
             hour=self.data.target_hour.hour,
             minute=self.data.target_hour.minute,
@@ -615,130 +892,248 @@ class SmartHRTCoordinator:
             microsecond=0,
         ) + timedelta(days=1)
 
-        self._unsub_time_triggers.append(
-            async_track_point_in_time(self._hass, self._on_target_hour, next_trigger)
+        self._triggers.async_schedule(
+            TRIGGER_TARGET_HOUR, self._on_target_hour, next_trigger
         )
 
     def _schedule_recovery_start(self, trigger_time: datetime) -> None:
-        """Programme le déclencheur de démarrage de relance"""
-        self._unsub_time_triggers.append(
-            async_track_point_in_time(
-                self._hass, self._on_recovery_start_hour, trigger_time
-            )
+        """Programme le déclencheur de démarrage de relance (remplace l'ancien)"""
+        self._triggers.async_schedule(
+            TRIGGER_RECOVERY_START, self._on_recovery_start_hour, trigger_time
         )
 
     @callback
-    def _schedule_recovery_update(self, trigger_time: datetime) -> None:
-        """Programme le déclencheur de mise à jour du calcul"""
-        # Annuler le trigger précédent s'il existe
-        if self._unsub_recovery_update:
-            self._unsub_recovery_update()
-            self._unsub_recovery_update = None
+    def _update_recovery_start_trigger(self) -> None:
+        """Reprogramme le démarrage de relance après un recalcul, avec hystérésis.
+
+        Le déclencheur armé est conservé si la nouvelle heure en diffère de
+        moins de recovery_start_tolerance, ou si son échéance est à moins de
+        recovery_start_freeze (minutes, entités number). L'heure publiée (recovery_start_hour) reste
+        alors celle du déclencheur: le sensor timestamp ne varie pas.
+        """
+        new_start = self.data.recovery_start_hour
+        if new_start is None:
+            return
+        now = self._clock.now()
+        armed = self._triggers.scheduled_time(TRIGGER_RECOVERY_START)
+
+        if armed is not None and armed > now and new_start != armed:
+            freeze = timedelta(minutes=self.data.recovery_start_freeze)
+            tolerance = timedelta(minutes=self.data.recovery_start_tolerance)
+            if armed - now <= freeze:
+                self._recovery_start_frozen += 1
+                self.data.recovery_start_hour = armed
+                return
+            if abs(new_start - armed) < tolerance:
+                self._recovery_start_within_tolerance += 1
+                self.data.recovery_start_hour = armed
+                return
+
+        if new_start > now and new_start != armed:
+            self._recovery_start_rearms += 1
+            self._schedule_recovery_start(new_start)
+
+    @property
+    def recovery_start_stats(self) -> dict[str, Any]:
+        """Ré-armements du démarrage de relance effectués et évités."""
+        return {
+            "rearms": self._recovery_start_rearms,
+            "avoided_within_tolerance": self._recovery_start_within_tolerance,
+            "avoided_frozen": self._recovery_start_frozen,
+            "tolerance_s": self.data.recovery_start_tolerance * 60,
+            "freeze_s": self.data.recovery_start_freeze * 60,
+        }
 
+    @callback
+    def _schedule_recovery_update(self, trigger_time: datetime) -> None:
+        """Programme le déclencheur de mise à jour du calcul (remplace l'ancien)"""
         _LOGGER.debug("SmartHRT: Programmation prochaine mise à jour: %s", trigger_time)
-        self._unsub_recovery_update = async_track_point_in_time(
-            self._hass, self._on_recovery_update_hour, trigger_time
+        self._triggers.async_schedule(
+            TRIGGER_RECOVERY_UPDATE, self._on_recovery_update_hour, trigger_time
         )
 
     # ─────────────────────────────────────────────────────────────────────────
     # Données météo
     # ─────────────────────────────────────────────────────────────────────────
 
-    def _update_weather_data(self) -> None:
+    def _update_weather_data(self, weather: State | None = None) -> bool:
         """Mise à jour des données météo actuelles.
 
         ADR-002: Utilise l'entité météo configurée explicitement par l'utilisateur
         au lieu de scanner automatiquement toutes les entités weather.
+
+        Lit l'état fourni (événement de changement d'état) ou, à défaut,
+        l'état courant de l'entité. Retourne True si température, vent ou
+        température ressentie ont changé.
         """
         if not self._weather_entity_id:
             _LOGGER.debug("No weather entity configured, skipping weather update")
-            return
+            return False
 
-        weather = self._hass.states.get(self._weather_entity_id)
+        if weather is None:
+            weather = self._hass.states.get(self._weather_entity_id)
         if weather is None:
             _LOGGER.warning("Weather entity %s not found", self._weather_entity_id)
-            return
+            return False
+
+        previous = (self.data.exterior_temp, self.data.wind_speed, self.data.windchill)
 
         if (temp := weather.attributes.get("temperature")) is not None:
             self.data.exterior_temp = float(temp)
 
         if (wind := weather.attributes.get("wind_speed")) is not None:
             self.data.wind_speed = float(wind) / 3.6  # km/h -> m/s
-            # Ajouter à l'historique pour la moyenne
-            self.data.wind_speed_history.append(self.data.wind_speed)
+            # Historique pour la moyenne pondérée par le temps: un échantillon
+            # par changement suffit, la valeur restant en vigueur jusque-là
+            # (au plus un par WIND_HISTORY_RESOLUTION, cf. RollingStats)
+            history = self.data.wind_speed_history
+            if history.last != self.data.wind_speed:
+                history.append(self.data.wind_speed, self._clock.now().timestamp())
 
         self._calculate_windchill()
+        return previous != (
+            self.data.exterior_temp,
+            self.data.wind_speed,
+            self.data.windchill,
+        )
 
     def _update_wind_speed_average(self) -> None:
-        """Calcule la moyenne de vitesse du vent sur 4h"""
-        if self.data.wind_speed_history:
-            self.data.wind_speed_avg = sum(self.data.wind_speed_history) / len(
-                self.data.wind_speed_history
-            )
+        """Calcule la moyenne de vitesse du vent sur 4h.
+
+        Moyenne pondérée par le temps, tenue à jour à chaque échantillon
+        (RollingStats): son coût ne dépend pas de la taille de l'historique.
+        """
+        average = self.data.wind_speed_history.time_weighted_mean(
+            self._clock.now().timestamp()
+        )
+        if average is not None:
+            self.data.wind_speed_avg = average
+
+    def _get_wind_average_kmh(self) -> float:
+        """Vent moyen sur 4h en km/h (ADR-013), pour l'apprentissage.
+
+        Moyenne pondérée par le temps de l'historique persisté, donc valable
+        juste après un redémarrage; à défaut d'historique, le vent courant.
+        """
+        if not self.data.wind_speed_history:
+            return self.data.wind_speed * 3.6
+        self._update_wind_speed_average()
+        return self.data.wind_speed_avg * 3.6
 
     async def _update_weather_forecasts(self) -> None:
         """Mise à jour des prévisions météo (température et vent).
 
         ADR-002: Utilise l'entité météo configurée explicitement par l'utilisateur.
+        Passe par le cache partagé: prévisions poussées par l'entité si elle le
+        permet, sinon une seule requête weather.get_forecasts par entité météo
+        et par période FORECAST_CACHE_TTL. Appelé au démarrage puis chaque
+        heure, en secours des prévisions poussées (_on_forecast_update).
         """
         if not self._weather_entity_id:
             _LOGGER.debug("No weather entity configured, skipping forecast update")
             return
 
-        entity_id = self._weather_entity_id
-
         try:
-            # Appeler le service weather.get_forecasts
-            forecast_response = await self._hass.services.async_call(
-                "weather",
-                "get_forecasts",
-                {"type": "hourly"},
-                target={"entity_id": entity_id},
-                blocking=True,
-                return_response=True,
+            forecast = await self._forecast_cache.async_refresh(
+                self._weather_entity_id, self._on_forecast_update
             )
-
-            if forecast_response and entity_id in forecast_response:
-                entity_forecast = forecast_response[entity_id]
-                if isinstance(entity_forecast, dict):
-                    forecast_list = entity_forecast.get("forecast", [])
-                    if isinstance(forecast_list, list):
-                        forecasts = forecast_list[:FORECAST_HOURS]
-
-                        if forecasts:
-                            # Moyenne température
-                            temps: list[float] = []
-                            winds: list[float] = []
-
-                            for f in forecasts:
-                                if isinstance(f, dict):
-                                    temp_val = f.get("temperature")
-                                    if isinstance(temp_val, (int, float)):
-                                        temps.append(float(temp_val))
-
-                                    wind_val = f.get("wind_speed")
-                                    if isinstance(wind_val, (int, float)):
-                                        winds.append(float(wind_val))
-
-                            if temps:
-                                self.data.temperature_forecast_avg = sum(temps) / len(
-                                    temps
-                                )
-
-                            if winds:
-                                self.data.wind_speed_forecast_avg = sum(winds) / len(
-                                    winds
-                                )
-
-                            _LOGGER.debug(
-                                "Prévisions mises à jour: temp=%.1f°C, vent=%.1fkm/h",
-                                self.data.temperature_forecast_avg,
-                                self.data.wind_speed_forecast_avg,
-                            )
         except Exception as ex:
             _LOGGER.warning(
                 "Erreur lors de la récupération des prévisions météo: %s", ex
             )
+            return
+
+        self._apply_forecast(forecast)
+
+    @callback
+    def _on_forecast_update(self, forecast: list[dict[str, Any]]) -> None:
+        """Appelé à chaque nouvelle prévision de l'entité météo.
+
+        Si les moyennes changent pendant la surveillance nocturne, l'heure de
+        relance est recalculée sans attendre la mise à jour programmée.
+        """
+        if not self._apply_forecast(forecast):
+            return
+
+        if self.data.smartheating_mode and self.data.recovery_calc_mode:
+            self._hass.async_create_task(self._async_on_recovery_update_hour())
+        else:
+            self._notify_listeners()
+
+    def _apply_forecast(self, forecast: list[dict[str, Any]]) -> bool:
+        """Intègre une prévision horaire.
+
+        Conserve la série complète (ForecastTimeline) pour les moyennes sur
+        la fenêtre de la nuit, et calcule les moyennes des FORECAST_HOURS
+        premières heures exposées par les sensors.
+        Retourne True si la série ou l'une des moyennes a changé.
+        """
+        if not forecast:
+            return False
+
+        previous = (
+            self.data.temperature_forecast_avg,
+            self.data.wind_speed_forecast_avg,
+        )
+
+        temps: list[float] = []
+        winds: list[float] = []
+        temp_points: list[tuple[float, float]] = []
+        wind_points: list[tuple[float, float]] = []
+
+        for index, f in enumerate(forecast):
+            if not isinstance(f, dict):
+                continue
+            timestamp = self._parse_forecast_time(f.get("datetime"))
+
+            temp_val = f.get("temperature")
+            if isinstance(temp_val, (int, float)):
+                if index < FORECAST_HOURS:
+                    temps.append(float(temp_val))
+                if timestamp is not None:
+                    temp_points.append((timestamp, float(temp_val)))
+
+            wind_val = f.get("wind_speed")
+            if isinstance(wind_val, (int, float)):
+                if index < FORECAST_HOURS:
+                    winds.append(float(wind_val))
+                if timestamp is not None:
+                    wind_points.append((timestamp, float(wind_val)))
+
+        if temps:
+            self.data.temperature_forecast_avg = sum(temps) / len(temps)
+
+        if winds:
+            self.data.wind_speed_forecast_avg = sum(winds) / len(winds)
+
+        temperature_timeline = ForecastTimeline(temp_points)
+        wind_timeline = ForecastTimeline(wind_points)
+        timeline_changed = (
+            temperature_timeline != self._temperature_timeline
+            or wind_timeline != self._wind_timeline
+        )
+        self._temperature_timeline = temperature_timeline
+        self._wind_timeline = wind_timeline
+
+        _LOGGER.debug(
+            "Prévisions mises à jour: temp=%.1f°C, vent=%.1fkm/h (%d heures)",
+            self.data.temperature_forecast_avg,
+            self.data.wind_speed_forecast_avg,
+            len(temperature_timeline),
+        )
+        return timeline_changed or previous != (
+            self.data.temperature_forecast_avg,
+            self.data.wind_speed_forecast_avg,
+        )
+
+    @staticmethod
+    def _parse_forecast_time(value: Any) -> float | None:
+        """Instant d'une entrée de prévision (timestamp), None si invalide."""
+        if isinstance(value, datetime):
+            return value.timestamp()
+        if isinstance(value, str) and (parsed := dt_util.parse_datetime(value)):
+            return parsed.timestamp()
+        return None
 
     def _calculate_windchill(self) -> None:
         """Calcul de la température ressentie (windchill)
@@ -774,9 +1169,7 @@ class SmartHRTCoordinator:
         Utilise rcth_lw/rcth_hw pour adapter le coefficient thermique
         selon la vitesse du vent (entre WIND_LOW et WIND_HIGH km/h).
         """
-        wind_clamped = max(WIND_LOW, min(WIND_HIGH, wind_kmh))
-        ratio = (WIND_HIGH - wind_clamped) / (WIND_HIGH - WIND_LOW)
-        return max(0.1, high + (low - high) * ratio)
+        return interpolate_coefficient(low, high, wind_kmh, WIND_LOW, WIND_HIGH)
 
     def _get_interpolated_rcth(self, wind_kmh: float) -> float:
         return self._interpolate(self.data.rcth_lw, self.data.rcth_hw, wind_kmh)
@@ -792,30 +1185,70 @@ class SmartHRTCoordinator:
         """Calcule l'heure de démarrage de la relance (ADR-005).
 
         Équivalent du script calculate_recovery_time du YAML.
-        Utilise les prévisions météo et 20 itérations pour affiner la prédiction.
+        Utilise les prévisions météo; le point fixe des 20 itérations du
+        YAML est résolu par Newton
+        (thermal.model.recovery_duration), démarré à chaud depuis la valeur
+        interpolée ou la dernière heure de relance.
         """
-        # Utiliser 17°C par défaut si la température intérieure n'est pas disponible (comme dans le YAML)
-        tint = self.data.interior_temp if self.data.interior_temp is not None else 17.0
-
-        # Utiliser les prévisions météo comme dans le YAML
-        text = (
-            self.data.temperature_forecast_avg
-            if self.data.temperature_forecast_avg
-            else (self.data.exterior_temp or 0.0)
+        inputs = self._get_recovery_inputs()
+        solution = recovery_duration(
+            inputs.tint,
+            inputs.text,
+            inputs.tsp,
+            inputs.wind_kmh,
+            inputs.rcth_lw,
+            inputs.rcth_hw,
+            inputs.rpth_lw,
+            inputs.rpth_hw,
+            inputs.time_remaining,
+            inputs.max_duration,
+            WIND_LOW,
+            WIND_HIGH,
+            inputs.initial,
         )
-        tsp = self.data.tsp
+        self._apply_recovery_solution(inputs, solution)
 
-        # Utiliser les prévisions de vent
-        wind_kmh = (
-            self.data.wind_speed_forecast_avg
-            if self.data.wind_speed_forecast_avg
-            else (self.data.wind_speed * 3.6)
-        )
+    @callback
+    def async_request_recovery_time(self) -> None:
+        """Demande l'heure de relance au moteur partagé.
 
-        rcth = self._get_interpolated_rcth(wind_kmh)
-        rpth = self._get_interpolated_rpth(wind_kmh)
+        Les demandes simultanées de toutes les instances sont évaluées en un
+        seul lot vectorisé (RecoveryBatchEngine);
+        _on_recovery_time_calculated suit l'écriture de la solution.
+        """
+        self._recovery_engine.async_request(self)
+
+    @property
+    def compute_stats(self) -> dict[str, Any]:
+        """Répartition boucle/exécuteur des calculs (diagnostic)."""
+        return {
+            "coordinator": self._compute.stats,
+            "engine": self._recovery_engine.stats,
+            "forecast_cache": self._forecast_cache.stats,
+            "tick": self._tick.stats,
+            "triggers": self._triggers.stats,
+            "recovery_start": self.recovery_start_stats,
+            "persistence": self.persistence_stats,
+            "notifications": {
+                "listeners": len(self._listeners),
+                "requests": self._notify_requests,
+                "flushes": self._notify_flushes,
+                "last_notified": self._notified_listeners,
+                "skipped": self._skipped_listeners,
+                "suppressed_writes": self.suppressed_writes,
+            },
+        }
+
+    def _get_recovery_inputs(self) -> RecoveryInputs:
+        """Rassemble les entrées du calcul de relance (sans calcul coûteux).
+
+        Utilisé par calculate_recovery_time et par le moteur partagé
+        (RecoveryBatchEngine) qui évalue toutes les instances en un lot.
+        """
+        # Utiliser 17°C par défaut si la température intérieure n'est pas disponible (comme dans le YAML)
+        tint = self.data.interior_temp if self.data.interior_temp is not None else 17.0
 
-        now = dt_util.now()
+        now = self._clock.now()
         target_dt = now.replace(
             hour=self.data.target_hour.hour,
             minute=self.data.target_hour.minute,
@@ -825,32 +1258,60 @@ class SmartHRTCoordinator:
         if target_dt < now:
             target_dt += timedelta(days=1)
 
+        # Prévisions moyennées sur la fenêtre réelle du calcul: refroidissement
+        # jusqu'à la relance puis relance jusqu'à l'heure cible
+        window = (now.timestamp(), target_dt.timestamp())
+
+        # Utiliser les prévisions météo comme dans le YAML
+        text = self._temperature_timeline.mean(*window)
+        if text is None:
+            text = (
+                self.data.temperature_forecast_avg
+                if self.data.temperature_forecast_avg
+                else (self.data.exterior_temp or 0.0)
+            )
+
+        # Utiliser les prévisions de vent
+        wind_kmh = self._wind_timeline.mean(*window)
+        if wind_kmh is None:
+            wind_kmh = (
+                self.data.wind_speed_forecast_avg
+                if self.data.wind_speed_forecast_avg
+                else (self.data.wind_speed * 3.6)
+            )
+
         time_remaining = (target_dt - now).total_seconds() / 3600
-        max_duration = max(time_remaining - 1 / 6, 0)
 
-        try:
-            ratio = (rpth + text - tint) / (rpth + text - tsp)
-            duree_relance = min(max(rcth * math.log(max(ratio, 0.1)), 0), max_duration)
-        except (ValueError, ZeroDivisionError):
-            duree_relance = max_duration
+        # Démarrage à chaud: durée de la solution précédente (même nuit ou veille)
+        initial = None
+        if (previous_start := self.data.recovery_start_hour) is not None:
+            if previous_start.tzinfo is None:
+                previous_start = dt_util.as_local(previous_start)
+            initial = ((target_dt - previous_start).total_seconds() % 86400) / 3600
+
+        return RecoveryInputs(
+            target_dt=target_dt,
+            tint=tint,
+            text=text,
+            tsp=self.data.tsp,
+            wind_kmh=wind_kmh,
+            rcth_lw=self.data.rcth_lw,
+            rcth_hw=self.data.rcth_hw,
+            rpth_lw=self.data.rpth_lw,
+            rpth_hw=self.data.rpth_hw,
+            time_remaining=time_remaining,
+            max_duration=max(time_remaining - 1 / 6, 0),
+            initial=initial,
+        )
 
-        # Prédiction itérative (20 itérations comme dans le YAML)
-        for _ in range(20):
-            try:
-                tint_start = text + (tint - text) / math.exp(
-                    (time_remaining - duree_relance) / rcth
-                )
-                ratio = (rpth + text - tint_start) / (rpth + text - tsp)
-                if ratio > 0.1:
-                    duree_relance = min(
-                        (duree_relance + 2 * max(rcth * math.log(ratio), 0)) / 3,
-                        max_duration,
-                    )
-            except (ValueError, ZeroDivisionError):
-                break
-
-        prev_recovery_start = self.data.recovery_start_hour
-        self.data.recovery_start_hour = target_dt - timedelta(
+    def _apply_recovery_solution(
+        self, inputs: RecoveryInputs, solution: RecoverySolution
+    ) -> None:
+        """Enregistre l'heure de relance issue d'une solution du solveur."""
+        duree_relance = solution.duration
+        self.data.recovery_solver_iterations = solution.iterations
+        self.data.recovery_solver_residual = solution.residual
+        self.data.recovery_start_hour = inputs.target_dt - timedelta(
             seconds=int(duree_relance * 3600)
         )
 
@@ -858,9 +1319,11 @@ class SmartHRTCoordinator:
         # car async_track_point_in_time doit être appelé depuis le thread principal
 
         _LOGGER.debug(
-            "Recovery time: %s (%.2fh avant target)",
+            "Recovery time: %s (%.2fh avant target, %d itérations, résidu=%.2e)",
             self.data.recovery_start_hour,
             duree_relance,
+            solution.iterations,
+            solution.residual,
         )
 
     def calculate_recovery_update_time(self) -> datetime | None:
@@ -876,7 +1339,7 @@ class SmartHRTCoordinator:
         if self.data.recovery_start_hour is None:
             return None
 
-        now = dt_util.now()
+        now = self._clock.now()
 
         # Comme dans le YAML: reconstruire recoverystart_time depuis l'heure
         # de recovery_start_hour (pas le datetime complet)
@@ -895,10 +1358,7 @@ class SmartHRTCoordinator:
 
         # Recalcule pas plus tard que dans 1200s (20min)
         # À moins de 30min avant la relance on arrête
-        if time_remaining < 1800:
-            seconds = 3600  # Impose un calcul après la relance
-        else:
-            seconds = min(max(time_remaining / 3, 0), 1200)
+        seconds = recovery_update_delay(time_remaining)
 
         update_time = now + timedelta(seconds=seconds)
 
@@ -920,24 +1380,17 @@ class SmartHRTCoordinator:
         ):
             return
 
-        tint: float = self.data.interior_temp
-        text: float = self.data.exterior_temp
-        tint_off: float = self.data.temp_recovery_calc
-        text_off: float = self.data.text_recovery_calc
-
-        dt_hours = (dt_util.now() - self.data.time_recovery_calc).total_seconds() / 3600
-        if dt_hours < 0:
-            dt_hours += 24
-
-        avg_text = (text_off + text) / 2
-
-        if tint < tint_off and tint > avg_text:
-            try:
-                self.data.rcth_fast = dt_hours / max(
-                    0.0001, math.log((avg_text - tint_off) / (avg_text - tint))
-                )
-            except (ValueError, ZeroDivisionError):
-                pass
+        elapsed = self._clock.now() - self.data.time_recovery_calc
+        dt_hours = elapsed.total_seconds() / 3600
+        value = rcth_fast(
+            self.data.interior_temp,
+            self.data.exterior_temp,
+            self.data.temp_recovery_calc,
+            self.data.text_recovery_calc,
+            dt_hours,
+        )
+        if value is not None:
+            self.data.rcth_fast = value
 
     def calculate_rcth_at_recovery_start(self) -> None:
         """Calcule RCth au démarrage de la relance"""
@@ -951,19 +1404,15 @@ class SmartHRTCoordinator:
             self.data.time_recovery_start.timestamp()
             - self.data.time_recovery_calc.timestamp()
         ) / 3600
-        avg_text = (self.data.text_recovery_start + self.data.text_recovery_calc) / 2
-
-        try:
-            self.data.rcth_calculated = min(
-                19999,
-                dt
-                / math.log(
-                    (avg_text - self.data.temp_recovery_calc)
-                    / (avg_text - self.data.temp_recovery_start)
-                ),
-            )
-        except (ValueError, ZeroDivisionError):
-            pass
+        value = rcth_at_recovery_start(
+            dt,
+            self.data.temp_recovery_calc,
+            self.data.temp_recovery_start,
+            self.data.text_recovery_calc,
+            self.data.text_recovery_start,
+        )
+        if value is not None:
+            self.data.rcth_calculated = value
 
         if self.data.recovery_adaptive_mode:
             self._update_coefficients("rcth")
@@ -977,17 +1426,16 @@ class SmartHRTCoordinator:
             self.data.time_recovery_end.timestamp()
             - self.data.time_recovery_start.timestamp()
         ) / 3600
-        avg_text = (self.data.text_recovery_start + self.data.text_recovery_end) / 2
-        rcth_interpol = self._get_interpolated_rcth(self.data.wind_speed * 3.6)
-
-        try:
-            exp_term = math.exp(dt / rcth_interpol)
-            numerator = (avg_text - self.data.temp_recovery_end) * exp_term - (
-                avg_text - self.data.temp_recovery_start
-            )
-            self.data.rpth_calculated = min(19999, max(0.1, numerator / (1 - exp_term)))
-        except (ValueError, ZeroDivisionError):
-            pass
+        value = rpth_at_recovery_end(
+            dt,
+            self.data.temp_recovery_start,
+            self.data.temp_recovery_end,
+            self.data.text_recovery_start,
+            self.data.text_recovery_end,
+            self._get_interpolated_rcth(self._get_wind_average_kmh()),
+        )
+        if value is not None:
+            self.data.rpth_calculated = value
 
         if self.data.recovery_adaptive_mode:
             self._update_coefficients("rpth")
@@ -998,68 +1446,47 @@ class SmartHRTCoordinator:
         ADR-006: Apprentissage continu
         - Calcule l'erreur entre valeur mesurée et interpolée
         - Applique une formule de relaxation pour éviter les oscillations
-        - Met à jour rcth_lw/hw ou rpth_lw/hw selon le vent actuel
+        - Met à jour rcth_lw/hw ou rpth_lw/hw selon le vent moyen sur 4h
         """
-        wind_kmh = self.data.wind_speed * 3.6
-        x = (wind_kmh - WIND_LOW) / (WIND_HIGH - WIND_LOW) - 0.5
+        wind_kmh = self._get_wind_average_kmh()
         relax = self.data.relaxation_factor
 
         if coef_type == "rcth":
-            lw, hw, calc = (
+            update = relax_coefficients(
                 self.data.rcth_lw,
                 self.data.rcth_hw,
+                self.data.rcth,
                 self.data.rcth_calculated,
+                wind_kmh,
+                relax,
+                WIND_LOW,
+                WIND_HIGH,
             )
-            interpol = max(0.1, lw + (hw - lw) * (x + 0.5))
-            err = calc - interpol
-
             # Store error for diagnostics
-            self.data.last_rcth_error = round(err, 3)
-
-            lw_new = max(
-                0.1, lw + err * (1 - 5 / 3 * x - 2 * x * x + 8 / 3 * x * x * x)
-            )
-            hw_new = max(
-                0.1, hw + err * (1 + 5 / 3 * x - 2 * x * x - 8 / 3 * x * x * x)
-            )
-
-            self.data.rcth_lw = min(19999, (lw + relax * lw_new) / (1 + relax))
-            self.data.rcth_hw = min(
-                self.data.rcth_lw, (hw + relax * hw_new) / (1 + relax)
-            )
-            self.data.rcth = max(0.1, (self.data.rcth + relax * calc) / (1 + relax))
-
-            # Save updated coefficients to persistent storage
-            self._hass.async_create_task(self._save_learned_data())
+            self.data.last_rcth_error = round(update.error, 3)
+            self.data.rcth_lw = update.low
+            self.data.rcth_hw = update.high
+            self.data.rcth = update.value
         else:
-            lw, hw, calc = (
+            update = relax_coefficients(
                 self.data.rpth_lw,
                 self.data.rpth_hw,
+                self.data.rpth,
                 self.data.rpth_calculated,
+                wind_kmh,
+                relax,
+                WIND_LOW,
+                WIND_HIGH,
+                value_max=COEFFICIENT_MAX,
             )
-            interpol = max(0.1, lw + (hw - lw) * (x + 0.5))
-            err = calc - interpol
-
             # Store error for diagnostics
-            self.data.last_rpth_error = round(err, 3)
-
-            lw_new = max(
-                0.1, lw + err * (1 - 5 / 3 * x - 2 * x * x + 8 / 3 * x * x * x)
-            )
-            hw_new = max(
-                0.1, hw + err * (1 + 5 / 3 * x - 2 * x * x - 8 / 3 * x * x * x)
-            )
-
-            self.data.rpth_lw = min(19999, (lw + relax * lw_new) / (1 + relax))
-            self.data.rpth_hw = min(
-                self.data.rpth_lw, (hw + relax * hw_new) / (1 + relax)
-            )
-            self.data.rpth = min(
-                19999, max(0.1, (self.data.rpth + relax * calc) / (1 + relax))
-            )
+            self.data.last_rpth_error = round(update.error, 3)
+            self.data.rpth_lw = update.low
+            self.data.rpth_hw = update.high
+            self.data.rpth = update.value
 
-            # Save updated coefficients to persistent storage
-            self._hass.async_create_task(self._save_learned_data())
+        # Save updated coefficients to persistent storage
+        self._schedule_save()
 
     # ─────────────────────────────────────────────────────────────────────────
     # Événements chauffage
@@ -1097,7 +1524,7 @@ class SmartHRTCoordinator:
         if self.data.time_recovery_calc is None:
             return
 
-        now = dt_util.now()
+        now = self._clock.now()
 
         # Calculer la durée du lag
         self.data.stop_lag_duration = min(
@@ -1129,13 +1556,13 @@ class SmartHRTCoordinator:
         )
 
         # Sauvegarder l'état après la transition
-        self._hass.async_create_task(self._save_learned_data())
+        self._schedule_save()
 
         self._notify_listeners()
 
     def on_heating_stop(self) -> None:
         """Appelé quand le chauffage s'arrête (service manuel)"""
-        self.data.time_recovery_calc = dt_util.now()
+        self.data.time_recovery_calc = self._clock.now()
         self.data.temp_recovery_calc = self.data.interior_temp or 17.0
         self.data.text_recovery_calc = self.data.exterior_temp or 0.0
         self.data.temp_lag_detection_active = True
@@ -1152,7 +1579,7 @@ class SmartHRTCoordinator:
         self.data.current_state = SmartHRTState.RECOVERY
         _LOGGER.debug("SmartHRT: Transition vers état RECOVERY")
 
-        self.data.time_recovery_start = dt_util.now()
+        self.data.time_recovery_start = self._clock.now()
         self.data.temp_recovery_start = self.data.interior_temp or 17.0
         self.data.text_recovery_start = self.data.exterior_temp or 0.0
 
@@ -1173,7 +1600,7 @@ class SmartHRTCoordinator:
         )
 
         # Sauvegarder l'état après la transition
-        self._hass.async_create_task(self._save_learned_data())
+        self._schedule_save()
 
         self._notify_listeners()
 
@@ -1186,11 +1613,12 @@ class SmartHRTCoordinator:
         if not self.data.rp_calc_mode:
             return
 
-        self.data.time_recovery_end = dt_util.now()
+        self.data.time_recovery_end = self._clock.now()
         self.data.temp_recovery_end = self.data.interior_temp or 17.0
         self.data.text_recovery_end = self.data.exterior_temp or 0.0
 
         self.calculate_rpth_at_recovery_end()
+        self._record_cycle()
 
         self.data.rp_calc_mode = False
 
@@ -1205,7 +1633,7 @@ class SmartHRTCoordinator:
         )
 
         # Sauvegarder l'état après la transition (coefficients mis à jour)
-        self._hass.async_create_task(self._save_learned_data())
+        self._schedule_save()
 
         self._notify_listeners()
 
@@ -1213,6 +1641,55 @@ class SmartHRTCoordinator:
         """Ancienne méthode interne - redirige vers on_recovery_end"""
         self.on_recovery_end()
 
+    @property
+    def cycle_history(self) -> CycleHistory:
+        """Historique des cycles terminés (lecture dans l'exécuteur)."""
+        return self._cycle_history
+
+    def _record_cycle(self) -> None:
+        """Ajoute le cycle qui vient de se terminer à l'historique."""
+        data = self.data
+        if (
+            data.time_recovery_calc is None
+            or data.time_recovery_start is None
+            or data.time_recovery_end is None
+        ):
+            return
+        record = CycleRecord(
+            time_recovery_calc=data.time_recovery_calc.timestamp(),
+            time_recovery_start=data.time_recovery_start.timestamp(),
+            time_recovery_end=data.time_recovery_end.timestamp(),
+            temp_recovery_calc=data.temp_recovery_calc,
+            temp_recovery_start=data.temp_recovery_start,
+            temp_recovery_end=data.temp_recovery_end,
+            text_recovery_calc=data.text_recovery_calc,
+            text_recovery_start=data.text_recovery_start,
+            text_recovery_end=data.text_recovery_end,
+            wind_speed_avg=data.wind_speed_avg,
+            rcth_calculated=data.rcth_calculated,
+            rpth_calculated=data.rpth_calculated,
+            last_rcth_error=data.last_rcth_error,
+            last_rpth_error=data.last_rpth_error,
+            rcth=data.rcth,
+            rpth=data.rpth,
+        )
+        self._hass.async_create_task(self._async_append_cycle(record))
+
+    async def _async_append_cycle(self, record: CycleRecord) -> None:
+        try:
+            await self._hass.async_add_executor_job(
+                self._cycle_history.append, record
+            )
+        except (OSError, ValueError) as err:
+            self._cycle_history_errors += 1
+            _LOGGER.warning(
+                "SmartHRT: Impossible d'enregistrer le cycle dans %s: %s",
+                self._cycle_history.path,
+                err,
+            )
+            return
+        self._cycles_recorded += 1
+
     # ─────────────────────────────────────────────────────────────────────────
     # Setters publics
     # ─────────────────────────────────────────────────────────────────────────
@@ -1259,6 +1736,16 @@ class SmartHRTCoordinator:
         self.data.relaxation_factor = value
         self._notify_listeners()
 
+    def set_recovery_start_tolerance(self, value: float) -> None:
+        self.data.recovery_start_tolerance = value
+        self._notify_listeners()
+        self._schedule_save()
+
+    def set_recovery_start_freeze(self, value: float) -> None:
+        self.data.recovery_start_freeze = value
+        self._notify_listeners()
+        self._schedule_save()
+
     def set_rcth_lw(self, value: float) -> None:
         self.data.rcth_lw = value
         self.calculate_recovery_time()
@@ -1318,7 +1805,7 @@ class SmartHRTCoordinator:
         if self.data.recovery_start_hour is None:
             return None
 
-        now = dt_util.now()
+        now = self._clock.now()
         recovery_time = self.data.recovery_start_hour
 
         if recovery_time.tzinfo is None:
@@ -1334,13 +1821,44 @@ class SmartHRTCoordinator:
     # Listeners
     # ─────────────────────────────────────────────────────────────────────────
 
-    def register_listener(self, listener: Callable[[], None]) -> None:
-        self._listeners.append(listener)
+    def register_listener(
+        self,
+        listener: Callable[[], None],
+        fields: Iterable[str] | None = None,
+    ) -> None:
+        """Abonne un listener aux modifications des données.
+
+        Avec ``fields`` (champs de SmartHRTData ou FIELD_CLOCK), le listener
+        n'est appelé que si l'un d'eux a changé depuis la notification
+        précédente; sans, il l'est à chaque notification.
+        """
+        self._listeners.append(
+            (listener, frozenset(fields) if fields is not None else None)
+        )
 
     def unregister_listener(self, listener: Callable[[], None]) -> None:
-        if listener in self._listeners:
-            self._listeners.remove(listener)
+        self._listeners = [item for item in self._listeners if item[0] != listener]
 
     def _notify_listeners(self) -> None:
-        for listener in self._listeners:
-            listener()
+        """Demande la notification des listeners.
+
+        Les demandes d'une même itération de la boucle d'événements sont
+        regroupées: une seule diffusion (_flush_listeners) a lieu, après
+        toutes les modifications de l'événement en cours.
+        """
+        self._notify_requests += 1
+        if self._notify_handle is None:
+            self._notify_handle = self._hass.loop.call_soon(self._flush_listeners)
+
+    @callback
+    def _flush_listeners(self) -> None:
+        """Diffuse les modifications aux listeners concernés."""
+        self._notify_handle = None
+        self._notify_flushes += 1
+        dirty = self.data.pop_dirty()
+        self._notified_listeners = 0
+        for listener, fields in self._listeners:
+            if fields is None or not fields.isdisjoint(dirty):
+                self._notified_listeners += 1
+                listener()
+        self._skipped_listeners += len(self._listeners) - self._notified_listeners
@@ -0,0 +1,100 @@
+"""Répartition des calculs entre la boucle d'événements et l'exécuteur.
+
+Les calculs thermiques de SmartHRT durent quelques microsecondes: les
+envoyer dans l'exécuteur coûte plus cher (ordonnancement du pool de threads,
+changements de contexte) que le calcul lui-même. Le ComputeDispatcher mesure
+le coût de chaque type de calcul (moyenne mobile exponentielle, par unité de
+poids) et ne le délègue à l'exécuteur que lorsque le coût estimé dépasse le
+budget autorisé sur la boucle. Un calcul encore jamais mesuré n'est exécuté
+sur la boucle que pour un poids modéré: un premier lot de centaines
+d'instances part directement dans l'exécuteur.
+"""
+
+import time
+from collections.abc import Callable
+from typing import Any
+
+from homeassistant.core import HomeAssistant
+
+from .const import COMPUTE_INLINE_BUDGET, COMPUTE_UNMEASURED_MAX_WEIGHT
+
+# Poids de la dernière mesure dans la moyenne mobile des coûts
+_COST_SMOOTHING = 0.2
+
+
+class ComputeDispatcher:
+    """Exécute les calculs courts sur la boucle, les longs dans l'exécuteur."""
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        budget: float = COMPUTE_INLINE_BUDGET,
+        unmeasured_max_weight: int = COMPUTE_UNMEASURED_MAX_WEIGHT,
+    ) -> None:
+        self._hass = hass
+        self._budget = budget
+        self._unmeasured_max_weight = unmeasured_max_weight
+        self._unit_costs: dict[str, float] = {}  # secondes par unité de poids
+
+        # Compteurs (diagnostic)
+        self.inline_calls = 0
+        self.offloaded_calls = 0
+
+    @property
+    def stats(self) -> dict[str, Any]:
+        """Compteurs et coûts mesurés."""
+        return {
+            "inline_calls": self.inline_calls,
+            "offloaded_calls": self.offloaded_calls,
+            "budget_ms": self._budget * 1000,
+            "unit_costs_us": {
+                key: round(cost * 1e6, 2) for key, cost in self._unit_costs.items()
+            },
+        }
+
+    async def async_run[T](
+        self,
+        key: str,
+        func: Callable[..., T],
+        *args: Any,
+        weight: int = 1,
+    ) -> T:
+        """Exécute func(*args) sur la boucle ou dans l'exécuteur.
+
+        Args:
+            key: Type de calcul (les coûts sont mesurés par clé)
+            func: Fonction de calcul pure ou thread-safe
+            weight: Taille du travail (ex: nombre d'instances d'un lot); le
+                coût estimé est le coût unitaire mesuré multiplié par weight
+
+        Un type de calcul jamais mesuré est exécuté sur la boucle si son
+        poids ne dépasse pas unmeasured_max_weight, dans l'exécuteur sinon.
+        """
+        unit_cost = self._unit_costs.get(key)
+        if unit_cost is None:
+            offload = weight > self._unmeasured_max_weight
+        else:
+            offload = unit_cost * weight > self._budget
+        if offload:
+            self.offloaded_calls += 1
+            result, elapsed = await self._hass.async_add_executor_job(
+                _timed_call, func, args
+            )
+        else:
+            self.inline_calls += 1
+            result, elapsed = _timed_call(func, args)
+
+        cost = elapsed / max(weight, 1)
+        self._unit_costs[key] = (
+            cost
+            if unit_cost is None
+            else unit_cost + _COST_SMOOTHING * (cost - unit_cost)
+        )
+        return result
+
+
+def _timed_call[T](func: Callable[..., T], args: tuple[Any, ...]) -> tuple[T, float]:
+    """Appelle func et mesure sa durée propre (hors saut de thread)."""
+    start = time.perf_counter()
+    result = func(*args)
+    return result, time.perf_counter() - start
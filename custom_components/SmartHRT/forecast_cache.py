@@ -0,0 +1,273 @@
+"""Cache des prévisions météo partagé par toutes les instances SmartHRT.
+
+ADR implémentées dans ce module:
+- ADR-002: Sélection explicite de l'entité météo (clé du cache)
+
+Plusieurs instances configurées avec la même entité météo partagent ses
+prévisions horaires:
+- lorsque l'entité le permet, le cache s'abonne aux prévisions qu'elle
+  pousse (WeatherEntity.async_subscribe_forecast) et les transmet dès leur
+  publication, quel que soit le rythme du fournisseur;
+- sinon, et en secours, weather.get_forecasts est interrogé: les demandes
+  simultanées attendent la même requête (single-flight);
+- une prévision, poussée ou récupérée, est réutilisée pendant au plus
+  FORECAST_CACHE_TTL (horloge du domaine, cf. clock.py): un fournisseur qui
+  cesse de publier ne fige pas les prévisions;
+- chaque nouvelle prévision est transmise aux instances abonnées, sauf à
+  celles qui l'ont demandée (async_refresh la leur retourne).
+"""
+
+import asyncio
+import logging
+import time
+from collections.abc import Callable
+from functools import partial
+from typing import Any
+
+from homeassistant.components.weather import (
+    DOMAIN as WEATHER_DOMAIN,
+)
+from homeassistant.components.weather import (
+    WeatherEntity,
+    WeatherEntityFeature,
+)
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+
+from .clock import Clock, async_get_clock
+from .const import DATA_FORECAST_CACHE, DOMAIN, FORECAST_CACHE_TTL
+
+_LOGGER = logging.getLogger(__name__)
+
+ForecastListener = Callable[[list[dict[str, Any]]], None]
+
+
+class ForecastCache:
+    """Prévisions horaires par entité météo, récupérées une seule fois."""
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        ttl: float = FORECAST_CACHE_TTL,
+        clock: Clock | None = None,
+    ) -> None:
+        self._hass = hass
+        self._ttl = ttl
+        self._clock: Clock = clock if clock is not None else async_get_clock(hass)
+        # entity_id -> (instant de récupération (s), prévisions)
+        self._forecasts: dict[str, tuple[float, list[dict[str, Any]]]] = {}
+        self._inflight: dict[str, asyncio.Future[list[dict[str, Any]]]] = {}
+        # entity_id -> abonnés qui attendent la requête en cours
+        self._requesters: dict[str, set[ForecastListener]] = {}
+        self._listeners: dict[str, list[ForecastListener]] = {}
+        # entity_id -> (entité météo, désabonnement des prévisions poussées)
+        self._push: dict[str, tuple[WeatherEntity, CALLBACK_TYPE]] = {}
+
+        # Statistiques (diagnostic)
+        self.pushes = 0
+        self.fetches = 0
+        self.cache_hits = 0
+        self.coalesced = 0
+        self.errors = 0
+        self.last_fetch_latency = 0.0  # secondes
+        self._total_fetch_latency = 0.0
+
+    @property
+    def stats(self) -> dict[str, Any]:
+        """Statistiques du cache."""
+        return {
+            "entities": len(self._forecasts),
+            "subscribers": sum(len(items) for items in self._listeners.values()),
+            "push_subscriptions": len(self._push),
+            "pushes": self.pushes,
+            "fetches": self.fetches,
+            "cache_hits": self.cache_hits,
+            "coalesced": self.coalesced,
+            "errors": self.errors,
+            "last_fetch_latency_ms": round(self.last_fetch_latency * 1000, 1),
+            "avg_fetch_latency_ms": (
+                round(self._total_fetch_latency / self.fetches * 1000, 1)
+                if self.fetches
+                else None
+            ),
+        }
+
+    @callback
+    def async_subscribe(
+        self, entity_id: str, listener: ForecastListener
+    ) -> Callable[[], None]:
+        """Abonne une instance aux nouvelles prévisions d'une entité météo.
+
+        Le listener est appelé à chaque prévision poussée ou récupérée.
+        Retourne la fonction de désabonnement.
+        """
+        listeners = self._listeners.setdefault(entity_id, [])
+        listeners.append(listener)
+        self._async_ensure_push(entity_id)
+
+        @callback
+        def _unsubscribe() -> None:
+            if listener in listeners:
+                listeners.remove(listener)
+            if not listeners and self._listeners.get(entity_id) is listeners:
+                del self._listeners[entity_id]
+                self._forecasts.pop(entity_id, None)
+                self._async_stop_push(entity_id)
+
+        return _unsubscribe
+
+    @callback
+    def _async_ensure_push(self, entity_id: str) -> None:
+        """S'abonne aux prévisions poussées par l'entité, si elle le permet.
+
+        Appelé à chaque rafraîchissement: l'abonnement est repris lorsque
+        l'entité météo apparaît (chargée après SmartHRT) ou est rechargée.
+        """
+        component = self._hass.data.get(WEATHER_DOMAIN)
+        entity = component.get_entity(entity_id) if component else None
+        if (current := self._push.get(entity_id)) is not None:
+            if current[0] is entity:
+                return
+            self._async_stop_push(entity_id)
+
+        if entity is None or not isinstance(entity, WeatherEntity):
+            return
+        if not (entity.supported_features or 0) & WeatherEntityFeature.FORECAST_HOURLY:
+            return
+
+        unsubscribe = entity.async_subscribe_forecast(
+            "hourly", partial(self._async_on_push, entity_id)
+        )
+        self._push[entity_id] = (entity, unsubscribe)
+        _LOGGER.debug("Abonnement aux prévisions poussées par %s", entity_id)
+
+    @callback
+    def _async_stop_push(self, entity_id: str) -> None:
+        """Résilie l'abonnement aux prévisions poussées d'une entité."""
+        if (current := self._push.pop(entity_id, None)) is None:
+            return
+        try:
+            current[1]()
+        except ValueError:
+            # Entité retirée entre-temps: ses listeners ont déjà disparu
+            pass
+
+    @callback
+    def _async_on_push(
+        self, entity_id: str, forecast: list[dict[str, Any]] | None
+    ) -> None:
+        """Reçoit une prévision publiée par l'entité météo."""
+        if forecast is None:
+            return
+        self.pushes += 1
+        self._async_store(entity_id, forecast)
+
+    async def async_refresh(
+        self, entity_id: str, requester: ForecastListener | None = None
+    ) -> list[dict[str, Any]]:
+        """Retourne les prévisions de l'entité, récupérées si périmées.
+
+        Les abonnés reçoivent chaque nouvelle prévision, sauf requester (le
+        listener abonné par le demandeur) qui la reçoit en retour. Les
+        erreurs de la requête sont propagées à tous les demandeurs en attente.
+        """
+        self._async_ensure_push(entity_id)
+        cached = self._forecasts.get(entity_id)
+        if cached is not None and self._clock.now().timestamp() - cached[0] < self._ttl:
+            self.cache_hits += 1
+            return cached[1]
+
+        requesters = self._requesters.setdefault(entity_id, set())
+        if requester is not None:
+            requesters.add(requester)
+        if (future := self._inflight.get(entity_id)) is not None:
+            self.coalesced += 1
+            return await asyncio.shield(future)
+
+        future = self._hass.loop.create_future()
+        self._inflight[entity_id] = future
+        try:
+            forecast = await self._async_fetch(entity_id)
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except Exception as err:
+            self.errors += 1
+            if not future.done():
+                future.set_exception(err)
+                # Marque l'exception comme traitée s'il n'y a aucun demandeur
+                future.exception()
+            raise
+        finally:
+            if self._inflight.get(entity_id) is future:
+                del self._inflight[entity_id]
+            requesters = self._requesters.pop(entity_id, set())
+        if not future.done():
+            future.set_result(forecast)
+
+        self._async_store(entity_id, forecast, skip=requesters)
+        return forecast
+
+    @callback
+    def _async_store(
+        self,
+        entity_id: str,
+        forecast: list[dict[str, Any]],
+        skip: set[ForecastListener] | None = None,
+    ) -> None:
+        """Met en cache une nouvelle prévision et la transmet aux abonnés.
+
+        Les listeners de skip (demandeurs d'une requête) sont ignorés.
+        """
+        self._forecasts[entity_id] = (self._clock.now().timestamp(), forecast)
+        for listener in list(self._listeners.get(entity_id, ())):
+            if skip and listener in skip:
+                continue
+            listener(forecast)
+
+    async def _async_fetch(self, entity_id: str) -> list[dict[str, Any]]:
+        """Appelle weather.get_forecasts (prévisions horaires)."""
+        start = time.perf_counter()
+        response = await self._hass.services.async_call(
+            "weather",
+            "get_forecasts",
+            {"type": "hourly"},
+            target={"entity_id": entity_id},
+            blocking=True,
+            return_response=True,
+        )
+        self.last_fetch_latency = time.perf_counter() - start
+        self._total_fetch_latency += self.last_fetch_latency
+        self.fetches += 1
+        _LOGGER.debug(
+            "Prévisions de %s récupérées en %.1f ms",
+            entity_id,
+            self.last_fetch_latency * 1000,
+        )
+
+        forecast: list[dict[str, Any]] = []
+        if response and isinstance(entity_forecast := response.get(entity_id), dict):
+            forecast_list = entity_forecast.get("forecast", [])
+            if isinstance(forecast_list, list):
+                forecast = forecast_list
+        return forecast
+
+    @callback
+    def async_shutdown(self) -> None:
+        """Annule requêtes et abonnements (déchargement de la dernière instance)."""
+        for entity_id in list(self._push):
+            self._async_stop_push(entity_id)
+        for future in self._inflight.values():
+            future.cancel()
+        self._inflight.clear()
+        self._requesters.clear()
+        self._forecasts.clear()
+        self._listeners.clear()
+
+
+@callback
+def async_get_forecast_cache(hass: HomeAssistant) -> ForecastCache:
+    """Retourne le cache partagé, en le créant au premier appel."""
+    domain_data = hass.data.setdefault(DOMAIN, {})
+    if (cache := domain_data.get(DATA_FORECAST_CACHE)) is None:
+        cache = domain_data[DATA_FORECAST_CACHE] = ForecastCache(hass)
+    return cache
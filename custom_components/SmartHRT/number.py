@@ -3,6 +3,7 @@
 ADR implémentées dans ce module:
 - ADR-006: Apprentissage continu (SmartHRTRelaxationNumber pour le facteur)
 - ADR-007: Compensation météo (RCth/RPth LW/HW pour interpolation vent)
+- Hystérésis du démarrage de relance (tolérance et gel, en minutes)
 - ADR-012: Exposition entités pour Lovelace (numbers comme entités HA)
 """
 
@@ -27,6 +28,7 @@ from .const import (
     DEFAULT_RCTH_MAX,
     DEFAULT_RPTH_MIN,
     DEFAULT_RPTH_MAX,
+    RECOVERY_START_HYSTERESIS_MAX,
 )
 from .coordinator import SmartHRTCoordinator
 
@@ -53,6 +55,8 @@ async def async_setup_entry(
         SmartHRTRPthLWNumber(coordinator, entry),
         SmartHRTRPthHWNumber(coordinator, entry),
         SmartHRTRelaxationNumber(coordinator, entry),
+        SmartHRTRecoveryStartToleranceNumber(coordinator, entry),
+        SmartHRTRecoveryStartFreezeNumber(coordinator, entry),
     ]
     async_add_entities(entities, True)
 
@@ -60,6 +64,10 @@ async def async_setup_entry(
 class SmartHRTBaseNumber(NumberEntity):
     """Classe de base pour les number SmartHRT"""
 
+    # Champs de SmartHRTData dont dépend l'état de l'entité (None: tous);
+    # l'entité n'est réécrite que si l'un d'eux a changé
+    _data_fields: frozenset[str] | None = None
+
     def __init__(
         self, coordinator: SmartHRTCoordinator, config_entry: ConfigEntry
     ) -> None:
@@ -84,7 +92,9 @@ class SmartHRTBaseNumber(NumberEntity):
     async def async_added_to_hass(self) -> None:
         """Callback appelé lorsque l'entité est ajoutée à HA"""
         await super().async_added_to_hass()
-        self._coordinator.register_listener(self._on_coordinator_update)
+        self._coordinator.register_listener(
+            self._on_coordinator_update, self._data_fields
+        )
 
     async def async_will_remove_from_hass(self) -> None:
         """Callback appelé lorsque l'entité est retirée de HA"""
@@ -100,6 +110,8 @@ class SmartHRTBaseNumber(NumberEntity):
 class SmartHRTSetPointNumber(SmartHRTBaseNumber):
     """Entité number pour la consigne de température (Set Point)"""
 
+    _data_fields = frozenset({"tsp"})
+
     def __init__(
         self, coordinator: SmartHRTCoordinator, config_entry: ConfigEntry
     ) -> None:
@@ -129,6 +141,8 @@ class SmartHRTSetPointNumber(SmartHRTBaseNumber):
 class SmartHRTRCthNumber(SmartHRTBaseNumber):
     """Entité number pour RCth"""
 
+    _data_fields = frozenset({"rcth"})
+
     def __init__(
         self, coordinator: SmartHRTCoordinator, config_entry: ConfigEntry
     ) -> None:
@@ -157,6 +171,8 @@ class SmartHRTRCthNumber(SmartHRTBaseNumber):
 class SmartHRTRPthNumber(SmartHRTBaseNumber):
     """Entité number pour RPth"""
 
+    _data_fields = frozenset({"rpth"})
+
     def __init__(
         self, coordinator: SmartHRTCoordinator, config_entry: ConfigEntry
     ) -> None:
@@ -189,6 +205,8 @@ class SmartHRTRCthLWNumber(SmartHRTBaseNumber):
     Utilisé pour l'interpolation linéaire selon la vitesse du vent.
     """
 
+    _data_fields = frozenset({"rcth_lw"})
+
     def __init__(
         self, coordinator: SmartHRTCoordinator, config_entry: ConfigEntry
     ) -> None:
@@ -217,6 +235,8 @@ class SmartHRTRCthLWNumber(SmartHRTBaseNumber):
 class SmartHRTRCthHWNumber(SmartHRTBaseNumber):
     """Entité number pour RCth high wind"""
 
+    _data_fields = frozenset({"rcth_hw"})
+
     def __init__(
         self, coordinator: SmartHRTCoordinator, config_entry: ConfigEntry
     ) -> None:
@@ -245,6 +265,8 @@ class SmartHRTRCthHWNumber(SmartHRTBaseNumber):
 class SmartHRTRPthLWNumber(SmartHRTBaseNumber):
     """Entité number pour RPth low wind"""
 
+    _data_fields = frozenset({"rpth_lw"})
+
     def __init__(
         self, coordinator: SmartHRTCoordinator, config_entry: ConfigEntry
     ) -> None:
@@ -273,6 +295,8 @@ class SmartHRTRPthLWNumber(SmartHRTBaseNumber):
 class SmartHRTRPthHWNumber(SmartHRTBaseNumber):
     """Entité number pour RPth high wind"""
 
+    _data_fields = frozenset({"rpth_hw"})
+
     def __init__(
         self, coordinator: SmartHRTCoordinator, config_entry: ConfigEntry
     ) -> None:
@@ -305,6 +329,8 @@ class SmartHRTRelaxationNumber(SmartHRTBaseNumber):
     Plus la valeur est élevée, plus l'apprentissage est lent mais stable.
     """
 
+    _data_fields = frozenset({"relaxation_factor"})
+
     def __init__(
         self, coordinator: SmartHRTCoordinator, config_entry: ConfigEntry
     ) -> None:
@@ -327,3 +353,71 @@ class SmartHRTRelaxationNumber(SmartHRTBaseNumber):
     async def async_set_native_value(self, value: float) -> None:
         _LOGGER.info("Relaxation factor changed to: %s", value)
         self._coordinator.set_relaxation_factor(value)
+
+
+class SmartHRTRecoveryStartToleranceNumber(SmartHRTBaseNumber):
+    """Entité number pour la tolérance de reprogrammation de la relance.
+
+    Un recalcul qui déplace l'heure de relance de moins de cette durée
+    conserve le déclencheur déjà armé.
+    """
+
+    _data_fields = frozenset({"recovery_start_tolerance"})
+
+    def __init__(
+        self, coordinator: SmartHRTCoordinator, config_entry: ConfigEntry
+    ) -> None:
+        super().__init__(coordinator, config_entry)
+        self._attr_name = "Tolérance de relance"
+        self._attr_unique_id = f"{self._device_id}_recovery_start_tolerance"
+        self._attr_native_min_value = 0.0
+        self._attr_native_max_value = RECOVERY_START_HYSTERESIS_MAX
+        self._attr_native_step = 0.5
+        self._attr_native_unit_of_measurement = UnitOfTime.MINUTES
+        self._attr_mode = NumberMode.BOX
+
+    @property
+    def native_value(self) -> float:
+        return self._coordinator.data.recovery_start_tolerance
+
+    @property
+    def icon(self) -> str | None:
+        return "mdi:timer-sand"
+
+    async def async_set_native_value(self, value: float) -> None:
+        _LOGGER.info("Recovery start tolerance changed to: %s", value)
+        self._coordinator.set_recovery_start_tolerance(value)
+
+
+class SmartHRTRecoveryStartFreezeNumber(SmartHRTBaseNumber):
+    """Entité number pour l'horizon de gel de la relance.
+
+    À moins de cette durée de son échéance, le déclencheur de relance armé
+    n'est plus reprogrammé.
+    """
+
+    _data_fields = frozenset({"recovery_start_freeze"})
+
+    def __init__(
+        self, coordinator: SmartHRTCoordinator, config_entry: ConfigEntry
+    ) -> None:
+        super().__init__(coordinator, config_entry)
+        self._attr_name = "Gel de la relance"
+        self._attr_unique_id = f"{self._device_id}_recovery_start_freeze"
+        self._attr_native_min_value = 0.0
+        self._attr_native_max_value = RECOVERY_START_HYSTERESIS_MAX
+        self._attr_native_step = 0.5
+        self._attr_native_unit_of_measurement = UnitOfTime.MINUTES
+        self._attr_mode = NumberMode.BOX
+
+    @property
+    def native_value(self) -> float:
+        return self._coordinator.data.recovery_start_freeze
+
+    @property
+    def icon(self) -> str | None:
+        return "mdi:timer-lock-outline"
+
+    async def async_set_native_value(self, value: float) -> None:
+        _LOGGER.info("Recovery start freeze changed to: %s", value)
+        self._coordinator.set_recovery_start_freeze(value)
@@ -0,0 +1,208 @@
+"""Moteur de calcul de relance partagé par toutes les instances SmartHRT.
+
+ADR implémentées dans ce module:
+- ADR-005: Calcul d'anticipation de la relance (solveur vectorisé)
+- ADR-007: Interpolation des coefficients selon le vent (vectorisée)
+
+Chaque coordinateur demande son recalcul au moteur au lieu de lancer son
+propre job dans l'exécuteur. Les demandes reçues pendant une courte fenêtre
+(RECOVERY_BATCH_WINDOW) sont évaluées ensemble, sous forme de tableaux
+NumPy, en une passe (sur la boucle ou dans un seul job de l'exécuteur selon
+le coût mesuré, cf. ComputeDispatcher), puis les résultats sont réécrits
+dans chaque coordinateur depuis la boucle d'événements, qui poursuit
+(_on_recovery_time_calculated). La fenêtre est mesurée par l'horloge du
+domaine (clock.py).
+
+Une demande n'est pas attendue: aucune tâche de Home Assistant ne reste
+suspendue à la fenêtre, comme avec le Debouncer de Home Assistant.
+"""
+
+import logging
+import time
+from typing import TYPE_CHECKING, Any
+
+import numpy as np
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+
+from .clock import Clock, async_get_clock
+from .const import (
+    DATA_RECOVERY_ENGINE,
+    DOMAIN,
+    RECOVERY_BATCH_WINDOW,
+    WIND_HIGH,
+    WIND_LOW,
+)
+from .dispatcher import ComputeDispatcher
+from .thermal import RecoverySolution
+from .thermal.vectorized import interpolate_wind, solve_recovery_durations
+
+if TYPE_CHECKING:
+    from .coordinator import RecoveryInputs, SmartHRTCoordinator
+
+_LOGGER = logging.getLogger(__name__)
+
+
+def _solve_batch(inputs: list["RecoveryInputs"]) -> list[RecoverySolution]:
+    """Évalue toutes les relances en une passe (boucle ou exécuteur)."""
+    columns = np.array(
+        [
+            (
+                i.tint,
+                i.text,
+                i.tsp,
+                i.wind_kmh,
+                i.rcth_lw,
+                i.rcth_hw,
+                i.rpth_lw,
+                i.rpth_hw,
+                i.time_remaining,
+                i.max_duration,
+                np.nan if i.initial is None else i.initial,
+            )
+            for i in inputs
+        ],
+        dtype=np.float64,
+    ).T
+    (
+        tint,
+        text,
+        tsp,
+        wind_kmh,
+        rcth_lw,
+        rcth_hw,
+        rpth_lw,
+        rpth_hw,
+        time_remaining,
+        max_duration,
+        initial,
+    ) = columns
+
+    solutions = solve_recovery_durations(
+        tint,
+        text,
+        tsp,
+        interpolate_wind(rcth_lw, rcth_hw, wind_kmh, WIND_LOW, WIND_HIGH),
+        interpolate_wind(rpth_lw, rpth_hw, wind_kmh, WIND_LOW, WIND_HIGH),
+        time_remaining,
+        max_duration,
+        initial,
+    )
+    return [
+        RecoverySolution(float(d), int(n), float(r), bool(c))
+        for d, n, r, c in zip(*solutions, strict=True)
+    ]
+
+
+class RecoveryBatchEngine:
+    """Regroupe les recalculs de relance de toutes les instances.
+
+    Une demande déjà en attente pour un coordinateur est partagée: les
+    entrées sont lues au moment de l'évaluation, pas de la demande.
+    Chaque coordinateur du lot reçoit sa solution puis poursuit, lot
+    par lot, dans l'ordre des demandes.
+    """
+
+    def __init__(self, hass: HomeAssistant, clock: Clock | None = None) -> None:
+        self._hass = hass
+        self._clock: Clock = clock if clock is not None else async_get_clock(hass)
+        # Coordinateurs en attente, dans l'ordre des demandes
+        self._pending: dict[SmartHRTCoordinator, None] = {}
+        # Annulation de la fin de fenêtre programmée
+        self._flush_handle: CALLBACK_TYPE | None = None
+        # Petits lots évalués sur la boucle, gros lots dans l'exécuteur
+        self._compute = ComputeDispatcher(hass)
+
+        # Statistiques (diagnostic)
+        self.batches = 0
+        self.evaluations = 0
+        self.max_batch_size = 0
+        self.last_batch_duration = 0.0  # secondes
+
+    @property
+    def stats(self) -> dict[str, Any]:
+        """Statistiques du moteur."""
+        return {
+            "batches": self.batches,
+            "evaluations": self.evaluations,
+            "max_batch_size": self.max_batch_size,
+            "last_batch_duration_ms": round(self.last_batch_duration * 1000, 3),
+            **self._compute.stats,
+        }
+
+    @callback
+    def async_request(self, coordinator: "SmartHRTCoordinator") -> None:
+        """Demande le recalcul de l'heure de relance d'un coordinateur.
+
+        La solution est écrite dans coordinator.data à la fin de la fenêtre,
+        puis coordinator._on_recovery_time_calculated est appelé.
+        """
+        if coordinator in self._pending:
+            return
+        self._pending[coordinator] = None
+        if self._flush_handle is None:
+            self._flush_handle = self._clock.async_call_later(
+                RECOVERY_BATCH_WINDOW, self._flush
+            )
+
+    @callback
+    def async_cancel(self, coordinator: "SmartHRTCoordinator") -> None:
+        """Retire la demande en attente d'un coordinateur (déchargement)."""
+        self._pending.pop(coordinator, None)
+
+    @callback
+    def _flush(self) -> None:
+        """Lance l'évaluation du lot en attente."""
+        self._flush_handle = None
+        pending, self._pending = self._pending, {}
+        if pending:
+            self._hass.async_create_task(self._async_run_batch(pending))
+
+    async def _async_run_batch(
+        self, pending: dict["SmartHRTCoordinator", None]
+    ) -> None:
+        """Évalue un lot puis réécrit les résultats dans chaque coordinateur."""
+        coordinators = list(pending)
+        inputs = [c._get_recovery_inputs() for c in coordinators]
+        start = time.perf_counter()
+        try:
+            solutions = await self._compute.async_run(
+                "recovery_batch", _solve_batch, inputs, weight=len(inputs)
+            )
+        except Exception:
+            _LOGGER.exception(
+                "Échec du lot de relance (%d instance(s))", len(coordinators)
+            )
+            return
+        self.last_batch_duration = time.perf_counter() - start
+
+        self.batches += 1
+        self.evaluations += len(coordinators)
+        self.max_batch_size = max(self.max_batch_size, len(coordinators))
+        _LOGGER.debug(
+            "Lot de relance évalué: %d instance(s) en %.3f ms",
+            len(coordinators),
+            self.last_batch_duration * 1000,
+        )
+
+        for coordinator, coordinator_inputs, solution in zip(
+            coordinators, inputs, solutions, strict=True
+        ):
+            coordinator._apply_recovery_solution(coordinator_inputs, solution)
+            coordinator._on_recovery_time_calculated()
+
+    @callback
+    def async_shutdown(self) -> None:
+        """Annule le lot en attente (déchargement de la dernière instance)."""
+        if self._flush_handle is not None:
+            self._flush_handle()
+            self._flush_handle = None
+        self._pending.clear()
+
+
+@callback
+def async_get_recovery_engine(hass: HomeAssistant) -> RecoveryBatchEngine:
+    """Retourne le moteur partagé, en le créant au premier appel."""
+    domain_data = hass.data.setdefault(DOMAIN, {})
+    if (engine := domain_data.get(DATA_RECOVERY_ENGINE)) is None:
+        engine = domain_data[DATA_RECOVERY_ENGINE] = RecoveryBatchEngine(hass)
+    return engine
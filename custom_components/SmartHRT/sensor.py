@@ -3,6 +3,11 @@
 ADR implémentées dans ce module:
 - ADR-012: Exposition entités pour Lovelace (sensors comme entités HA)
 - ADR-014: Format des dates en fuseau local (dt_util.as_local())
+
+Empreinte du recorder: les attributs statiques ou de diagnostic ne sont pas
+enregistrés (_unrecorded_attributes) et un état n'est réécrit que si ses
+attributs ont changé ou si sa valeur affichée (arrondie à
+suggested_display_precision) a changé.
 """
 
 import logging
@@ -28,7 +33,7 @@ from .const import (
     CONF_NAME,
     DATA_COORDINATOR,
 )
-from .coordinator import SmartHRTCoordinator
+from .coordinator import FIELD_CLOCK, SmartHRTCoordinator
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -63,6 +68,7 @@ async def async_setup_entry(
         SmartHRTTimeToRecoverySensor(coordinator, entry),
         SmartHRTStateSensor(coordinator, entry),
         SmartHRTInstanceInfoSensor(coordinator, entry),
+        SmartHRTComputeStatsSensor(coordinator, entry),
         # Sensors timestamp pour déclencheurs d'automatisations
         SmartHRTRecoveryStartTimestampSensor(coordinator, entry),
         SmartHRTTargetHourTimestampSensor(coordinator, entry),
@@ -75,6 +81,9 @@ async def async_setup_entry(
 class SmartHRTBaseSensor(SensorEntity):
     """Classe de base pour les sensors SmartHRT"""
 
+    # Champs de SmartHRTData dont dépend l'état de l'entité (None: tous);
+    # l'entité n'est réécrite que si l'un d'eux a changé
+    _data_fields: frozenset[str] | None = None
     _attr_name: str | None = None
     _attr_icon: str | None = None
     _attr_device_class: SensorDeviceClass | None = None
@@ -90,6 +99,8 @@ class SmartHRTBaseSensor(SensorEntity):
         self._device_id = config_entry.entry_id
         self._device_name = config_entry.data.get(CONF_NAME, "SmartHRT")
         self._attr_has_entity_name = True
+        # (valeur, attributs) de la dernière écriture par le coordinateur
+        self._last_written: tuple[Any, Any] | None = None
 
     @property
     def device_info(self) -> DeviceInfo:
@@ -110,7 +121,9 @@ class SmartHRTBaseSensor(SensorEntity):
     async def async_added_to_hass(self) -> None:
         """Callback appelé lorsque l'entité est ajoutée à HA"""
         await super().async_added_to_hass()
-        self._coordinator.register_listener(self._on_coordinator_update)
+        self._coordinator.register_listener(
+            self._on_coordinator_update, self._data_fields
+        )
 
     async def async_will_remove_from_hass(self) -> None:
         """Callback appelé lorsque l'entité est retirée de HA"""
@@ -119,9 +132,39 @@ class SmartHRTBaseSensor(SensorEntity):
 
     @callback
     def _on_coordinator_update(self) -> None:
-        """Callback lors d'une mise à jour du coordinateur"""
+        """Callback lors d'une mise à jour du coordinateur
+
+        L'écriture est supprimée si les attributs sont inchangés et si la
+        valeur affichée est la même qu'à la dernière écriture.
+        """
+        written = (self.native_value, self.extra_state_attributes)
+        if self._last_written is not None and self._displays_unchanged(written):
+            self._coordinator.suppressed_writes += 1
+            return
+        self._last_written = written
         self.async_write_ha_state()
 
+    def _displays_unchanged(self, written: tuple[Any, Any]) -> bool:
+        """Indique si l'état affiché est identique à la dernière écriture.
+
+        Avec suggested_display_precision, les valeurs numériques sont
+        comparées arrondies à cette précision: une variation invisible dans
+        l'interface n'est pas écrite.
+        """
+        value, attributes = written
+        last_value, last_attributes = self._last_written
+        if attributes != last_attributes:
+            return False
+        if value == last_value:
+            return True
+        precision = self.suggested_display_precision
+        return (
+            precision is not None
+            and isinstance(value, (int, float))
+            and isinstance(last_value, (int, float))
+            and round(value, precision) == round(last_value, precision)
+        )
+
 
 class SmartHRTTemperatureSensor(SmartHRTBaseSensor):
     """Classe de base pour les sensors de température"""
@@ -148,6 +191,8 @@ class SmartHRTTimestampSensor(SmartHRTBaseSensor):
 class SmartHRTInteriorTempSensor(SmartHRTTemperatureSensor):
     """Sensor de température intérieure"""
 
+    _data_fields = frozenset({"interior_temp"})
+    _attr_suggested_display_precision = 1
     _attr_name = "Température intérieure"
     _attr_icon = "mdi:home-thermometer"
 
@@ -165,6 +210,7 @@ class SmartHRTInteriorTempSensor(SmartHRTTemperatureSensor):
 class SmartHRTExteriorTempSensor(SmartHRTTemperatureSensor):
     """Sensor de température extérieure"""
 
+    _data_fields = frozenset({"exterior_temp"})
     _attr_name = "Température extérieure"
     _attr_icon = "mdi:thermometer"
 
@@ -182,6 +228,7 @@ class SmartHRTExteriorTempSensor(SmartHRTTemperatureSensor):
 class SmartHRTWindSpeedSensor(SmartHRTWindSensor):
     """Sensor de vitesse du vent"""
 
+    _data_fields = frozenset({"wind_speed"})
     _attr_name = "Vitesse du vent"
     _attr_native_unit_of_measurement = UnitOfSpeed.METERS_PER_SECOND
 
@@ -203,6 +250,7 @@ class SmartHRTWindSpeedSensor(SmartHRTWindSensor):
 class SmartHRTWindchillSensor(SmartHRTTemperatureSensor):
     """Sensor de température ressentie (windchill)"""
 
+    _data_fields = frozenset({"windchill"})
     _attr_name = "Température ressentie"
     _attr_icon = "mdi:snowflake-thermometer"
 
@@ -220,6 +268,16 @@ class SmartHRTWindchillSensor(SmartHRTTemperatureSensor):
 class SmartHRTRCthSensor(SmartHRTBaseSensor):
     """Sensor du coefficient RCth"""
 
+    _data_fields = frozenset(
+        {
+            "rcth",
+            "rcth_lw",
+            "rcth_hw",
+            "rcth_calculated",
+            "last_rcth_error",
+        }
+    )
+
     def __init__(
         self, coordinator: SmartHRTCoordinator, config_entry: ConfigEntry
     ) -> None:
@@ -257,6 +315,16 @@ class SmartHRTRCthSensor(SmartHRTBaseSensor):
 class SmartHRTRPthSensor(SmartHRTBaseSensor):
     """Sensor du coefficient RPth"""
 
+    _data_fields = frozenset(
+        {
+            "rpth",
+            "rpth_lw",
+            "rpth_hw",
+            "rpth_calculated",
+            "last_rpth_error",
+        }
+    )
+
     def __init__(
         self, coordinator: SmartHRTCoordinator, config_entry: ConfigEntry
     ) -> None:
@@ -294,6 +362,9 @@ class SmartHRTRPthSensor(SmartHRTBaseSensor):
 class SmartHRTRCthFastSensor(SmartHRTBaseSensor):
     """Sensor du coefficient RCth dynamique"""
 
+    _data_fields = frozenset({"rcth_fast"})
+    _attr_suggested_display_precision = 1
+
     def __init__(
         self, coordinator: SmartHRTCoordinator, config_entry: ConfigEntry
     ) -> None:
@@ -321,6 +392,7 @@ class SmartHRTRCthFastSensor(SmartHRTBaseSensor):
 class SmartHRTWindSpeedForecastSensor(SmartHRTWindSensor):
     """Sensor de prévision de vitesse du vent (moyenne sur 3h)"""
 
+    _data_fields = frozenset({"wind_speed_forecast_avg"})
     _attr_name = "Prévision vent"
     _attr_native_unit_of_measurement = "km/h"
 
@@ -338,6 +410,7 @@ class SmartHRTWindSpeedForecastSensor(SmartHRTWindSensor):
 class SmartHRTTemperatureForecastSensor(SmartHRTTemperatureSensor):
     """Sensor de prévision de température (moyenne sur 3h)"""
 
+    _data_fields = frozenset({"temperature_forecast_avg"})
     _attr_name = "Prévision température"
     _attr_icon = "mdi:thermometer"
 
@@ -355,6 +428,8 @@ class SmartHRTTemperatureForecastSensor(SmartHRTTemperatureSensor):
 class SmartHRTWindSpeedAvgSensor(SmartHRTWindSensor):
     """Sensor de vitesse du vent moyenne sur 4h"""
 
+    _data_fields = frozenset({"wind_speed_avg"})
+    _attr_suggested_display_precision = 1
     _attr_name = "Vent moyen (4h)"
     _attr_native_unit_of_measurement = UnitOfSpeed.METERS_PER_SECOND
 
@@ -376,6 +451,8 @@ class SmartHRTWindSpeedAvgSensor(SmartHRTWindSensor):
 class SmartHRTNightStateSensor(SmartHRTBaseSensor):
     """Sensor indiquant si c'est la nuit (soleil sous l'horizon)"""
 
+    _data_fields = frozenset({FIELD_CLOCK})
+
     def __init__(
         self, coordinator: SmartHRTCoordinator, config_entry: ConfigEntry
     ) -> None:
@@ -401,6 +478,8 @@ class SmartHRTNightStateSensor(SmartHRTBaseSensor):
 class SmartHRTRecoveryCalcModeSensor(SmartHRTBaseSensor):
     """Sensor indiquant le mode calcul de relance"""
 
+    _data_fields = frozenset({"recovery_calc_mode"})
+
     def __init__(
         self, coordinator: SmartHRTCoordinator, config_entry: ConfigEntry
     ) -> None:
@@ -420,6 +499,8 @@ class SmartHRTRecoveryCalcModeSensor(SmartHRTBaseSensor):
 class SmartHRTRPCalcModeSensor(SmartHRTBaseSensor):
     """Sensor indiquant le mode calcul RPth"""
 
+    _data_fields = frozenset({"rp_calc_mode"})
+
     def __init__(
         self, coordinator: SmartHRTCoordinator, config_entry: ConfigEntry
     ) -> None:
@@ -439,6 +520,8 @@ class SmartHRTRPCalcModeSensor(SmartHRTBaseSensor):
 class SmartHRTStopLagDurationSensor(SmartHRTBaseSensor):
     """Sensor de la durée de lag avant baisse de température"""
 
+    _data_fields = frozenset({"stop_lag_duration"})
+
     def __init__(
         self, coordinator: SmartHRTCoordinator, config_entry: ConfigEntry
     ) -> None:
@@ -466,6 +549,15 @@ class SmartHRTTimeToRecoverySensor(SmartHRTBaseSensor):
     ne doive démarrer selon le calcul de relance.
     """
 
+    _data_fields = frozenset(
+        {
+            FIELD_CLOCK,
+            "recovery_start_hour",
+            "last_rcth_error",
+            "last_rpth_error",
+        }
+    )
+
     def __init__(
         self, coordinator: SmartHRTCoordinator, config_entry: ConfigEntry
     ) -> None:
@@ -514,6 +606,16 @@ class SmartHRTStateSensor(SmartHRTBaseSensor):
     - heating_process: Montée en température (État 5)
     """
 
+    _data_fields = frozenset(
+        {
+            "current_state",
+            "recovery_calc_mode",
+            "rp_calc_mode",
+            "temp_lag_detection_active",
+        }
+    )
+    _unrecorded_attributes = frozenset({"state_label"})
+
     STATE_ICONS = {
         "heating_on": "mdi:radiator",
         "detecting_lag": "mdi:thermometer-minus",
@@ -565,6 +667,10 @@ class SmartHRTInstanceInfoSensor(SmartHRTBaseSensor):
     particulièrement quand plusieurs instances sont configurées.
     """
 
+    _data_fields: frozenset[str] = frozenset()  # Valeurs statiques
+    _unrecorded_attributes = frozenset(
+        {"entry_id", "instance_name", "config_title", "usage_example"}
+    )
     _attr_entity_category = EntityCategory.DIAGNOSTIC
 
     def __init__(
@@ -591,9 +697,68 @@ class SmartHRTInstanceInfoSensor(SmartHRTBaseSensor):
         }
 
 
+# Attributs du sensor de statistiques: (attribut, section de compute_stats, clé)
+COMPUTE_STATS_ATTRIBUTES = (
+    ("offloaded_calls", "coordinator", "offloaded_calls"),
+    ("engine_batches", "engine", "batches"),
+    ("engine_max_batch_size", "engine", "max_batch_size"),
+    ("engine_offloaded_calls", "engine", "offloaded_calls"),
+    ("forecast_fetches", "forecast_cache", "fetches"),
+    ("forecast_errors", "forecast_cache", "errors"),
+    ("triggers_fired", "triggers", "fired"),
+    ("recovery_start_rearms", "recovery_start", "rearms"),
+    ("storage_writes", "persistence", "writes"),
+    ("cycles_recorded", "persistence", "cycles_recorded"),
+    ("notification_flushes", "notifications", "flushes"),
+    ("suppressed_writes", "notifications", "suppressed_writes"),
+)
+
+
+class SmartHRTComputeStatsSensor(SmartHRTBaseSensor):
+    """Sensor de diagnostic sur l'exécution des calculs thermiques.
+
+    Compte les calculs exécutés directement sur la boucle d'événements et
+    ceux délégués à l'exécuteur (coût mesuré supérieur au budget). Les
+    compteurs repartent de zéro au redémarrage: pas de state_class, pour ne
+    pas fausser les statistiques long terme. Les attributs forment un
+    ensemble fixe (COMPUTE_STATS_ATTRIBUTES); le détail complet reste
+    disponible via coordinator.compute_stats.
+    """
+
+    _data_fields = frozenset({FIELD_CLOCK, "recovery_start_hour", "rcth_fast"})
+    _unrecorded_attributes = frozenset(
+        attribute for attribute, _, _ in COMPUTE_STATS_ATTRIBUTES
+    )
+    _attr_entity_category = EntityCategory.DIAGNOSTIC
+
+    def __init__(
+        self, coordinator: SmartHRTCoordinator, config_entry: ConfigEntry
+    ) -> None:
+        super().__init__(coordinator, config_entry)
+        self._attr_name = "Statistiques de calcul"
+        self._attr_icon = "mdi:chart-timeline-variant"
+        self._attr_unique_id = f"{self._device_id}_compute_stats"
+
+    @property
+    def native_value(self) -> int:
+        """Nombre de calculs exécutés sur la boucle d'événements."""
+        stats = self._coordinator.compute_stats
+        return stats["coordinator"]["inline_calls"] + stats["engine"]["inline_calls"]
+
+    @property
+    def extra_state_attributes(self) -> dict[str, Any]:
+        """Principaux compteurs de l'instance et des services partagés."""
+        stats = self._coordinator.compute_stats
+        return {
+            attribute: stats[section][key]
+            for attribute, section, key in COMPUTE_STATS_ATTRIBUTES
+        }
+
+
 class SmartHRTRecoveryStartTimestampSensor(SmartHRTTimestampSensor):
     """Sensor timestamp pour l'heure de relance (utilisable dans les automatisations)."""
 
+    _data_fields = frozenset({"recovery_start_hour"})
     _attr_name = "Heure de relance"
     _attr_icon = "mdi:clock-start"
 
@@ -614,6 +779,7 @@ class SmartHRTRecoveryStartTimestampSensor(SmartHRTTimestampSensor):
 class SmartHRTTargetHourTimestampSensor(SmartHRTTimestampSensor):
     """Sensor timestamp pour l'heure cible/réveil (utilisable dans les automatisations)."""
 
+    _data_fields = frozenset({FIELD_CLOCK, "target_hour"})
     _attr_name = "Heure cible (timestamp)"
     _attr_icon = "mdi:clock-end"
 
@@ -628,7 +794,7 @@ class SmartHRTTargetHourTimestampSensor(SmartHRTTimestampSensor):
         """Retourne le datetime de l'heure cible (timezone-aware)."""
         if self._coordinator.data.target_hour:
             # Créer un datetime pour aujourd'hui ou demain
-            now = dt_util.now()
+            now = self._coordinator.now()
             target_dt = now.replace(
                 hour=self._coordinator.data.target_hour.hour,
                 minute=self._coordinator.data.target_hour.minute,
@@ -645,6 +811,7 @@ class SmartHRTTargetHourTimestampSensor(SmartHRTTimestampSensor):
 class SmartHRTRecoveryCalcHourTimestampSensor(SmartHRTTimestampSensor):
     """Sensor timestamp pour l'heure de calcul/coupure chauffage (utilisable dans les automatisations)."""
 
+    _data_fields = frozenset({FIELD_CLOCK, "recoverycalc_hour"})
     _attr_name = "Heure coupure (timestamp)"
     _attr_icon = "mdi:clock-in"
 
@@ -659,7 +826,7 @@ class SmartHRTRecoveryCalcHourTimestampSensor(SmartHRTTimestampSensor):
         """Retourne le datetime de l'heure de coupure chauffage (timezone-aware)."""
         if self._coordinator.data.recoverycalc_hour:
             # Créer un datetime pour aujourd'hui ou demain
-            now = dt_util.now()
+            now = self._coordinator.now()
             calc_dt = now.replace(
                 hour=self._coordinator.data.recoverycalc_hour.hour,
                 minute=self._coordinator.data.recoverycalc_hour.minute,
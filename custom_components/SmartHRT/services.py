@@ -272,7 +272,7 @@ async def async_setup_services(hass: HomeAssistant) -> None:
             _LOGGER.error(error_msg)
             return {"success": False, "error": error_msg}
 
-        await hass.async_add_executor_job(coord.calculate_recovery_time)
+        coord.calculate_recovery_time()
         coord._notify_listeners()
 
         return {
@@ -0,0 +1,258 @@
+"""Stockage consolidé des données apprises de toutes les instances SmartHRT.
+
+ADR implémentées dans ce module:
+- ADR-004: Stratégie hybride de persistance (stockage des données apprises)
+- ADR-009: Persistance coefficients (Store)
+
+Au lieu d'un fichier .storage par instance, un seul document contient une
+section par entrée de configuration:
+- il est chargé une fois au démarrage, quelle que soit le nombre d'instances;
+- les sauvegardes des instances reçues pendant DOMAIN_STORE_DELAY (horloge
+  du domaine, cf. clock.py) sont écrites ensemble, en une seule écriture;
+- une instance sans section reprend son ancien fichier (migration), qui est
+  supprimé une fois le document consolidé écrit;
+- à l'inverse, une instance dont l'option a été désactivée reprend sa section
+  dans son fichier (async_load_entry_store);
+- le document est écrit à l'arrêt de Home Assistant et au déchargement de la
+  dernière instance.
+
+Chaque coordinateur accède à sa section via StoreSection, qui expose la même
+interface que Store (async_load, async_save).
+"""
+
+import asyncio
+import logging
+import os
+import time
+from typing import Any
+
+from homeassistant.const import EVENT_HOMEASSISTANT_FINAL_WRITE
+from homeassistant.core import CALLBACK_TYPE, Event, HomeAssistant, callback
+from homeassistant.helpers.json import json_bytes
+from homeassistant.helpers.storage import STORAGE_DIR, Store
+
+from .clock import Clock, async_get_clock
+from .const import DATA_DOMAIN_STORE, DOMAIN, DOMAIN_STORE_DELAY
+
+_LOGGER = logging.getLogger(__name__)
+
+DOMAIN_STORAGE_VERSION = 1
+DOMAIN_STORAGE_KEY = f"{DOMAIN}.learned_data"
+# Version des fichiers par instance (SmartHRTCoordinator.STORAGE_VERSION)
+ENTRY_STORAGE_VERSION = 1
+
+
+class DomainStore:
+    """Document unique des données apprises, une section par instance."""
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        delay: float = DOMAIN_STORE_DELAY,
+        clock: Clock | None = None,
+    ) -> None:
+        self._hass = hass
+        self._delay = delay
+        self._clock: Clock = clock if clock is not None else async_get_clock(hass)
+        self._store: Store = Store(
+            hass, DOMAIN_STORAGE_VERSION, DOMAIN_STORAGE_KEY
+        )
+        self._sections: dict[str, dict[str, Any]] = {}
+        self._load_task: asyncio.Task[None] | None = None
+        # Annulation de l'écriture différée programmée
+        self._save_handle: CALLBACK_TYPE | None = None
+        # Anciens fichiers repris, supprimés après l'écriture du document
+        self._migrated: list[Store] = []
+        self._unsub_final_write: CALLBACK_TYPE | None = (
+            hass.bus.async_listen_once(
+                EVENT_HOMEASSISTANT_FINAL_WRITE, self._async_on_final_write
+            )
+        )
+
+        # Statistiques (diagnostic)
+        self.loads = 0
+        self.migrations = 0
+        self.save_requests = 0
+        self.writes = 0
+        self.bytes_written = 0
+        self.last_write_duration = 0.0  # secondes
+
+    @property
+    def stats(self) -> dict[str, Any]:
+        """Statistiques du stockage consolidé."""
+        return {
+            "sections": len(self._sections),
+            "loads": self.loads,
+            "migrations": self.migrations,
+            "save_requests": self.save_requests,
+            "writes": self.writes,
+            "bytes_written": self.bytes_written,
+            "last_write_ms": round(self.last_write_duration * 1000, 1),
+            "pending": self._save_handle is not None,
+        }
+
+    def section(self, entry_id: str) -> "StoreSection":
+        """Accès à la section d'une instance."""
+        return StoreSection(self, entry_id)
+
+    async def _async_ensure_loaded(self) -> None:
+        """Charge le document une seule fois (demandes simultanées partagées)."""
+        if self._load_task is None:
+            self._load_task = self._hass.async_create_task(self._async_load())
+        await asyncio.shield(self._load_task)
+
+    async def _async_load(self) -> None:
+        document = await self._store.async_load()
+        self.loads += 1
+        if isinstance(document, dict) and isinstance(
+            entries := document.get("entries"), dict
+        ):
+            self._sections.update(entries)
+
+    async def async_load_entry(self, entry_id: str) -> dict[str, Any] | None:
+        """Retourne les données d'une instance, migrées si besoin."""
+        await self._async_ensure_loaded()
+        if (data := self._sections.get(entry_id)) is not None:
+            return data
+
+        legacy = self._legacy_store(entry_id)
+        data = await legacy.async_load()
+        if data is None:
+            return None
+        _LOGGER.info(
+            "Migrating learned data of %s to the consolidated store", entry_id
+        )
+        self._sections[entry_id] = data
+        self._migrated.append(legacy)
+        self.migrations += 1
+        self._schedule_save()
+        return data
+
+    @callback
+    def async_save_entry(self, entry_id: str, data: dict[str, Any]) -> None:
+        """Met à jour la section d'une instance; écriture groupée différée."""
+        self._sections[entry_id] = data
+        self.save_requests += 1
+        self._schedule_save()
+
+    async def async_pop_entry(self, entry_id: str) -> dict[str, Any] | None:
+        """Retire et retourne la section d'une instance (retour au fichier)."""
+        await self._async_ensure_loaded()
+        if (data := self._sections.pop(entry_id, None)) is not None:
+            self._schedule_save()
+        return data
+
+    async def async_remove_entry(self, entry_id: str) -> None:
+        """Supprime la section d'une instance retirée (et son ancien fichier)."""
+        await self._async_ensure_loaded()
+        if self._sections.pop(entry_id, None) is not None:
+            self._schedule_save()
+        await self._legacy_store(entry_id).async_remove()
+
+    def _legacy_store(self, entry_id: str) -> Store:
+        """Ancien fichier de stockage d'une instance."""
+        return Store(self._hass, ENTRY_STORAGE_VERSION, f"{DOMAIN}.{entry_id}")
+
+    @callback
+    def _schedule_save(self) -> None:
+        if self._save_handle is None:
+            self._save_handle = self._clock.async_call_later(
+                self._delay, self._flush
+            )
+
+    @callback
+    def _flush(self) -> None:
+        self._save_handle = None
+        self._hass.async_create_task(self.async_flush())
+
+    async def async_flush(self) -> None:
+        """Écrit le document maintenant, puis supprime les fichiers migrés."""
+        if self._save_handle is not None:
+            self._save_handle()
+            self._save_handle = None
+        if self._load_task is None:
+            return
+
+        document = {"entries": dict(self._sections)}
+        start = time.perf_counter()
+        await self._store.async_save(document)
+        self.last_write_duration = time.perf_counter() - start
+        self.writes += 1
+        self.bytes_written += len(json_bytes(document))
+
+        migrated, self._migrated = self._migrated, []
+        for legacy in migrated:
+            await legacy.async_remove()
+
+    async def _async_on_final_write(self, _event: Event) -> None:
+        """Écriture finale à l'arrêt de Home Assistant."""
+        self._unsub_final_write = None
+        if self._save_handle is not None or self._migrated:
+            await self.async_flush()
+
+    async def async_shutdown(self) -> None:
+        """Écrit les modifications en attente (dernière instance déchargée)."""
+        if self._unsub_final_write is not None:
+            self._unsub_final_write()
+            self._unsub_final_write = None
+        if self._save_handle is not None or self._migrated:
+            await self.async_flush()
+
+
+class StoreSection:
+    """Section d'une instance, avec l'interface de Store utilisée par le
+    coordinateur."""
+
+    def __init__(self, domain_store: DomainStore, entry_id: str) -> None:
+        self._domain_store = domain_store
+        self._entry_id = entry_id
+
+    async def async_load(self) -> dict[str, Any] | None:
+        return await self._domain_store.async_load_entry(self._entry_id)
+
+    async def async_save(self, data: dict[str, Any]) -> None:
+        self._domain_store.async_save_entry(self._entry_id, data)
+
+    async def async_remove(self) -> None:
+        await self._domain_store.async_remove_entry(self._entry_id)
+
+
+@callback
+def async_get_domain_store(hass: HomeAssistant) -> DomainStore:
+    """Retourne le stockage consolidé, en le créant au premier appel."""
+    domain_data = hass.data.setdefault(DOMAIN, {})
+    if (store := domain_data.get(DATA_DOMAIN_STORE)) is None:
+        store = domain_data[DATA_DOMAIN_STORE] = DomainStore(hass)
+    return store
+
+
+async def async_load_entry_store(
+    hass: HomeAssistant, store: Store, entry_id: str
+) -> dict[str, Any] | None:
+    """Charge le fichier d'une instance hors stockage consolidé.
+
+    Sans fichier, la section de l'instance dans le document consolidé (option
+    désactivée depuis) est reprise: écrite dans le fichier, puis retirée du
+    document.
+    """
+    data = await store.async_load()
+    if data is not None:
+        return data
+    domain_store = hass.data.get(DOMAIN, {}).get(DATA_DOMAIN_STORE)
+    if domain_store is None:
+        path = hass.config.path(STORAGE_DIR, DOMAIN_STORAGE_KEY)
+        if not await hass.async_add_executor_job(os.path.exists, path):
+            return None
+        domain_store = async_get_domain_store(hass)
+    data = await domain_store.async_pop_entry(entry_id)
+    if data is not None:
+        _LOGGER.info(
+            "Moving learned data of %s out of the consolidated store", entry_id
+        )
+        await store.async_save(data)
+    return data
+
+
+def cycle_history_path(hass: HomeAssistant, entry_id: str) -> str:
+    """Fichier d'historique des cycles d'une instance (à côté du stockage)."""
+    return hass.config.path(STORAGE_DIR, f"{DOMAIN}.{entry_id}.cycles")
@@ -46,6 +46,10 @@ async def async_setup_entry(
 class SmartHRTBaseSwitch(SwitchEntity):
     """Classe de base pour les switch SmartHRT"""
 
+    # Champs de SmartHRTData dont dépend l'état de l'entité (None: tous);
+    # l'entité n'est réécrite que si l'un d'eux a changé
+    _data_fields: frozenset[str] | None = None
+
     def __init__(
         self, coordinator: SmartHRTCoordinator, config_entry: ConfigEntry
     ) -> None:
@@ -70,7 +74,9 @@ class SmartHRTBaseSwitch(SwitchEntity):
     async def async_added_to_hass(self) -> None:
         """Callback appelé lorsque l'entité est ajoutée à HA"""
         await super().async_added_to_hass()
-        self._coordinator.register_listener(self._on_coordinator_update)
+        self._coordinator.register_listener(
+            self._on_coordinator_update, self._data_fields
+        )
 
     async def async_will_remove_from_hass(self) -> None:
         """Callback appelé lorsque l'entité est retirée de HA"""
@@ -90,6 +96,8 @@ class SmartHRTSmartHeatingSwitch(SmartHRTBaseSwitch):
     Quand désactivé, aucun calcul de relance n'est effectué.
     """
 
+    _data_fields = frozenset({"smartheating_mode"})
+
     def __init__(
         self, coordinator: SmartHRTCoordinator, config_entry: ConfigEntry
     ) -> None:
@@ -123,6 +131,8 @@ class SmartHRTAdaptiveSwitch(SmartHRTBaseSwitch):
     Quand activé, les RCth/RPth sont mis à jour après chaque cycle.
     """
 
+    _data_fields = frozenset({"recovery_adaptive_mode"})
+
     def __init__(
         self, coordinator: SmartHRTCoordinator, config_entry: ConfigEntry
     ) -> None:
@@ -0,0 +1,43 @@
+"""Modèle thermique SmartHRT indépendant de Home Assistant.
+
+Ce package ne contient que des calculs purs (aucun import homeassistant)
+afin de pouvoir être utilisé par le coordinateur comme par des outils
+hors ligne (benchmarks, analyses).
+"""
+
+from .history import CycleHistory, CycleRecord
+from .model import (
+    CoefficientUpdate,
+    interpolate_coefficient,
+    rcth_at_recovery_start,
+    rcth_fast,
+    recovery_duration,
+    recovery_update_delay,
+    relax_coefficients,
+    rpth_at_recovery_end,
+)
+from .rolling import RollingStats
+from .solver import (
+    RecoverySolution,
+    initial_recovery_duration,
+    solve_recovery_duration,
+)
+from .timeline import ForecastTimeline
+
+__all__ = [
+    "CoefficientUpdate",
+    "CycleHistory",
+    "CycleRecord",
+    "ForecastTimeline",
+    "RecoverySolution",
+    "RollingStats",
+    "initial_recovery_duration",
+    "interpolate_coefficient",
+    "rcth_at_recovery_start",
+    "rcth_fast",
+    "recovery_duration",
+    "recovery_update_delay",
+    "relax_coefficients",
+    "rpth_at_recovery_end",
+    "solve_recovery_duration",
+]
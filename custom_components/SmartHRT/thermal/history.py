@@ -0,0 +1,209 @@
+"""Historique des cycles de relance en fichier binaire circulaire.
+
+Chaque cycle terminé (coupure, début et fin de relance) est ajouté sous forme
+d'un enregistrement de taille fixe: instants, températures intérieures et
+extérieures, vent, coefficients calculés et erreurs d'apprentissage.
+
+Format du fichier:
+- un en-tête (signature, version, taille d'un enregistrement, capacité,
+  nombre total d'enregistrements ajoutés);
+- ``capacity + 1`` emplacements d'enregistrement, réutilisés en anneau:
+  l'enregistrement n occupe l'emplacement n % (capacity + 1) et seuls les
+  ``capacity`` plus récents sont conservés.
+
+L'emplacement de réserve reçoit toujours l'ajout en cours: un ajout n'écrase
+jamais un enregistrement conservé. Il écrit l'enregistrement puis l'en-tête
+qui le compte, si bien qu'une interruption entre les deux laisse
+l'historique dans son état précédent, anneau plein compris. La lecture
+passe par mmap et ne décode que les enregistrements (ou la colonne)
+parcourus, sans charger tout l'historique en objets Python.
+
+Toutes les opérations font des entrées/sorties bloquantes; le coordinateur
+les exécute dans l'exécuteur. Ce module n'importe rien de Home Assistant.
+"""
+
+import mmap
+import os
+import struct
+from array import array
+from collections.abc import Iterator
+from contextlib import contextmanager
+from typing import NamedTuple
+
+MAGIC = b"SHCY"
+HISTORY_VERSION = 2
+# Signature, version, réservé, taille d'un enregistrement, capacité, ajouts
+_HEADER = struct.Struct("<4sBBHIQ")
+# Instants (float64, epoch en secondes) puis mesures (float32)
+_RECORD = struct.Struct("<3d13f")
+
+
+class CycleRecord(NamedTuple):
+    """Un cycle de relance terminé (instants en secondes epoch, NaN si absent)."""
+
+    time_recovery_calc: float
+    time_recovery_start: float
+    time_recovery_end: float
+    temp_recovery_calc: float
+    temp_recovery_start: float
+    temp_recovery_end: float
+    text_recovery_calc: float
+    text_recovery_start: float
+    text_recovery_end: float
+    wind_speed_avg: float  # m/s
+    rcth_calculated: float
+    rpth_calculated: float
+    last_rcth_error: float
+    last_rpth_error: float
+    rcth: float  # coefficients après apprentissage
+    rpth: float
+
+
+# Position et format de chaque champ dans un enregistrement (lecture par colonne)
+_FIELDS: dict[str, tuple[int, struct.Struct]] = {
+    name: (
+        (8 * index, struct.Struct("<d"))
+        if index < 3
+        else (24 + 4 * (index - 3), struct.Struct("<f"))
+    )
+    for index, name in enumerate(CycleRecord._fields)
+}
+
+
+class CycleHistory:
+    """Fichier d'historique des cycles d'une instance.
+
+    La capacité n'est utilisée qu'à la création du fichier: un fichier
+    existant conserve la sienne.
+    """
+
+    def __init__(self, path: str, capacity: int) -> None:
+        if capacity < 1:
+            raise ValueError("capacity must be at least 1")
+        self._path = path
+        self._capacity = capacity
+        # Nombre total d'ajouts, lu dans l'en-tête au premier accès
+        self._appended: int | None = None
+
+    @property
+    def path(self) -> str:
+        return self._path
+
+    def __len__(self) -> int:
+        """Nombre d'enregistrements conservés."""
+        self._ensure_loaded()
+        return min(self._appended, self._capacity)
+
+    @property
+    def appended(self) -> int:
+        """Nombre total de cycles ajoutés, y compris ceux écrasés."""
+        self._ensure_loaded()
+        return self._appended
+
+    def _ensure_loaded(self) -> None:
+        """Lit l'en-tête, ou crée le fichier vide s'il n'existe pas.
+
+        Lève ValueError si le fichier existant n'est pas un historique valide.
+        """
+        if self._appended is not None:
+            return
+        try:
+            with open(self._path, "rb") as file:
+                header = file.read(_HEADER.size)
+        except FileNotFoundError:
+            os.makedirs(os.path.dirname(self._path) or ".", exist_ok=True)
+            with open(self._path, "wb") as file:
+                file.write(_pack_header(self._capacity, 0))
+            self._appended = 0
+            return
+        self._capacity, self._appended = _parse_header(header)
+
+    def append(self, record: CycleRecord) -> None:
+        """Ajoute un cycle, en écrasant le plus ancien si l'anneau est plein."""
+        self._ensure_loaded()
+        appended = self._appended + 1
+        with open(self._path, "r+b") as file:
+            file.seek(_record_offset(self._appended, self._capacity))
+            file.write(_RECORD.pack(*record))
+            file.flush()
+            os.fsync(file.fileno())
+            file.seek(0)
+            file.write(_pack_header(self._capacity, appended))
+        self._appended = appended
+
+    def records(self, last: int | None = None) -> Iterator[CycleRecord]:
+        """Cycles conservés, du plus ancien au plus récent.
+
+        Avec ``last``, seulement les ``last`` plus récents. Le fichier reste
+        projeté en mémoire jusqu'à la fin de l'itération.
+        """
+        with _mapped(self._path) as view:
+            for offset in _record_offsets(view, last):
+                yield CycleRecord._make(_RECORD.unpack_from(view, offset))
+
+    def column(self, name: str, last: int | None = None) -> array:
+        """Valeurs d'un champ de CycleRecord, du plus ancien au plus récent."""
+        if name not in _FIELDS:
+            raise ValueError(f"unknown cycle field {name}")
+        field_offset, field = _FIELDS[name]
+        values = array("d")
+        with _mapped(self._path) as view:
+            for offset in _record_offsets(view, last):
+                values.append(field.unpack_from(view, offset + field_offset)[0])
+        return values
+
+    def remove(self) -> None:
+        """Supprime le fichier d'historique."""
+        try:
+            os.remove(self._path)
+        except FileNotFoundError:
+            pass
+        self._appended = None
+
+
+def _pack_header(capacity: int, appended: int) -> bytes:
+    return _HEADER.pack(MAGIC, HISTORY_VERSION, 0, _RECORD.size, capacity, appended)
+
+
+def _parse_header(data: bytes) -> tuple[int, int]:
+    """Retourne (capacité, ajouts); lève ValueError si l'en-tête est invalide."""
+    try:
+        magic, version, _, record_size, capacity, appended = _HEADER.unpack_from(data)
+    except struct.error as err:
+        raise ValueError(f"invalid cycle history header: {err}") from err
+    if magic != MAGIC or version != HISTORY_VERSION or record_size != _RECORD.size:
+        raise ValueError("unsupported cycle history file")
+    if capacity < 1:
+        raise ValueError("invalid cycle history capacity")
+    return capacity, appended
+
+
+@contextmanager
+def _mapped(path: str) -> Iterator[mmap.mmap | None]:
+    """Projection en lecture seule du fichier (None s'il n'existe pas)."""
+    try:
+        file = open(path, "rb")
+    except FileNotFoundError:
+        yield None
+        return
+    with file, mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as view:
+        yield view
+
+
+def _record_offsets(view: mmap.mmap | None, last: int | None) -> Iterator[int]:
+    """Positions des enregistrements conservés, du plus ancien au plus récent."""
+    if view is None:
+        return
+    capacity, appended = _parse_header(view)
+    count = min(appended, capacity)
+    if last is not None:
+        count = min(count, max(last, 0))
+    if len(view) < _HEADER.size + min(appended, capacity + 1) * _RECORD.size:
+        raise ValueError("truncated cycle history file")
+    for index in range(appended - count, appended):
+        yield _record_offset(index, capacity)
+
+
+def _record_offset(index: int, capacity: int) -> int:
+    """Position du n-ième enregistrement ajouté (emplacement de réserve inclus)."""
+    return _HEADER.size + (index % (capacity + 1)) * _RECORD.size
@@ -0,0 +1,195 @@
+"""Modèle thermique: estimateurs, interpolation vent et apprentissage.
+
+Fonctions pures extraites de SmartHRTCoordinator: elles reçoivent des
+entrées explicites (températures en °C, durées en heures, vent en km/h) et
+retournent leur résultat, sans lire d'état ni l'heure courante. Le
+coordinateur se charge de rassembler les entrées et d'appliquer les
+résultats; les outils hors ligne (rejeu, analyses) les appellent directement.
+
+- ADR-005: durée de relance (solveur, voir solver.py) et cadence de mise à
+  jour du calcul
+- ADR-006: estimation de RCth/RPth sur un cycle et apprentissage par
+  relaxation
+- ADR-007: interpolation des coefficients selon le vent
+
+Ce module n'importe rien de Home Assistant.
+"""
+
+import math
+from typing import NamedTuple
+
+from .solver import RecoverySolution, solve_recovery_duration
+
+# Bornes des coefficients thermiques (heures)
+COEFFICIENT_MIN = 0.1
+COEFFICIENT_MAX = 19999
+
+
+class CoefficientUpdate(NamedTuple):
+    """Coefficients après un pas d'apprentissage (ADR-006)."""
+
+    low: float  # coefficient vent faible
+    high: float  # coefficient vent fort
+    value: float  # coefficient global
+    error: float  # mesuré - interpolé, avant mise à jour
+
+
+def interpolate_coefficient(
+    low: float, high: float, wind_kmh: float, wind_low: float, wind_high: float
+) -> float:
+    """Interpole un coefficient selon le vent (ADR-007).
+
+    ``low`` s'applique jusqu'à ``wind_low`` km/h, ``high`` à partir de
+    ``wind_high`` km/h, avec une interpolation linéaire entre les deux.
+    """
+    wind_clamped = max(wind_low, min(wind_high, wind_kmh))
+    ratio = (wind_high - wind_clamped) / (wind_high - wind_low)
+    return max(COEFFICIENT_MIN, high + (low - high) * ratio)
+
+
+def recovery_duration(
+    tint: float,
+    text: float,
+    tsp: float,
+    wind_kmh: float,
+    rcth_lw: float,
+    rcth_hw: float,
+    rpth_lw: float,
+    rpth_hw: float,
+    time_remaining: float,
+    max_duration: float,
+    wind_low: float,
+    wind_high: float,
+    initial: float | None = None,
+) -> RecoverySolution:
+    """Durée de relance avec les coefficients interpolés selon le vent."""
+    return solve_recovery_duration(
+        tint,
+        text,
+        tsp,
+        interpolate_coefficient(rcth_lw, rcth_hw, wind_kmh, wind_low, wind_high),
+        interpolate_coefficient(rpth_lw, rpth_hw, wind_kmh, wind_low, wind_high),
+        time_remaining,
+        max_duration,
+        initial,
+    )
+
+
+def recovery_update_delay(time_remaining: float) -> float:
+    """Délai (s) avant la prochaine mise à jour du calcul de relance.
+
+    ``time_remaining`` est le temps (s) avant le début de la relance: le
+    calcul est refait au tiers de ce temps, au plus tard dans 20 minutes, et
+    à moins de 30 minutes de la relance seulement une heure plus tard.
+    """
+    if time_remaining < 1800:
+        return 3600
+    return min(max(time_remaining / 3, 0), 1200)
+
+
+def rcth_fast(
+    tint: float,
+    text: float,
+    tint_off: float,
+    text_off: float,
+    elapsed_hours: float,
+) -> float | None:
+    """RCth instantané depuis la coupure du chauffage.
+
+    ``tint_off``/``text_off`` sont les températures à la coupure. Retourne
+    None tant que la décroissance ne permet pas d'estimation.
+    """
+    if elapsed_hours < 0:
+        elapsed_hours += 24
+    avg_text = (text_off + text) / 2
+    if not avg_text < tint < tint_off:
+        return None
+    try:
+        return elapsed_hours / max(
+            0.0001, math.log((avg_text - tint_off) / (avg_text - tint))
+        )
+    except (ValueError, ZeroDivisionError):
+        return None
+
+
+def rcth_at_recovery_start(
+    elapsed_hours: float,
+    temp_recovery_calc: float,
+    temp_recovery_start: float,
+    text_recovery_calc: float,
+    text_recovery_start: float,
+) -> float | None:
+    """RCth mesuré sur le refroidissement, de la coupure au début de relance."""
+    avg_text = (text_recovery_start + text_recovery_calc) / 2
+    try:
+        return min(
+            COEFFICIENT_MAX,
+            elapsed_hours
+            / math.log(
+                (avg_text - temp_recovery_calc) / (avg_text - temp_recovery_start)
+            ),
+        )
+    except (ValueError, ZeroDivisionError):
+        return None
+
+
+def rpth_at_recovery_end(
+    elapsed_hours: float,
+    temp_recovery_start: float,
+    temp_recovery_end: float,
+    text_recovery_start: float,
+    text_recovery_end: float,
+    rcth: float,
+) -> float | None:
+    """RPth mesuré sur la relance, avec le RCth interpolé au vent actuel."""
+    avg_text = (text_recovery_start + text_recovery_end) / 2
+    try:
+        exp_term = math.exp(elapsed_hours / rcth)
+        numerator = (avg_text - temp_recovery_end) * exp_term - (
+            avg_text - temp_recovery_start
+        )
+        return min(
+            COEFFICIENT_MAX, max(COEFFICIENT_MIN, numerator / (1 - exp_term))
+        )
+    except (ValueError, ZeroDivisionError, OverflowError):
+        return None
+
+
+def relax_coefficients(
+    low: float,
+    high: float,
+    value: float,
+    calculated: float,
+    wind_kmh: float,
+    relaxation: float,
+    wind_low: float,
+    wind_high: float,
+    value_max: float = math.inf,
+) -> CoefficientUpdate:
+    """Pas d'apprentissage par relaxation (ADR-006).
+
+    L'écart entre le coefficient mesuré sur le cycle et le coefficient
+    interpolé au vent du cycle est réparti entre les coefficients vent
+    faible/fort selon un polynôme en vent, puis chaque coefficient est
+    rapproché de sa nouvelle estimation avec le facteur ``relaxation`` (pas
+    d'oscillation d'une nuit à l'autre). ``value_max`` borne le coefficient
+    global.
+    """
+    x = (wind_kmh - wind_low) / (wind_high - wind_low) - 0.5
+    interpol = max(COEFFICIENT_MIN, low + (high - low) * (x + 0.5))
+    err = calculated - interpol
+
+    low_new = max(
+        COEFFICIENT_MIN, low + err * (1 - 5 / 3 * x - 2 * x * x + 8 / 3 * x * x * x)
+    )
+    high_new = max(
+        COEFFICIENT_MIN, high + err * (1 + 5 / 3 * x - 2 * x * x - 8 / 3 * x * x * x)
+    )
+
+    low_relaxed = min(COEFFICIENT_MAX, (low + relaxation * low_new) / (1 + relaxation))
+    high_relaxed = min(low_relaxed, (high + relaxation * high_new) / (1 + relaxation))
+    value_relaxed = min(
+        value_max,
+        max(COEFFICIENT_MIN, (value + relaxation * calculated) / (1 + relaxation)),
+    )
+    return CoefficientUpdate(low_relaxed, high_relaxed, value_relaxed, err)
@@ -0,0 +1,263 @@
+"""Statistiques glissantes en temps constant (ADR-013).
+
+Les derniers échantillons sont conservés dans un anneau préalloué de
+``array('d')`` (valeurs et instants), avec somme, somme des carrés et
+intégrale temporelle tenues à jour à chaque ajout: moyenne, variance et
+moyenne pondérée par le temps ne parcourent jamais l'historique.
+
+La moyenne pondérée par le temps considère chaque valeur constante jusqu'à
+l'échantillon suivant; elle reste juste lorsque les échantillons arrivent à
+intervalles irréguliers, par exemple seulement quand la valeur change. Avec
+``max_age``, elle porte sur les ``max_age`` dernières secondes: les
+échantillons sortis de la fenêtre sont évincés au fil de l'eau, sans tâche
+périodique. Avec ``resolution``, un échantillon arrivant moins de
+``resolution`` secondes après le précédent remplace sa valeur: la fenêtre
+garde au plus un échantillon par pas, quel que soit le rythme des
+changements, et ``max_age / resolution + 1`` places suffisent à la couvrir.
+
+La fenêtre se sérialise en binaire compact (ADR-013): un en-tête (version,
+instant de base, nombre d'échantillons) suivi des décalages en secondes
+(uint32) puis des valeurs (float32), soit 8 octets par échantillon.
+
+Ce module n'importe rien de Home Assistant.
+"""
+
+import struct
+from array import array
+from collections.abc import Iterator
+
+# Format sérialisé: version, instant de base (s), nombre d'échantillons
+PACK_VERSION = 1
+_HEADER = struct.Struct("<BdH")
+
+
+class RollingStats:
+    """Fenêtre glissante des ``capacity`` derniers échantillons."""
+
+    def __init__(
+        self,
+        capacity: int,
+        track_variance: bool = False,
+        max_age: float | None = None,
+        resolution: float | None = None,
+    ) -> None:
+        if capacity < 1:
+            raise ValueError("capacity must be at least 1")
+        self._capacity = capacity
+        self._track_variance = track_variance
+        self._max_age = max_age
+        self._resolution = resolution
+        self._values = array("d", bytes(8 * capacity))
+        self._times = array("d", bytes(8 * capacity))
+        self._start = 0  # indice du plus ancien échantillon
+        self._count = 0
+
+        self._sum = 0.0
+        self._sum_sq = 0.0
+        # Intégrale des valeurs sur les intervalles fermés (entre échantillons)
+        self._weighted_sum = 0.0
+        self._duration = 0.0
+        # Ajouts depuis le dernier recalcul exact (limite la dérive flottante)
+        self._updates = 0
+
+    def __len__(self) -> int:
+        return self._count
+
+    def __bool__(self) -> bool:
+        return self._count > 0
+
+    def __iter__(self) -> Iterator[float]:
+        """Valeurs, de la plus ancienne à la plus récente."""
+        for i in range(self._count):
+            yield self._values[(self._start + i) % self._capacity]
+
+    @property
+    def capacity(self) -> int:
+        return self._capacity
+
+    def items(self) -> Iterator[tuple[float, float]]:
+        """Couples (timestamp, valeur), du plus ancien au plus récent."""
+        for i in range(self._count):
+            index = (self._start + i) % self._capacity
+            yield self._times[index], self._values[index]
+
+    def append(self, value: float, timestamp: float) -> None:
+        """Ajoute un échantillon (timestamp en secondes).
+
+        L'instant vient de l'appelant (horloge du coordinateur): ce module ne
+        lit jamais l'heure. Le plus ancien échantillon est évincé lorsque la
+        fenêtre est pleine. À moins de ``resolution`` secondes du précédent,
+        l'échantillon remplace la valeur de celui-ci.
+        """
+        capacity = self._capacity
+
+        self.expire(timestamp)
+        if self._resolution is not None and self._count:
+            last = (self._start + self._count - 1) % capacity
+            if timestamp - self._times[last] < self._resolution:
+                self._replace(last, value)
+                return
+        if self._count == capacity:
+            self._evict_oldest()
+
+        if self._count:
+            last = (self._start + self._count - 1) % capacity
+            elapsed = max(timestamp - self._times[last], 0.0)
+            self._weighted_sum += self._values[last] * elapsed
+            self._duration += elapsed
+
+        index = (self._start + self._count) % capacity
+        self._values[index] = value
+        self._times[index] = timestamp
+        self._count += 1
+        self._sum += value
+        if self._track_variance:
+            self._sum_sq += value * value
+
+        self._updates += 1
+        if self._updates >= capacity:
+            self._resync()
+
+    def to_bytes(self) -> bytes:
+        """Sérialise la fenêtre (instants à la seconde, valeurs en float32)."""
+        count = min(self._count, 0xFFFF)
+        samples = list(self.items())[-count:] if count else []
+        base = samples[0][0] if samples else 0.0
+        offsets = [min(max(round(t - base), 0), 0xFFFFFFFF) for t, _ in samples]
+        values = [value for _, value in samples]
+        return _HEADER.pack(PACK_VERSION, base, count) + struct.pack(
+            f"<{count}I{count}f", *offsets, *values
+        )
+
+    def load_bytes(self, data: bytes, not_before: float | None = None) -> int:
+        """Remplace le contenu par une fenêtre sérialisée par to_bytes().
+
+        Les échantillons antérieurs à ``not_before`` sont ignorés. Retourne le
+        nombre d'échantillons restaurés; lève ValueError si data est invalide.
+        """
+        try:
+            version, base, count = _HEADER.unpack_from(data)
+            if version != PACK_VERSION:
+                raise ValueError(f"unsupported version {version}")
+            unpacked = struct.unpack_from(f"<{count}I{count}f", data, _HEADER.size)
+        except struct.error as err:
+            raise ValueError(f"invalid rolling window data: {err}") from err
+
+        self.clear()
+        for offset, value in zip(unpacked[:count], unpacked[count:], strict=True):
+            timestamp = base + offset
+            if not_before is None or timestamp >= not_before:
+                self.append(value, timestamp)
+        return self._count
+
+    def expire(self, now: float) -> None:
+        """Évince les échantillons remplacés avant le début de la fenêtre.
+
+        Le plus ancien échantillon conservé peut précéder le début de la
+        fenêtre: sa valeur y est encore en vigueur (cf. time_weighted_mean).
+        """
+        if self._max_age is None:
+            return
+        cutoff = now - self._max_age
+        capacity = self._capacity
+        while self._count > 1 and self._times[(self._start + 1) % capacity] <= cutoff:
+            self._evict_oldest()
+
+    def _replace(self, index: int, value: float) -> None:
+        """Remplace la valeur du plus récent échantillon (intervalle ouvert)."""
+        previous = self._values[index]
+        self._values[index] = value
+        self._sum += value - previous
+        if self._track_variance:
+            self._sum_sq += value * value - previous * previous
+
+    def _evict_oldest(self) -> None:
+        """Retire le plus ancien échantillon et sa contribution."""
+        capacity = self._capacity
+        oldest = self._start
+        value = self._values[oldest]
+        self._sum -= value
+        if self._track_variance:
+            self._sum_sq -= value * value
+        if self._count > 1:
+            following = (oldest + 1) % capacity
+            elapsed = max(self._times[following] - self._times[oldest], 0.0)
+            self._weighted_sum -= value * elapsed
+            self._duration -= elapsed
+        self._start = (oldest + 1) % capacity
+        self._count -= 1
+
+    def _resync(self) -> None:
+        """Recalcule exactement les sommes courantes (coût amorti constant)."""
+        self._updates = 0
+        total = total_sq = weighted = duration = 0.0
+        previous: tuple[float, float] | None = None
+        for timestamp, value in self.items():
+            total += value
+            total_sq += value * value
+            if previous is not None:
+                elapsed = max(timestamp - previous[0], 0.0)
+                weighted += previous[1] * elapsed
+                duration += elapsed
+            previous = (timestamp, value)
+        self._sum = total
+        self._sum_sq = total_sq if self._track_variance else 0.0
+        self._weighted_sum = weighted
+        self._duration = duration
+
+    def clear(self) -> None:
+        """Vide la fenêtre."""
+        self._start = 0
+        self._count = 0
+        self._sum = self._sum_sq = self._weighted_sum = self._duration = 0.0
+        self._updates = 0
+
+    @property
+    def last(self) -> float | None:
+        """Valeur la plus récente, None si vide."""
+        if not self._count:
+            return None
+        return self._values[(self._start + self._count - 1) % self._capacity]
+
+    @property
+    def mean(self) -> float | None:
+        """Moyenne arithmétique des échantillons, None si vide."""
+        if not self._count:
+            return None
+        return self._sum / self._count
+
+    @property
+    def variance(self) -> float | None:
+        """Variance (population) des échantillons, None si vide ou non suivie."""
+        if not self._count or not self._track_variance:
+            return None
+        mean = self._sum / self._count
+        return max(self._sum_sq / self._count - mean * mean, 0.0)
+
+    def time_weighted_mean(self, now: float | None = None) -> float | None:
+        """Moyenne pondérée par la durée de validité de chaque valeur.
+
+        Si ``now`` est donné, la dernière valeur compte jusqu'à cet instant et,
+        avec ``max_age``, la moyenne porte sur [now - max_age, now].
+        Sans durée mesurable (un seul échantillon), retourne la moyenne.
+        """
+        if now is not None:
+            self.expire(now)
+        if not self._count:
+            return None
+        weighted = self._weighted_sum
+        duration = self._duration
+        if now is not None:
+            last = (self._start + self._count - 1) % self._capacity
+            elapsed = max(now - self._times[last], 0.0)
+            weighted += self._values[last] * elapsed
+            duration += elapsed
+            if self._max_age is not None:
+                # Part du plus ancien échantillon antérieure à la fenêtre
+                before = now - self._max_age - self._times[self._start]
+                if before > 0 and self._count > 1:
+                    weighted -= self._values[self._start] * before
+                    duration -= before
+        if duration <= 0:
+            return self._sum / self._count
+        return weighted / duration
@@ -0,0 +1,126 @@
+"""Solveur de la durée de relance (ADR-005).
+
+La durée de relance ``d`` (en heures) est le point fixe de:
+
+    tint_start(d) = text + (tint - text) * exp(-(T - d) / rcth)
+    ratio(d)      = (rpth + text - tint_start(d)) / (rpth + text - tsp)
+    d             = clamp(rcth * log(ratio(d)), 0, max_duration)
+
+où ``T`` est le temps restant avant l'heure cible. Le script YAML d'origine
+approche ce point fixe par 20 itérations amorties ``d = (d + 2 * g(d)) / 3``.
+Ce module le résout par la méthode de Newton avec dérivée analytique, un
+critère d'arrêt sur le résidu et un démarrage à chaud optionnel (solution
+de la nuit précédente).
+
+Ce module n'importe rien de Home Assistant.
+"""
+
+import math
+from typing import NamedTuple
+
+# Seuil de ratio en dessous duquel le YAML ne met plus à jour la durée
+RATIO_MIN = 0.1
+
+# Tolérance par défaut sur le résidu (heures, soit ~4 ms)
+DEFAULT_TOLERANCE = 1e-6
+DEFAULT_MAX_ITERATIONS = 20
+
+
+class RecoverySolution(NamedTuple):
+    """Résultat du solveur de durée de relance."""
+
+    duration: float  # heures
+    iterations: int
+    residual: float  # |d - clamp(g(d))| en heures
+    converged: bool
+
+
+def initial_recovery_duration(
+    tint: float, text: float, tsp: float, rcth: float, rpth: float, max_duration: float
+) -> float:
+    """Estimation initiale du YAML (sans refroidissement jusqu'à la relance)."""
+    try:
+        ratio = (rpth + text - tint) / (rpth + text - tsp)
+        return min(max(rcth * math.log(max(ratio, RATIO_MIN)), 0), max_duration)
+    except (ValueError, ZeroDivisionError):
+        return max_duration
+
+
+def solve_recovery_duration(
+    tint: float,
+    text: float,
+    tsp: float,
+    rcth: float,
+    rpth: float,
+    time_remaining: float,
+    max_duration: float,
+    initial: float | None = None,
+    tolerance: float = DEFAULT_TOLERANCE,
+    max_iterations: int = DEFAULT_MAX_ITERATIONS,
+) -> RecoverySolution:
+    """Résout la durée de relance par Newton projeté sur [0, max_duration].
+
+    Args:
+        tint: Température intérieure actuelle (°C)
+        text: Température extérieure prévue (°C)
+        tsp: Consigne à atteindre à l'heure cible (°C)
+        rcth: Constante de refroidissement interpolée (h)
+        rpth: Constante de chauffe interpolée (°C)
+        time_remaining: Temps restant avant l'heure cible (h)
+        max_duration: Durée de relance maximale autorisée (h)
+        initial: Estimation de départ (ex: durée de la nuit précédente);
+            ignorée si hors de [0, max_duration]
+        tolerance: Résidu en dessous duquel le calcul s'arrête (h)
+        max_iterations: Nombre maximal d'itérations de Newton
+
+    Returns:
+        La durée de relance, le nombre d'itérations et le résidu final.
+    """
+    denominator = rpth + text - tsp
+    # Consigne hors d'atteinte (rpth + text <= tsp): F n'est plus monotone,
+    # on conserve alors la relaxation amortie du YAML, démarrée à froid
+    newton = denominator > 0
+
+    duration = initial_recovery_duration(tint, text, tsp, rcth, rpth, max_duration)
+    previous: float | None = None
+    if newton and initial is not None and 0 <= initial <= max_duration:
+        duration, previous = initial, duration
+
+    iteration = 0
+    residual = math.inf
+    try:
+        for iteration in range(max_iterations + 1):
+            tint_start = text + (tint - text) * math.exp(
+                (duration - time_remaining) / rcth
+            )
+            ratio = (rpth + text - tint_start) / denominator
+            if ratio <= RATIO_MIN:
+                if previous is None:
+                    # Comme le YAML: la durée courante n'est plus mise à jour
+                    return RecoverySolution(duration, iteration, residual, False)
+                # Pas trop long: repli à mi-chemin du dernier point valide
+                duration = (duration + previous) / 2
+                continue
+
+            # F(d) = d - rcth * log(ratio(d)) est strictement croissante: sa racine
+            # projetée sur [0, max_duration] est le point fixe borné du YAML
+            raw = rcth * math.log(ratio)
+            target = min(max(raw, 0.0), max_duration)
+            residual = abs(duration - target)
+            if residual <= tolerance or iteration == max_iterations:
+                break
+
+            if not newton:
+                duration = (duration + 2 * target) / 3
+                continue
+
+            # d(rcth * log(ratio))/dd = -(tint_start - text) / (rpth + text - tint_start)
+            slope = -(tint_start - text) / (rpth + text - tint_start)
+            previous = duration
+            duration = min(
+                max(duration - (duration - raw) / (1 - slope), 0.0), max_duration
+            )
+    except (ValueError, ZeroDivisionError, OverflowError):
+        return RecoverySolution(duration, iteration, math.inf, False)
+
+    return RecoverySolution(duration, iteration, residual, residual <= tolerance)
@@ -0,0 +1,104 @@
+"""Série temporelle de prévisions avec moyennes sur fenêtre en temps constant.
+
+Une prévision horaire est conservée sous forme de tableaux parallèles
+(instants, valeurs, intégrales cumulées). Chaque valeur est supposée
+constante jusqu'à l'instant suivant, la dernière sur un pas de plus. La
+moyenne sur une fenêtre quelconque se déduit de deux intégrales cumulées,
+au lieu de parcourir la série: les recalculs de la nuit peuvent ainsi
+évaluer le modèle sur la fenêtre réelle (refroidissement puis relance).
+
+Avant le premier instant et après le dernier pas, la série est prolongée
+par sa première et sa dernière valeur.
+
+Ce module n'importe rien de Home Assistant.
+"""
+
+from array import array
+from bisect import bisect_right
+from collections.abc import Iterable
+from itertools import pairwise
+
+# Pas supposé pour une série d'un seul point (secondes)
+DEFAULT_STEP = 3600.0
+
+
+class ForecastTimeline:
+    """Série horaire d'une grandeur prévue (température, vent...)."""
+
+    def __init__(self, points: Iterable[tuple[float, float]]) -> None:
+        """Construit la série à partir de couples (timestamp en s, valeur).
+
+        Les points sont triés; un instant en double garde la dernière valeur.
+        """
+        merged = dict(sorted(points))
+        self._times = array("d", merged)
+        self._values = array("d", merged.values())
+        count = len(self._times)
+
+        steps = [b - a for a, b in pairwise(self._times)]
+        self._step = steps[-1] if steps else DEFAULT_STEP
+        # Série régulière (cas usuel): indexation directe, sans recherche
+        self._regular = all(step == self._step for step in steps)
+
+        # _integral[i]: intégrale de la série du premier instant à _times[i],
+        # le dernier élément couvrant le pas final
+        self._integral = array("d", [0.0]) * (count + 1) if count else array("d")
+        for i in range(count):
+            step = steps[i] if i < count - 1 else self._step
+            self._integral[i + 1] = self._integral[i] + self._values[i] * step
+
+    def __len__(self) -> int:
+        return len(self._times)
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, ForecastTimeline):
+            return NotImplemented
+        return self._times == other._times and self._values == other._values
+
+    @property
+    def start(self) -> float | None:
+        """Premier instant de la série (timestamp), None si vide."""
+        return self._times[0] if self._times else None
+
+    @property
+    def end(self) -> float | None:
+        """Fin du dernier pas de la série (timestamp), None si vide."""
+        return self._times[-1] + self._step if self._times else None
+
+    def _index(self, timestamp: float) -> int:
+        """Indice du pas contenant timestamp (borné à la série)."""
+        last = len(self._times) - 1
+        if self._regular:
+            index = int((timestamp - self._times[0]) // self._step)
+        else:
+            index = bisect_right(self._times, timestamp) - 1
+        return min(max(index, 0), last)
+
+    def _cumulative(self, timestamp: float) -> float:
+        """Intégrale de la série entre le premier instant et timestamp."""
+        if timestamp <= self._times[0]:
+            return self._values[0] * (timestamp - self._times[0])
+        if timestamp >= self.end:
+            return self._integral[-1] + self._values[-1] * (timestamp - self.end)
+        index = self._index(timestamp)
+        return self._integral[index] + self._values[index] * (
+            timestamp - self._times[index]
+        )
+
+    def value_at(self, timestamp: float) -> float | None:
+        """Valeur prévue à un instant, None si la série est vide."""
+        if not self._times:
+            return None
+        return self._values[self._index(timestamp)]
+
+    def mean(self, start: float, end: float) -> float | None:
+        """Moyenne temporelle de la série sur [start, end].
+
+        Retourne None si la série est vide; la valeur à start si la fenêtre
+        est vide.
+        """
+        if not self._times:
+            return None
+        if end <= start:
+            return self.value_at(start)
+        return (self._cumulative(end) - self._cumulative(start)) / (end - start)
@@ -0,0 +1,136 @@
+"""Version vectorisée (NumPy) du solveur de durée de relance.
+
+Évalue en une seule passe les relances de plusieurs instances: chaque
+argument est un tableau (une valeur par instance) et le résultat reprend
+élément par élément la logique de ``solver.solve_recovery_duration``.
+
+Ce module n'importe rien de Home Assistant mais requiert NumPy; il n'est
+donc pas réexporté par ``thermal/__init__.py``.
+"""
+
+from typing import NamedTuple
+
+import numpy as np
+from numpy.typing import ArrayLike, NDArray
+
+from .solver import DEFAULT_MAX_ITERATIONS, DEFAULT_TOLERANCE, RATIO_MIN
+
+
+class RecoverySolutions(NamedTuple):
+    """Résultats du solveur vectorisé (un élément par instance)."""
+
+    duration: NDArray[np.float64]  # heures
+    iterations: NDArray[np.int64]
+    residual: NDArray[np.float64]  # heures
+    converged: NDArray[np.bool_]
+
+
+def interpolate_wind(
+    low: ArrayLike,
+    high: ArrayLike,
+    wind_kmh: ArrayLike,
+    wind_low: float,
+    wind_high: float,
+) -> NDArray[np.float64]:
+    """Interpole les coefficients selon le vent (ADR-007), élément par élément."""
+    wind_clamped = np.clip(np.asarray(wind_kmh, dtype=np.float64), wind_low, wind_high)
+    ratio = (wind_high - wind_clamped) / (wind_high - wind_low)
+    low = np.asarray(low, dtype=np.float64)
+    high = np.asarray(high, dtype=np.float64)
+    return np.maximum(0.1, high + (low - high) * ratio)
+
+
+def solve_recovery_durations(
+    tint: ArrayLike,
+    text: ArrayLike,
+    tsp: ArrayLike,
+    rcth: ArrayLike,
+    rpth: ArrayLike,
+    time_remaining: ArrayLike,
+    max_duration: ArrayLike,
+    initial: ArrayLike | None = None,
+    tolerance: float = DEFAULT_TOLERANCE,
+    max_iterations: int = DEFAULT_MAX_ITERATIONS,
+) -> RecoverySolutions:
+    """Résout les durées de relance de toutes les instances en parallèle.
+
+    Les arguments ont la même signification que pour
+    ``solve_recovery_duration``; ``initial`` accepte NaN pour les instances
+    sans démarrage à chaud. Les éléments convergés sont figés pendant que
+    les autres poursuivent leurs itérations.
+    """
+    tint, text, tsp, rcth, rpth, time_remaining, max_duration = np.broadcast_arrays(
+        *(
+            np.asarray(value, dtype=np.float64)
+            for value in (tint, text, tsp, rcth, rpth, time_remaining, max_duration)
+        )
+    )
+    size = tint.shape
+
+    with np.errstate(all="ignore"):
+        denominator = rpth + text - tsp
+        newton = denominator > 0
+        invalid = denominator == 0
+
+        # Estimation initiale du YAML (durée maximale si dénominateur nul)
+        cold = np.clip(
+            rcth * np.log(np.maximum((rpth + text - tint) / denominator, RATIO_MIN)),
+            0.0,
+            max_duration,
+        )
+        duration = np.where(invalid, max_duration, cold)
+        previous = np.full(size, np.nan)
+        if initial is not None:
+            initial = np.broadcast_to(np.asarray(initial, dtype=np.float64), size)
+            warm = newton & (initial >= 0) & (initial <= max_duration)
+            duration = np.where(warm, initial, duration)
+            previous = np.where(warm, cold, previous)
+
+        active = ~invalid
+        iterations = np.zeros(size, dtype=np.int64)
+        residual = np.full(size, np.inf)
+        converged = np.zeros(size, dtype=np.bool_)
+
+        for iteration in range(max_iterations + 1):
+            if not active.any():
+                break
+
+            tint_start = text + (tint - text) * np.exp(
+                (duration - time_remaining) / rcth
+            )
+            ratio = (rpth + text - tint_start) / denominator
+            blocked = active & ~(ratio > RATIO_MIN)
+
+            # Comme le YAML: sans point valide antérieur la durée reste figée
+            stuck = blocked & np.isnan(previous)
+            iterations[stuck] = iteration
+            active &= ~stuck
+            retreat = blocked & ~stuck
+            duration = np.where(retreat, (duration + previous) / 2, duration)
+
+            valid = active & ~blocked
+            raw = rcth * np.log(ratio)
+            target = np.clip(raw, 0.0, max_duration)
+            residual = np.where(valid, np.abs(duration - target), residual)
+
+            done = valid & (residual <= tolerance)
+            if iteration == max_iterations:
+                done = active.copy()
+            iterations[done] = iteration
+            converged |= done & (residual <= tolerance)
+            active &= ~done
+
+            step = valid & ~done
+            damped = step & ~newton
+            duration = np.where(damped, (duration + 2 * target) / 3, duration)
+
+            step &= newton
+            slope = -(tint_start - text) / (rpth + text - tint_start)
+            previous = np.where(step, duration, previous)
+            duration = np.where(
+                step,
+                np.clip(duration - (duration - raw) / (1 - slope), 0.0, max_duration),
+                duration,
+            )
+
+    return RecoverySolutions(duration, iterations, residual, converged)
@@ -0,0 +1,206 @@
+"""Horloge partagée par toutes les instances SmartHRT.
+
+Au lieu d'un async_track_time_interval par instance et par cadence, un seul
+minuteur par cadence exécute les callbacks inscrits par les coordinateurs.
+Le lot est découpé en tranches de TICK_CHUNK_SIZE callbacks, chacune dans sa
+propre itération de la boucle d'événements: un tick de centaines d'instances
+ne monopolise jamais la boucle d'un seul tenant. La durée d'exécution de
+chaque tick (somme des tranches) est mesurée.
+
+Les ticks sont programmés par l'horloge du domaine (clock.py): ils suivent
+le temps virtuel d'une ScaledClock ou de l'horloge manuelle des tests. Chaque
+tick vise une échéance absolue, multiple de la période depuis l'epoch (ex:
+chaque minute pile): le retard d'un tick ne décale pas les suivants. Après
+un retard de plus d'une période, les échéances dépassées sont sautées au
+lieu d'être rattrapées en rafale.
+"""
+
+import logging
+import time
+from collections.abc import Callable
+from datetime import datetime, timedelta
+from typing import Any
+
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+
+from .clock import Clock, async_get_clock
+from .const import DATA_TICK_SERVICE, DOMAIN, TICK_CHUNK_SIZE
+
+_LOGGER = logging.getLogger(__name__)
+
+TickCallback = Callable[[datetime], None]
+
+
+class _Cadence:
+    """Minuteur d'une cadence et callbacks inscrits."""
+
+    def __init__(self) -> None:
+        # Ensemble ordonné (ordre d'inscription, appartenance en O(1))
+        self.callbacks: dict[TickCallback, None] = {}
+        self.unsub_timer: CALLBACK_TYPE | None = None
+        # Échéance absolue du prochain tick
+        self.deadline: datetime | None = None
+
+        # Statistiques (diagnostic)
+        self.ticks = 0
+        self.skipped = 0
+        self.chunks = 0
+        self.errors = 0
+        self.last_tick_duration = 0.0  # secondes
+        self.max_tick_duration = 0.0
+        self.total_tick_duration = 0.0
+
+    @property
+    def stats(self) -> dict[str, Any]:
+        return {
+            "callbacks": len(self.callbacks),
+            "ticks": self.ticks,
+            "skipped": self.skipped,
+            "chunks": self.chunks,
+            "errors": self.errors,
+            "last_tick_ms": round(self.last_tick_duration * 1000, 3),
+            "max_tick_ms": round(self.max_tick_duration * 1000, 3),
+            "avg_tick_ms": (
+                round(self.total_tick_duration / self.ticks * 1000, 3)
+                if self.ticks
+                else None
+            ),
+        }
+
+
+class TickService:
+    """Un minuteur par cadence pour toutes les instances."""
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        chunk_size: int = TICK_CHUNK_SIZE,
+        clock: Clock | None = None,
+    ) -> None:
+        self._hass = hass
+        self._chunk_size = chunk_size
+        self._clock: Clock = clock if clock is not None else async_get_clock(hass)
+        self._cadences: dict[timedelta, _Cadence] = {}
+
+    @property
+    def stats(self) -> dict[str, Any]:
+        """Statistiques par cadence (clé: période en secondes)."""
+        return {
+            str(int(interval.total_seconds())): cadence.stats
+            for interval, cadence in self._cadences.items()
+        }
+
+    @callback
+    def async_register(
+        self, interval: timedelta, action: TickCallback
+    ) -> CALLBACK_TYPE:
+        """Inscrit un callback appelé à chaque tick de la cadence.
+
+        Le minuteur de la cadence est créé à la première inscription et
+        arrêté à la dernière désinscription. Retourne la fonction de
+        désinscription.
+        """
+        cadence = self._cadences.get(interval)
+        if cadence is None:
+            cadence = self._cadences[interval] = _Cadence()
+        if cadence.unsub_timer is None:
+            self._async_schedule(cadence, interval)
+        cadence.callbacks[action] = None
+
+        @callback
+        def _unregister() -> None:
+            cadence.callbacks.pop(action, None)
+            if not cadence.callbacks and cadence.unsub_timer is not None:
+                cadence.unsub_timer()
+                cadence.unsub_timer = None
+                cadence.deadline = None
+
+        return _unregister
+
+    @callback
+    def _async_schedule(self, cadence: _Cadence, interval: timedelta) -> None:
+        """Programme le prochain tick de la cadence à son échéance absolue.
+
+        L'échéance suit la précédente d'une période; si elle est déjà passée
+        (première inscription, retard de plus d'une période), c'est le
+        prochain multiple de la période après maintenant.
+        """
+        now = self._clock.now()
+        deadline = cadence.deadline
+        if deadline is not None:
+            deadline += interval
+        if deadline is None or deadline <= now:
+            if deadline is not None:
+                cadence.skipped += (now - deadline) // interval + 1
+            period = interval.total_seconds()
+            aligned = (now.timestamp() // period + 1) * period
+            deadline = datetime.fromtimestamp(aligned, now.tzinfo)
+        cadence.deadline = deadline
+
+        @callback
+        def _tick(_now: datetime) -> None:
+            self._async_tick(cadence, interval)
+
+        cadence.unsub_timer = self._clock.async_track_point_in_time(_tick, deadline)
+
+    @callback
+    def _async_tick(self, cadence: _Cadence, interval: timedelta) -> None:
+        """Début d'un tick: réarme le minuteur, exécute la première tranche."""
+        self._async_schedule(cadence, interval)
+        now = self._clock.now()
+        cadence.ticks += 1
+        cadence.last_tick_duration = 0.0
+        self._async_run_chunk(cadence, list(cadence.callbacks), 0, now)
+
+    @callback
+    def _async_run_chunk(
+        self,
+        cadence: _Cadence,
+        callbacks: list[TickCallback],
+        offset: int,
+        now: datetime,
+    ) -> None:
+        """Exécute une tranche, puis programme la suivante."""
+        start = time.perf_counter()
+        for action in callbacks[offset : offset + self._chunk_size]:
+            # Une instance désinscrite entre deux tranches est ignorée
+            if action not in cadence.callbacks:
+                continue
+            try:
+                action(now)
+            except Exception:  # noqa: BLE001 - n'interrompt pas les autres
+                cadence.errors += 1
+                _LOGGER.exception("Error in tick callback %s", action)
+        cadence.chunks += 1
+        cadence.last_tick_duration += time.perf_counter() - start
+
+        offset += self._chunk_size
+        if offset < len(callbacks):
+            self._hass.loop.call_soon(
+                self._async_run_chunk, cadence, callbacks, offset, now
+            )
+            return
+
+        cadence.total_tick_duration += cadence.last_tick_duration
+        cadence.max_tick_duration = max(
+            cadence.max_tick_duration, cadence.last_tick_duration
+        )
+
+    @callback
+    def async_shutdown(self) -> None:
+        """Arrête les minuteurs (déchargement de la dernière instance)."""
+        for cadence in self._cadences.values():
+            if cadence.unsub_timer is not None:
+                cadence.unsub_timer()
+                cadence.unsub_timer = None
+            cadence.callbacks.clear()
+        self._cadences.clear()
+
+
+@callback
+def async_get_tick_service(hass: HomeAssistant) -> TickService:
+    """Retourne l'horloge partagée, en la créant au premier appel."""
+    domain_data = hass.data.setdefault(DOMAIN, {})
+    if (service := domain_data.get(DATA_TICK_SERVICE)) is None:
+        service = domain_data[DATA_TICK_SERVICE] = TickService(hass)
+    return service
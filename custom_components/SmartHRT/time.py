@@ -48,6 +48,10 @@ async def async_setup_entry(
 class SmartHRTBaseTime(TimeEntity):
     """Classe de base pour les entités time SmartHRT"""
 
+    # Champs de SmartHRTData dont dépend l'état de l'entité (None: tous);
+    # l'entité n'est réécrite que si l'un d'eux a changé
+    _data_fields: frozenset[str] | None = None
+
     def __init__(
         self, coordinator: SmartHRTCoordinator, config_entry: ConfigEntry
     ) -> None:
@@ -72,7 +76,9 @@ class SmartHRTBaseTime(TimeEntity):
     async def async_added_to_hass(self) -> None:
         """Callback appelé lorsque l'entité est ajoutée à HA"""
         await super().async_added_to_hass()
-        self._coordinator.register_listener(self._on_coordinator_update)
+        self._coordinator.register_listener(
+            self._on_coordinator_update, self._data_fields
+        )
 
     async def async_will_remove_from_hass(self) -> None:
         """Callback appelé lorsque l'entité est retirée de HA"""
@@ -88,6 +94,8 @@ class SmartHRTBaseTime(TimeEntity):
 class SmartHRTTargetHourTime(SmartHRTBaseTime):
     """Entité time pour l'heure cible (réveil)"""
 
+    _data_fields = frozenset({"target_hour"})
+
     def __init__(
         self, coordinator: SmartHRTCoordinator, config_entry: ConfigEntry
     ) -> None:
@@ -113,6 +121,8 @@ class SmartHRTTargetHourTime(SmartHRTBaseTime):
 class SmartHRTRecoveryCalcHourTime(SmartHRTBaseTime):
     """Entité time pour l'heure de coupure chauffage (soir)"""
 
+    _data_fields = frozenset({"recoverycalc_hour"})
+
     def __init__(
         self, coordinator: SmartHRTCoordinator, config_entry: ConfigEntry
     ) -> None:
@@ -138,6 +148,8 @@ class SmartHRTRecoveryCalcHourTime(SmartHRTBaseTime):
 class SmartHRTRecoveryStartTime(SmartHRTBaseTime):
     """Entité time pour l'heure de relance (lecture seule)"""
 
+    _data_fields = frozenset({"recovery_start_hour"})
+
     def __init__(
         self, coordinator: SmartHRTCoordinator, config_entry: ConfigEntry
     ) -> None:
@@ -0,0 +1,93 @@
+"""Déclencheurs horaires d'une instance SmartHRT, un par type.
+
+Chaque déclencheur (heure de coupure, heure cible, début de relance, mise à
+jour du calcul...) occupe un emplacement nommé: le programmer annule et
+remplace le précédent du même type, et un déclencheur exécuté libère son
+emplacement. Le nombre de minuteurs en attente reste ainsi borné par le
+nombre de types, quelle que soit la durée de fonctionnement.
+
+Les minuteurs sont créés par l'horloge du coordinateur (clock.Clock): heure
+réelle par défaut, temps accéléré en préproduction.
+"""
+
+from collections.abc import Callable
+from datetime import datetime
+from typing import Any
+
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+
+from .clock import Clock, RealClock
+
+TriggerAction = Callable[[datetime], None]
+
+
+class TriggerRegistry:
+    """Déclencheurs ponctuels indexés par type."""
+
+    def __init__(self, hass: HomeAssistant, clock: Clock | None = None) -> None:
+        self._hass = hass
+        self._clock: Clock = clock if clock is not None else RealClock(hass)
+        # type -> (instant programmé, annulation du minuteur)
+        self._slots: dict[str, tuple[datetime, CALLBACK_TYPE]] = {}
+
+        # Statistiques (diagnostic)
+        self.scheduled = 0
+        self.replaced = 0
+        self.fired = 0
+        self.cancelled = 0
+
+    @property
+    def armed(self) -> int:
+        """Nombre de minuteurs en attente."""
+        return len(self._slots)
+
+    @property
+    def stats(self) -> dict[str, Any]:
+        """Déclencheurs armés et compteurs."""
+        return {
+            "armed": self.armed,
+            "slots": {key: when.isoformat() for key, (when, _) in self._slots.items()},
+            "scheduled": self.scheduled,
+            "replaced": self.replaced,
+            "fired": self.fired,
+            "cancelled": self.cancelled,
+        }
+
+    def scheduled_time(self, key: str) -> datetime | None:
+        """Instant programmé pour un type de déclencheur, None si aucun."""
+        slot = self._slots.get(key)
+        return slot[0] if slot else None
+
+    @callback
+    def async_schedule(self, key: str, action: TriggerAction, when: datetime) -> None:
+        """Programme action à l'instant when, en remplaçant le précédent."""
+        if (previous := self._slots.pop(key, None)) is not None:
+            previous[1]()
+            self.replaced += 1
+
+        @callback
+        def _fire(now: datetime) -> None:
+            # Libère l'emplacement s'il n'a pas été réattribué entre-temps
+            if self._slots.get(key, (None, None))[1] is unsub:
+                del self._slots[key]
+            self.fired += 1
+            action(now)
+
+        unsub = self._clock.async_track_point_in_time(_fire, when)
+        self._slots[key] = (when, unsub)
+        self.scheduled += 1
+
+    @callback
+    def async_cancel(self, key: str) -> bool:
+        """Annule le déclencheur d'un type; retourne False s'il n'y en avait pas."""
+        if (slot := self._slots.pop(key, None)) is None:
+            return False
+        slot[1]()
+        self.cancelled += 1
+        return True
+
+    @callback
+    def async_cancel_all(self) -> None:
+        """Annule tous les déclencheurs."""
+        for key in list(self._slots):
+            self.async_cancel(key)
@@ -0,0 +1,97 @@
+"""Horloge virtuelle avancée à la main pour les tests et le rejeu.
+
+ManualClock implémente le protocole Clock de l'intégration (clock.py): le
+temps ne s'écoule que par async_advance / async_advance_to, qui exécutent
+les minuteurs échus dans l'ordre de leurs instants (ordre de programmation à
+instant égal). Après chaque minuteur, hass.async_block_till_done() laisse
+Home Assistant terminer le travail lancé avant le minuteur suivant.
+
+Aucune tâche de l'intégration n'attend un minuteur de l'horloge (le moteur
+de relance poursuit par rappel, cf. recovery_engine.py): les seuls signaux
+nécessaires sont les minuteurs en attente et async_block_till_done. Aucune
+attente réelle, résultat reproductible.
+"""
+
+import heapq
+from collections.abc import Callable
+from datetime import datetime, timedelta
+from itertools import count
+
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.util import dt as dt_util
+
+ClockAction = Callable[[datetime], None]
+DelayAction = Callable[[], None]
+
+
+class ManualClock:
+    """Temps virtuel avancé explicitement (tests, rejeu).
+
+    À appeler hors des tâches de Home Assistant (test, script de rejeu):
+    async_block_till_done attend toutes les tâches suivies.
+    """
+
+    def __init__(self, hass: HomeAssistant, start: datetime | None = None) -> None:
+        self._hass = hass
+        self._now = dt_util.as_local(start if start is not None else dt_util.now())
+        self._sequence = count()
+        # (instant, numéro de programmation, action); annulés: hors _pending
+        self._timers: list[tuple[datetime, int, DelayAction]] = []
+        self._pending: set[int] = set()
+
+        # Statistiques (diagnostic)
+        self.scheduled = 0
+        self.fired = 0
+
+    def now(self) -> datetime:
+        return self._now
+
+    @property
+    def next_timer(self) -> datetime | None:
+        """Instant du prochain minuteur en attente, None s'il n'y en a pas."""
+        while self._timers and self._timers[0][1] not in self._pending:
+            heapq.heappop(self._timers)
+        return self._timers[0][0] if self._timers else None
+
+    @callback
+    def async_track_point_in_time(
+        self, action: ClockAction, when: datetime
+    ) -> CALLBACK_TYPE:
+        return self._add(when, lambda: action(self._now))
+
+    @callback
+    def async_call_later(self, delay: float, action: DelayAction) -> CALLBACK_TYPE:
+        return self._add(self._now + timedelta(seconds=delay), action)
+
+    def _add(self, when: datetime, action: DelayAction) -> CALLBACK_TYPE:
+        sequence = next(self._sequence)
+        heapq.heappush(self._timers, (when, sequence, action))
+        self._pending.add(sequence)
+        self.scheduled += 1
+
+        @callback
+        def _cancel() -> None:
+            self._pending.discard(sequence)
+
+        return _cancel
+
+    async def async_advance(self, delta: timedelta | float) -> None:
+        """Avance de delta (timedelta ou secondes)."""
+        if not isinstance(delta, timedelta):
+            delta = timedelta(seconds=delta)
+        await self.async_advance_to(self._now + delta)
+
+    async def async_advance_to(self, when: datetime) -> None:
+        """Avance jusqu'à when en exécutant les minuteurs échus dans l'ordre."""
+        await self._hass.async_block_till_done()
+        while (due := self.next_timer) is not None and due <= when:
+            self._fire_next()
+            await self._hass.async_block_till_done()
+        self._now = max(self._now, dt_util.as_local(when))
+
+    def _fire_next(self) -> None:
+        due, sequence, action = heapq.heappop(self._timers)
+        self._pending.discard(sequence)
+        self._now = max(self._now, dt_util.as_local(due))
+        self.fired += 1
+        action()
@@ -0,0 +1,135 @@
+"""Cœur Home Assistant minimal pour les tests (et les benchmarks).
+
+Démarre un cœur Home Assistant réel dans un répertoire de configuration
+temporaire, sans serveur HTTP ni intégrations superflues:
+- registres chargés comme au démarrage (async_load_base_functionality);
+- intégration chargée par le loader de Home Assistant depuis ce dépôt
+  (paquet ``custom_components.SmartHRT``, la racine du dépôt étant dans
+  sys.path): les tests partagent les modules chargés par Home Assistant;
+- entité météo de substitution (état ``weather.test``) et service
+  ``weather.get_forecasts`` renvoyant 24 prévisions horaires;
+- capteurs de température intérieure de substitution
+  (``sensor.test_tint_N``).
+
+Les entrées sont créées par le config flow de l'intégration (étapes user
+puis sensors): création de l'entrée, async_setup_entry, plateformes et
+entités suivent exactement le chemin de production.
+"""
+
+import shutil
+import tempfile
+from datetime import timedelta
+from typing import Any
+
+from homeassistant import config_entries, loader
+from homeassistant.bootstrap import async_load_base_functionality
+from homeassistant.core import HomeAssistant, ServiceCall, SupportsResponse
+from homeassistant.data_entry_flow import FlowResultType
+from homeassistant.helpers import config_validation as cv
+from homeassistant.util import dt as dt_util
+
+from custom_components.SmartHRT.const import DOMAIN
+
+WEATHER_ENTITY = "weather.test"
+FORECAST_HOURS = 24
+
+
+def interior_sensor(index: int) -> str:
+    return f"sensor.test_tint_{index}"
+
+
+async def async_start_hass(time_zone: str = "Europe/Paris") -> HomeAssistant:
+    """Démarre un cœur Home Assistant avec l'intégration disponible."""
+    hass = HomeAssistant(tempfile.mkdtemp(prefix="smarthrt-test-"))
+    await hass.config.async_set_time_zone(time_zone)
+    hass.config.skip_pip = True
+    loader.async_setup(hass)
+    hass.config_entries = config_entries.ConfigEntries(hass, {})
+    # Registres, stockage interne et config entries, comme au démarrage
+    await async_load_base_functionality(hass)
+    # Résout l'intégration (manifeste, plateformes) avant les entrées
+    await loader.async_get_integration(hass, DOMAIN)
+
+    set_weather(hass, temperature=4.0, wind_speed=15.0)
+
+    async def get_forecasts(call: ServiceCall) -> dict[str, Any]:
+        now = dt_util.now().replace(minute=0, second=0, microsecond=0)
+        return {
+            entity_id: {
+                "forecast": [
+                    {
+                        "datetime": (now + timedelta(hours=hour)).isoformat(),
+                        "temperature": 4.0 - 0.2 * hour,
+                        "wind_speed": 15.0,
+                    }
+                    for hour in range(FORECAST_HOURS)
+                ]
+            }
+            for entity_id in cv.ensure_list(call.data.get("entity_id", WEATHER_ENTITY))
+        }
+
+    hass.services.async_register(
+        "weather",
+        "get_forecasts",
+        get_forecasts,
+        supports_response=SupportsResponse.ONLY,
+    )
+    # Dépendance du manifeste (la plateforme météo réelle n'est pas chargée)
+    hass.config.components.add("weather")
+    return hass
+
+
+async def async_stop_hass(hass: HomeAssistant) -> None:
+    """Arrête le cœur et supprime le répertoire de configuration temporaire."""
+    await hass.async_stop(force=True)
+    shutil.rmtree(hass.config.config_dir, ignore_errors=True)
+
+
+def set_weather(hass: HomeAssistant, temperature: float, wind_speed: float) -> None:
+    hass.states.async_set(
+        WEATHER_ENTITY,
+        "cloudy",
+        {"temperature": temperature, "wind_speed": wind_speed},
+    )
+
+
+def set_interior(hass: HomeAssistant, index: int, temperature: float) -> None:
+    hass.states.async_set(interior_sensor(index), f"{temperature:.2f}")
+
+
+async def async_add_entries(
+    hass: HomeAssistant,
+    count: int,
+    start: int = 0,
+    target_hour: str = "06:00:00",
+    recoverycalc_hour: str = "23:00:00",
+) -> list[config_entries.ConfigEntry]:
+    """Crée et configure ``count`` instances SmartHRT via le config flow."""
+    entries = []
+    for index in range(start, start + count):
+        set_interior(hass, index, 19.5)
+        result = await hass.config_entries.flow.async_init(
+            DOMAIN, context={"source": config_entries.SOURCE_USER}
+        )
+        result = await hass.config_entries.flow.async_configure(
+            result["flow_id"], {"name": f"Test {index}"}
+        )
+        result = await hass.config_entries.flow.async_configure(
+            result["flow_id"],
+            {
+                "target_hour": target_hour,
+                "recoverycalc_hour": recoverycalc_hour,
+                "sensor_interior_temperature": interior_sensor(index),
+                "weather_entity": WEATHER_ENTITY,
+                "tsp": 19.0,
+            },
+        )
+        if result["type"] != FlowResultType.CREATE_ENTRY:
+            raise RuntimeError(f"config flow did not create an entry: {result}")
+        entries.append(result["result"])
+    await hass.async_block_till_done()
+    return entries
+
+
+def coordinator(hass: HomeAssistant, entry: config_entries.ConfigEntry) -> Any:
+    return hass.data[DOMAIN][entry.entry_id]["coordinator"]
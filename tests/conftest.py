@@ -0,0 +1,31 @@
+"""Fixtures communes des tests SmartHRT.
+
+Les modules s'importent depuis le dépôt (``custom_components.SmartHRT``).
+Ceux qui dépendent de Home Assistant sont testés dans un cœur réel démarré
+par tests/common.py, qui charge l'intégration depuis ce même paquet.
+"""
+
+from collections.abc import AsyncIterator
+from datetime import datetime
+
+import pytest
+from homeassistant.core import HomeAssistant
+from homeassistant.util import dt as dt_util
+
+from .common import async_start_hass, async_stop_hass
+
+
+@pytest.fixture
+async def hass() -> AsyncIterator[HomeAssistant]:
+    """Cœur Home Assistant avec l'intégration disponible (sans entrée)."""
+    hass = await async_start_hass()
+    try:
+        yield hass
+    finally:
+        await async_stop_hass(hass)
+
+
+@pytest.fixture
+def start() -> datetime:
+    """Instant de départ des horloges virtuelles."""
+    return datetime(2025, 1, 15, 12, tzinfo=dt_util.get_time_zone("Europe/Paris"))
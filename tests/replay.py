@@ -0,0 +1,156 @@
+"""Rejeu accéléré du cycle SmartHRT sur des séries enregistrées.
+
+Le moteur fait parcourir à un coordinateur réel (SmartHRTCoordinator) des
+échantillons horodatés (température intérieure, météo observée), avec une
+horloge virtuelle avancée à la main (ManualClock, cf. tests/clock.py): le temps
+saute d'un échantillon ou d'un minuteur au suivant, si bien qu'une année de
+nuits se rejoue en quelques dizaines de secondes.
+
+Rien n'est réimplémenté: déclencheurs (heure de coupure, mises à jour
+récurrentes, heure de relance avec son hystérésis, heure cible), transitions
+sur seuils de température, calcul de relance (moteur partagé), prévisions
+(ForecastTimeline, via le service weather.get_forecasts de l'entité météo)
+et apprentissage (ADR-006) sont ceux du coordinateur. Chaque échantillon est publié comme un nouvel état du
+capteur intérieur et de l'entité météo de l'instance.
+
+Les cycles terminés sont lus dans l'historique des cycles de l'instance
+(CycleHistory), au même format que pour une instance en service.
+"""
+
+from collections.abc import Iterable
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import NamedTuple
+
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant, callback
+
+from custom_components.SmartHRT.const import (
+    CONF_SENSOR_INTERIOR_TEMP,
+    CONF_WEATHER_ENTITY,
+    DOMAIN,
+)
+from custom_components.SmartHRT.coordinator import SmartHRTCoordinator
+from custom_components.SmartHRT.thermal import CycleRecord
+
+from .clock import ManualClock
+
+
+class Sample(NamedTuple):
+    """Échantillon horodaté (températures en °C, vent en m/s)."""
+
+    time: datetime
+    interior_temp: float
+    exterior_temp: float
+    wind_speed: float
+
+
+class Transition(NamedTuple):
+    """Changement d'état observé par les entités de l'instance.
+
+    Les changements notifiés ensemble sont regroupés (ex: RECOVERY puis
+    HEATING_PROCESS dans le même appel donnent une seule transition).
+    """
+
+    time: datetime
+    from_state: str
+    to_state: str
+
+
+@dataclass
+class ReplayResult:
+    """Bilan d'un rejeu."""
+
+    cycles: list[CycleRecord] = field(default_factory=list)
+    transitions: list[Transition] = field(default_factory=list)
+    samples: int = 0
+    triggers_fired: int = 0
+
+
+class ReplayEngine:
+    """Rejoue des échantillons sur une entrée configurée.
+
+    Le coordinateur de l'entrée doit avoir été créé avec l'horloge clock
+    (enregistrée dans hass.data[DOMAIN][DATA_CLOCK] avant la configuration).
+    À utiliser hors des tâches de Home Assistant (cf. ManualClock).
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        entry: ConfigEntry,
+        clock: ManualClock,
+    ) -> None:
+        coordinator: SmartHRTCoordinator = hass.data[DOMAIN][entry.entry_id][
+            "coordinator"
+        ]
+        self._hass = hass
+        self._coordinator = coordinator
+        self._clock = clock
+        self._interior_entity_id: str = entry.data[CONF_SENSOR_INTERIOR_TEMP]
+        self._weather_entity_id: str | None = entry.data.get(CONF_WEATHER_ENTITY)
+        self._state = coordinator.data.current_state
+        self._fired_at_start = clock.fired
+        self._cycles_at_start = coordinator.persistence_stats["cycles_recorded"]
+        self._result = ReplayResult()
+        self._listening = True
+        coordinator.register_listener(self._on_state_change, {"current_state"})
+
+    @callback
+    def _on_state_change(self) -> None:
+        state = self._coordinator.data.current_state
+        if state != self._state:
+            self._result.transitions.append(
+                Transition(self._clock.now(), self._state, state)
+            )
+            self._state = state
+
+    async def async_feed(self, sample: Sample) -> None:
+        """Avance jusqu'à l'échantillon, le publie et laisse l'instance réagir."""
+        await self._clock.async_advance_to(sample.time)
+
+        self._hass.states.async_set(
+            self._interior_entity_id, f"{sample.interior_temp:.2f}"
+        )
+        if self._weather_entity_id is not None:
+            weather = self._hass.states.get(self._weather_entity_id)
+            self._hass.states.async_set(
+                self._weather_entity_id,
+                weather.state if weather is not None else "unknown",
+                {
+                    **(weather.attributes if weather is not None else {}),
+                    "temperature": sample.exterior_temp,
+                    "wind_speed": sample.wind_speed * 3.6,  # m/s -> km/h
+                },
+            )
+        await self._hass.async_block_till_done()
+        self._result.samples += 1
+
+    async def async_run(self, samples: Iterable[Sample]) -> ReplayResult:
+        """Rejoue tous les échantillons et retourne le bilan."""
+        for sample in samples:
+            await self.async_feed(sample)
+        return await self.async_result()
+
+    async def async_result(self) -> ReplayResult:
+        """Bilan depuis la création du moteur (cycles lus dans l'historique)."""
+        await self._hass.async_block_till_done()
+        result = self._result
+        result.triggers_fired = self._clock.fired - self._fired_at_start
+        recorded = (
+            self._coordinator.persistence_stats["cycles_recorded"]
+            - self._cycles_at_start
+        )
+        if recorded > 0:
+            history = self._coordinator.cycle_history
+            result.cycles = await self._hass.async_add_executor_job(
+                lambda: list(history.records(last=recorded))
+            )
+        return result
+
+    @callback
+    def async_close(self) -> None:
+        """Cesse de suivre les transitions de l'instance."""
+        if self._listening:
+            self._coordinator.unregister_listener(self._on_state_change)
+            self._listening = False
@@ -0,0 +1,57 @@
+"""Tests du coordinateur sur une entrée configurée (coordinator.py)."""
+
+import base64
+from datetime import datetime
+
+import pytest
+from homeassistant.core import HomeAssistant
+
+from custom_components.SmartHRT.const import (
+    DATA_CLOCK,
+    DOMAIN,
+    WIND_HIGH,
+    WIND_HISTORY_MAX_AGE,
+    WIND_LOW,
+)
+from custom_components.SmartHRT.thermal import RollingStats, relax_coefficients
+
+from .clock import ManualClock
+from .common import async_add_entries, coordinator, set_weather
+
+
+async def test_restored_wind_history_drives_learning(
+    hass: HomeAssistant, start: datetime
+) -> None:
+    """Après un redémarrage, l'apprentissage suit le vent moyen restauré."""
+    clock = ManualClock(hass, start)
+    hass.data.setdefault(DOMAIN, {})[DATA_CLOCK] = clock
+    set_weather(hass, temperature=4.0, wind_speed=5.0)  # km/h: calme à la reprise
+    (entry,) = await async_add_entries(hass, 1)
+    smarthrt = coordinator(hass, entry)
+    data = smarthrt.data
+
+    # Vent fort pendant les heures précédant le redémarrage (m/s)
+    now = start.timestamp()
+    stored = RollingStats(8, max_age=WIND_HISTORY_MAX_AGE)
+    stored.append(15.0, now - 3 * 3600)
+    stored.append(14.0, now - 3600)
+    smarthrt._restore_wind_speed_history(base64.b64encode(stored.to_bytes()).decode())
+    average_kmh = (15.0 * 2 + 14.0) / 3 * 3.6
+    assert data.wind_speed_avg * 3.6 == pytest.approx(average_kmh)
+
+    data.rcth_lw, data.rcth_hw, data.rcth = 60.0, 40.0, 50.0
+    data.rcth_calculated = 30.0
+    at_average = relax_coefficients(
+        60.0, 40.0, 50.0, 30.0, average_kmh, data.relaxation_factor, WIND_LOW, WIND_HIGH
+    )
+    at_current = relax_coefficients(
+        60.0, 40.0, 50.0, 30.0, 5.0, data.relaxation_factor, WIND_LOW, WIND_HIGH
+    )
+    smarthrt._update_coefficients("rcth")
+
+    assert (data.rcth_lw, data.rcth_hw) == pytest.approx(
+        (at_average.low, at_average.high)
+    )
+    assert (data.rcth_lw, data.rcth_hw) != pytest.approx(
+        (at_current.low, at_current.high)
+    )
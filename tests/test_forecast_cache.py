@@ -0,0 +1,131 @@
+"""Tests du cache de prévisions partagé (forecast_cache.py)."""
+
+import asyncio
+import logging
+from datetime import datetime, timedelta
+from typing import Any
+
+from homeassistant.components.weather import DOMAIN as WEATHER_DOMAIN
+from homeassistant.components.weather import (
+    Forecast,
+    WeatherEntity,
+    WeatherEntityFeature,
+)
+from homeassistant.components.weather.const import DATA_COMPONENT
+from homeassistant.const import UnitOfTemperature
+from homeassistant.core import HomeAssistant, ServiceCall, SupportsResponse
+from homeassistant.helpers.entity_component import EntityComponent
+
+from custom_components.SmartHRT.const import FORECAST_CACHE_TTL
+from custom_components.SmartHRT.forecast_cache import ForecastCache
+
+from .clock import ManualClock
+from .common import FORECAST_HOURS, WEATHER_ENTITY
+
+_LOGGER = logging.getLogger(__name__)
+
+
+async def test_fetch_is_not_broadcast_to_requester(
+    hass: HomeAssistant, start: datetime
+) -> None:
+    cache = ForecastCache(hass, clock=ManualClock(hass, start))
+    received: dict[str, list[list[dict[str, Any]]]] = {"a": [], "b": []}
+
+    def listener_a(forecast: list[dict[str, Any]]) -> None:
+        received["a"].append(forecast)
+
+    def listener_b(forecast: list[dict[str, Any]]) -> None:
+        received["b"].append(forecast)
+
+    cache.async_subscribe(WEATHER_ENTITY, listener_a)
+    cache.async_subscribe(WEATHER_ENTITY, listener_b)
+
+    forecast = await cache.async_refresh(WEATHER_ENTITY, listener_a)
+
+    assert len(forecast) == FORECAST_HOURS
+    # Le demandeur reçoit la prévision en retour, pas par son listener
+    assert received["a"] == []
+    assert received["b"] == [forecast]
+    assert cache.fetches == 1
+
+
+async def test_coalesced_requesters_are_skipped(
+    hass: HomeAssistant, start: datetime
+) -> None:
+    cache = ForecastCache(hass, clock=ManualClock(hass, start))
+    calls: list[str] = []
+    cache.async_subscribe(WEATHER_ENTITY, lambda forecast: calls.append("a"))
+    cache.async_subscribe(WEATHER_ENTITY, lambda forecast: calls.append("b"))
+    listener_a, listener_b = cache._listeners[WEATHER_ENTITY]
+
+    # Requête suspendue jusqu'à ce que les deux demandes soient en attente
+    release = asyncio.Event()
+    forecast = [{"datetime": start.isoformat(), "temperature": 1.0}]
+
+    async def get_forecasts(call: ServiceCall) -> dict[str, Any]:
+        await release.wait()
+        return {WEATHER_ENTITY: {"forecast": forecast}}
+
+    hass.services.async_register(
+        "weather",
+        "get_forecasts",
+        get_forecasts,
+        supports_response=SupportsResponse.ONLY,
+    )
+
+    first = hass.async_create_task(cache.async_refresh(WEATHER_ENTITY, listener_a))
+    second = hass.async_create_task(cache.async_refresh(WEATHER_ENTITY, listener_b))
+    await asyncio.sleep(0)
+    release.set()
+
+    assert await first is forecast
+    assert await second is forecast
+    assert cache.fetches == 1
+    assert cache.coalesced == 1
+    assert calls == []
+
+
+class PushWeather(WeatherEntity):
+    """Entité météo qui publie ses prévisions horaires."""
+
+    _attr_name = "Test"
+    _attr_supported_features = WeatherEntityFeature.FORECAST_HOURLY
+    _attr_native_temperature = 4.0
+    _attr_native_temperature_unit = UnitOfTemperature.CELSIUS
+
+    def __init__(self) -> None:
+        self.forecast: list[Forecast] = []
+
+    async def async_forecast_hourly(self) -> list[Forecast]:
+        return self.forecast
+
+
+async def test_pushed_forecast_expires_after_ttl(
+    hass: HomeAssistant, start: datetime
+) -> None:
+    # L'entité réelle remplace l'état de substitution de weather.test
+    hass.states.async_remove(WEATHER_ENTITY)
+    entity = PushWeather()
+    component = EntityComponent[WeatherEntity](_LOGGER, WEATHER_DOMAIN, hass)
+    hass.data[DATA_COMPONENT] = component
+    await component.async_add_entities([entity])
+
+    clock = ManualClock(hass, start)
+    cache = ForecastCache(hass, clock=clock)
+    cache.async_subscribe(WEATHER_ENTITY, lambda forecast: None)
+    assert cache.stats["push_subscriptions"] == 1
+
+    entity.forecast = [Forecast(datetime=start.isoformat(), native_temperature=1.0)]
+    await entity.async_update_listeners(["hourly"])
+    pushed = await cache.async_refresh(WEATHER_ENTITY)
+
+    assert cache.pushes == 1
+    assert cache.fetches == 0
+
+    # Un fournisseur qui ne publie plus ne fige pas les prévisions
+    await clock.async_advance(timedelta(seconds=FORECAST_CACHE_TTL))
+    forecast = await cache.async_refresh(WEATHER_ENTITY)
+
+    assert forecast is not pushed
+    assert len(forecast) == FORECAST_HOURS
+    assert cache.fetches == 1
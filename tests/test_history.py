@@ -0,0 +1,111 @@
+"""Tests de l'historique circulaire des cycles (thermal/history.py)."""
+
+import math
+from pathlib import Path
+
+import pytest
+
+from custom_components.SmartHRT.thermal import CycleHistory, CycleRecord
+from custom_components.SmartHRT.thermal import history as history_module
+
+T0 = 1_736_000_000.0
+
+
+def record(night: int) -> CycleRecord:
+    """Cycle de la nuit ``night`` (valeurs exactes en float32)."""
+    start = T0 + night * 86400
+    return CycleRecord(
+        start,
+        start + 8 * 3600,
+        start + 10 * 3600,
+        *(float(night + i) for i in range(13)),
+    )
+
+
+def test_ring_wraps(tmp_path: Path) -> None:
+    history = CycleHistory(str(tmp_path / "cycles.bin"), capacity=3)
+    assert len(history) == 0
+    assert list(history.records()) == []
+
+    for night in range(5):
+        history.append(record(night))
+
+    assert len(history) == 3
+    assert history.appended == 5
+    # Les deux plus anciens ont été écrasés, l'ordre est conservé
+    assert list(history.records()) == [record(2), record(3), record(4)]
+    assert list(history.records(last=2)) == [record(3), record(4)]
+    assert list(history.records(last=10)) == [record(2), record(3), record(4)]
+    assert history.column("time_recovery_calc").tolist() == [
+        record(n).time_recovery_calc for n in (2, 3, 4)
+    ]
+    assert history.column("rcth", last=1).tolist() == [record(4).rcth]
+
+
+def test_reopen_keeps_file_capacity(tmp_path: Path) -> None:
+    path = str(tmp_path / "sub" / "cycles.bin")
+    history = CycleHistory(path, capacity=2)
+    for night in range(3):
+        history.append(record(night))
+
+    # La capacité du fichier existant prime sur celle demandée
+    reopened = CycleHistory(path, capacity=10)
+    assert len(reopened) == 2
+    assert reopened.appended == 3
+    reopened.append(record(3))
+    assert list(reopened.records()) == [record(2), record(3)]
+
+
+def test_interrupted_append_on_full_ring(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    path = str(tmp_path / "cycles.bin")
+    history = CycleHistory(path, capacity=3)
+    for night in range(4):
+        history.append(record(night))
+
+    # Interruption après l'écriture de l'enregistrement, avant l'en-tête
+    def interrupted(capacity: int, appended: int) -> bytes:
+        raise OSError("interrupted")
+
+    monkeypatch.setattr(history_module, "_pack_header", interrupted)
+    with pytest.raises(OSError):
+        history.append(record(4))
+    monkeypatch.undo()
+
+    # L'ajout interrompu n'a écrasé aucun cycle conservé
+    reopened = CycleHistory(path, capacity=3)
+    assert reopened.appended == 4
+    assert list(reopened.records()) == [record(1), record(2), record(3)]
+    reopened.append(record(4))
+    assert list(reopened.records()) == [record(2), record(3), record(4)]
+
+
+def test_missing_values_are_nan(tmp_path: Path) -> None:
+    history = CycleHistory(str(tmp_path / "cycles.bin"), capacity=2)
+    history.append(record(0)._replace(time_recovery_end=math.nan, rpth=math.nan))
+    (stored,) = history.records()
+    assert math.isnan(stored.time_recovery_end)
+    assert math.isnan(stored.rpth)
+
+
+def test_invalid_file(tmp_path: Path) -> None:
+    path = tmp_path / "cycles.bin"
+    path.write_bytes(b"not a cycle history")
+    with pytest.raises(ValueError):
+        len(CycleHistory(str(path), capacity=2))
+    with pytest.raises(ValueError):
+        list(CycleHistory(str(path), capacity=2).records())
+    with pytest.raises(ValueError):
+        CycleHistory(str(path), capacity=0)
+    with pytest.raises(ValueError):
+        CycleHistory(str(path), capacity=2).column("unknown")
+
+
+def test_remove(tmp_path: Path) -> None:
+    history = CycleHistory(str(tmp_path / "cycles.bin"), capacity=2)
+    history.append(record(0))
+    history.remove()
+    assert not Path(history.path).exists()
+    # Recréé vide au prochain accès
+    assert len(history) == 0
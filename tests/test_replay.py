@@ -0,0 +1,63 @@
+"""Test de bout en bout: nuits rejouées sur une entrée configurée (replay.py)."""
+
+import math
+from datetime import datetime, timedelta
+
+from homeassistant.core import HomeAssistant
+
+from custom_components.SmartHRT.const import DATA_CLOCK, DOMAIN
+from custom_components.SmartHRT.coordinator import SmartHRTState
+
+from .clock import ManualClock
+from .common import async_add_entries, coordinator, set_weather
+from .replay import ReplayEngine, Sample
+
+# Maison simulée: constante de refroidissement et puissance de chauffe
+HOUSE_RCTH = 60.0  # h
+HOUSE_RPTH = 25.0  # °C
+STEP = timedelta(minutes=10)
+
+
+async def test_nights_follow_the_state_machine(
+    hass: HomeAssistant, start: datetime
+) -> None:
+    clock = ManualClock(hass, start)
+    hass.data.setdefault(DOMAIN, {})[DATA_CLOCK] = clock
+    set_weather(hass, temperature=4.0, wind_speed=15.0)
+    (entry,) = await async_add_entries(hass, 1)
+    smarthrt = coordinator(hass, entry)
+    tsp = smarthrt.data.tsp
+    engine = ReplayEngine(hass, entry, clock)
+
+    interior = tsp
+    moment = clock.now()
+    while moment < start + timedelta(days=2):
+        await engine.async_feed(Sample(moment, round(interior, 2), 4.0, 15 / 3.6))
+        state = smarthrt.data.current_state
+        if state == SmartHRTState.HEATING_ON and interior >= tsp:
+            interior = tsp
+        else:
+            heating = state in (SmartHRTState.HEATING_ON, SmartHRTState.HEATING_PROCESS)
+            asymptote = 4.0 + (HOUSE_RPTH if heating else 0.0)
+            interior = asymptote + (interior - asymptote) * math.exp(
+                -STEP.total_seconds() / 3600 / HOUSE_RCTH
+            )
+        moment += STEP
+    result = await engine.async_result()
+    engine.async_close()
+
+    assert result.samples == 2 * 24 * 6
+    # Chaque nuit parcourt le cycle complet, dans l'ordre (ADR-003)
+    states = [transition.to_state for transition in result.transitions]
+    night = [
+        SmartHRTState.DETECTING_LAG,
+        SmartHRTState.MONITORING,
+        SmartHRTState.HEATING_PROCESS,
+        SmartHRTState.HEATING_ON,
+    ]
+    assert states == night * 2
+    assert len(result.cycles) == 2
+    for cycle in result.cycles:
+        assert cycle.time_recovery_calc < cycle.time_recovery_start
+        assert cycle.time_recovery_start < cycle.time_recovery_end
+    assert result.triggers_fired > 0
@@ -0,0 +1,152 @@
+"""Tests des statistiques glissantes (thermal/rolling.py)."""
+
+import struct
+
+import pytest
+
+from custom_components.SmartHRT.thermal import RollingStats
+
+T0 = 1_736_000_000.0
+
+
+def test_capacity_evicts_oldest() -> None:
+    stats = RollingStats(3, track_variance=True)
+    for i, value in enumerate([1.0, 2.0, 3.0, 4.0, 5.0]):
+        stats.append(value, T0 + 60 * i)
+
+    assert len(stats) == 3
+    assert list(stats) == [3.0, 4.0, 5.0]
+    assert stats.last == 5.0
+    assert stats.mean == pytest.approx(4.0)
+    assert stats.variance == pytest.approx(2 / 3)
+
+
+def test_time_weighted_mean() -> None:
+    """Chaque valeur compte pour la durée pendant laquelle elle est en vigueur."""
+    stats = RollingStats(8)
+    stats.append(10.0, T0)
+    stats.append(20.0, T0 + 3000)
+    stats.append(30.0, T0 + 3600)
+
+    assert stats.mean == pytest.approx(20.0)
+    assert stats.time_weighted_mean() == pytest.approx((30000 + 12000) / 3600)
+    # La dernière valeur compte jusqu'à now
+    assert stats.time_weighted_mean(T0 + 4200) == pytest.approx(
+        (30000 + 12000 + 18000) / 4200
+    )
+
+
+def test_time_weighted_mean_with_max_age() -> None:
+    """Seules les max_age dernières secondes comptent."""
+    stats = RollingStats(16, max_age=900)
+    stats.append(10.0, T0)
+    stats.append(20.0, T0 + 600)
+    stats.append(30.0, T0 + 1200)
+
+    # [T0 + 300, T0 + 1200]: 300 s à 10, 600 s à 20
+    assert stats.time_weighted_mean(T0 + 1200) == pytest.approx((3000 + 12000) / 900)
+    assert stats.mean == pytest.approx(20.0)
+
+    # Échantillons sortis de la fenêtre évincés au fil de l'eau; le plus
+    # ancien conservé est encore en vigueur au début de la fenêtre
+    stats.append(40.0, T0 + 3000)
+    assert list(stats) == [30.0, 40.0]
+
+
+def test_resolution_replaces_close_samples() -> None:
+    """Un échantillon à moins de resolution du précédent remplace sa valeur."""
+    stats = RollingStats(4, resolution=300)
+    stats.append(10.0, T0)
+    stats.append(12.0, T0 + 120)
+    stats.append(14.0, T0 + 310)
+
+    assert list(stats.items()) == [(T0, 12.0), (T0 + 310, 14.0)]
+    assert stats.mean == pytest.approx(13.0)
+
+
+def test_sums_stay_exact() -> None:
+    """Le recalcul périodique évite la dérive des sommes courantes."""
+    stats = RollingStats(10, track_variance=True)
+    for i in range(10_000):
+        stats.append(20.0 + (i % 7) * 0.1, T0 + i)
+    values = list(stats)
+    mean = sum(values) / len(values)
+    assert stats.mean == pytest.approx(mean, abs=1e-9)
+    assert stats.variance == pytest.approx(
+        sum((v - mean) ** 2 for v in values) / len(values), abs=1e-9
+    )
+
+
+def filled(capacity: int = 8, **kwargs) -> RollingStats:
+    stats = RollingStats(capacity, **kwargs)
+    for i, value in enumerate([18.5, 18.25, 18.0, 17.75, 17.5]):
+        stats.append(value, T0 + 300 * i)
+    return stats
+
+
+def test_bytes_round_trip() -> None:
+    stats = filled(track_variance=True)
+    data = stats.to_bytes()
+    # En-tête puis 8 octets par échantillon
+    assert len(data) == struct.calcsize("<BdH") + 8 * len(stats)
+
+    restored = RollingStats(8, track_variance=True)
+    assert restored.load_bytes(data) == 5
+    assert list(restored.items()) == list(stats.items())
+    assert restored.mean == pytest.approx(stats.mean)
+    assert restored.variance == pytest.approx(stats.variance)
+    assert restored.time_weighted_mean() == pytest.approx(stats.time_weighted_mean())
+
+
+def test_round_trip_precision() -> None:
+    """Instants arrondis à la seconde, valeurs en float32."""
+    stats = RollingStats(4)
+    stats.append(18.123456, T0 + 0.4)
+    stats.append(17.987654, T0 + 61.6)
+
+    restored = RollingStats(4)
+    restored.load_bytes(stats.to_bytes())
+    (t1, v1), (t2, v2) = restored.items()
+    assert t1 == T0 + 0.4
+    assert t2 - t1 == 61
+    assert v1 == pytest.approx(18.123456, abs=1e-5)
+    assert v2 == pytest.approx(17.987654, abs=1e-5)
+
+
+def test_load_skips_old_samples_and_keeps_capacity() -> None:
+    data = filled().to_bytes()
+
+    recent = RollingStats(8)
+    assert recent.load_bytes(data, not_before=T0 + 600) == 3
+    assert list(recent) == [18.0, 17.75, 17.5]
+
+    # Une fenêtre plus petite garde les plus récents
+    small = RollingStats(2)
+    assert small.load_bytes(data) == 2
+    assert list(small) == [17.75, 17.5]
+
+
+def test_load_empty_window() -> None:
+    stats = RollingStats(4)
+    restored = filled()
+    assert restored.load_bytes(stats.to_bytes()) == 0
+    assert not restored
+    assert restored.mean is None
+
+
+@pytest.mark.parametrize(
+    "data",
+    [
+        b"",
+        b"\x01\x00",
+        struct.pack("<BdH", 2, T0, 0),
+        # Annonce trois échantillons, n'en contient qu'un
+        struct.pack("<BdH", 1, T0, 3) + struct.pack("<If", 0, 18.0),
+    ],
+)
+def test_invalid_data(data: bytes) -> None:
+    stats = filled()
+    with pytest.raises(ValueError):
+        stats.load_bytes(data)
+    # Contenu inchangé
+    assert len(stats) == 5
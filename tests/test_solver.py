@@ -0,0 +1,140 @@
+"""Tests du solveur de durée de relance (thermal/solver.py)."""
+
+import math
+import random
+
+import pytest
+
+from custom_components.SmartHRT.thermal import (
+    initial_recovery_duration,
+    solve_recovery_duration,
+)
+
+
+def legacy_recovery_duration(tint, text, tsp, rcth, rpth, time_remaining):
+    """Ancien calculate_recovery_time (relaxation amortie, 20 itérations)."""
+    max_duration = max(time_remaining - 1 / 6, 0)
+    try:
+        ratio = (rpth + text - tint) / (rpth + text - tsp)
+        duration = min(max(rcth * math.log(max(ratio, 0.1)), 0), max_duration)
+    except (ValueError, ZeroDivisionError):
+        duration = max_duration
+
+    for _ in range(20):
+        try:
+            tint_start = text + (tint - text) / math.exp(
+                (time_remaining - duration) / rcth
+            )
+            ratio = (rpth + text - tint_start) / (rpth + text - tsp)
+            if ratio > 0.1:
+                duration = min(
+                    (duration + 2 * max(rcth * math.log(ratio), 0)) / 3,
+                    max_duration,
+                )
+        except (ValueError, ZeroDivisionError):
+            break
+    return duration
+
+
+def legacy_residual(tint, text, tsp, rcth, rpth, time_remaining, duration):
+    """Résidu du point fixe atteint par l'ancienne boucle (inf si bloquée)."""
+    max_duration = max(time_remaining - 1 / 6, 0)
+    tint_start = text + (tint - text) * math.exp((duration - time_remaining) / rcth)
+    ratio = (rpth + text - tint_start) / (rpth + text - tsp)
+    if ratio <= 0.1:
+        return math.inf
+    return abs(duration - min(max(rcth * math.log(ratio), 0), max_duration))
+
+
+def nights(count: int, seed: int = 42) -> list[tuple[float, ...]]:
+    """Nuits réalistes (tint, text, tsp, rcth, rpth, time_remaining)."""
+    rng = random.Random(seed)
+    return [
+        (
+            rng.uniform(15.0, 21.0),
+            rng.uniform(-10.0, 12.0),
+            rng.uniform(18.0, 22.0),
+            rng.uniform(5.0, 150.0),
+            rng.uniform(5.0, 200.0),
+            rng.uniform(0.5, 9.0),
+        )
+        for _ in range(count)
+    ]
+
+
+NIGHTS = nights(1000)
+
+
+def test_matches_legacy_loop_where_it_converged() -> None:
+    """Même durée (à la seconde) que l'ancienne boucle lorsqu'elle a convergé."""
+    compared = 0
+    for tint, text, tsp, rcth, rpth, remaining in NIGHTS:
+        legacy = legacy_recovery_duration(tint, text, tsp, rcth, rpth, remaining)
+        if legacy_residual(tint, text, tsp, rcth, rpth, remaining, legacy) > 1e-6:
+            continue
+        solution = solve_recovery_duration(
+            tint, text, tsp, rcth, rpth, remaining, max(remaining - 1 / 6, 0)
+        )
+        assert solution.converged
+        assert solution.duration == pytest.approx(legacy, abs=1 / 3600)
+        compared += 1
+    assert compared > len(NIGHTS) // 2
+
+
+def test_converges_where_legacy_loop_did_not() -> None:
+    """Newton converge en peu d'itérations, y compris là où la boucle s'arrête."""
+    for tint, text, tsp, rcth, rpth, remaining in NIGHTS:
+        if rpth + text - tsp <= 0:
+            continue
+        solution = solve_recovery_duration(
+            tint, text, tsp, rcth, rpth, remaining, max(remaining - 1 / 6, 0)
+        )
+        if not solution.converged:
+            # Seul cas admis: la durée initiale est déjà hors du modèle
+            assert solution.iterations == 0
+            continue
+        assert solution.residual <= 1e-6
+        assert solution.iterations <= 10
+        assert 0 <= solution.duration <= max(remaining - 1 / 6, 0)
+
+
+def test_warm_start_reuses_previous_duration() -> None:
+    """Démarrée sur la solution, la résolution s'arrête immédiatement."""
+    tint, text, tsp, rcth, rpth, remaining = 19.5, 2.0, 19.0, 50.0, 60.0, 7.5
+    max_duration = remaining - 1 / 6
+    cold = solve_recovery_duration(tint, text, tsp, rcth, rpth, remaining, max_duration)
+    warm = solve_recovery_duration(
+        tint, text, tsp, rcth, rpth, remaining, max_duration, initial=cold.duration
+    )
+
+    assert warm.converged
+    assert warm.iterations == 0
+    assert warm.duration == pytest.approx(cold.duration, abs=1e-6)
+
+    # Une estimation hors de [0, max_duration] est ignorée
+    ignored = solve_recovery_duration(
+        tint, text, tsp, rcth, rpth, remaining, max_duration, initial=-1.0
+    )
+    assert ignored == cold
+
+
+def test_unreachable_setpoint_keeps_legacy_relaxation() -> None:
+    """Consigne hors d'atteinte (rpth + text <= tsp): durée bornée au maximum."""
+    tint, text, tsp, rcth, rpth, remaining = 18.0, -5.0, 20.0, 50.0, 20.0, 6.0
+    solution = solve_recovery_duration(
+        tint, text, tsp, rcth, rpth, remaining, remaining - 1 / 6
+    )
+    legacy = legacy_recovery_duration(tint, text, tsp, rcth, rpth, remaining)
+
+    assert 0 <= solution.duration <= remaining - 1 / 6
+    assert solution.duration == pytest.approx(legacy, abs=1 / 60)
+
+
+def test_initial_estimate_is_bounded() -> None:
+    """L'estimation initiale reste dans [0, max_duration], même sans solution."""
+    # Déjà au-dessus de la consigne: pas de relance
+    assert initial_recovery_duration(22.0, 5.0, 19.0, 50.0, 60.0, 6.0) == 0
+    # Dénominateur nul: durée maximale
+    assert initial_recovery_duration(15.0, 5.0, 19.0, 50.0, 14.0, 6.0) == 6.0
+    # Ratio trop grand: bornée à la durée maximale
+    assert initial_recovery_duration(10.0, 0.0, 19.0, 50.0, 20.0, 3.0) == 3.0
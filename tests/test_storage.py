@@ -0,0 +1,103 @@
+"""Tests du stockage consolidé des données apprises (storage.py)."""
+
+import os
+from datetime import datetime
+
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.storage import Store
+
+from custom_components.SmartHRT.const import DATA_DOMAIN_STORE, DOMAIN
+from custom_components.SmartHRT.storage import (
+    DOMAIN_STORAGE_KEY,
+    DOMAIN_STORAGE_VERSION,
+    ENTRY_STORAGE_VERSION,
+    DomainStore,
+    async_load_entry_store,
+)
+
+from .clock import ManualClock
+
+DELAY = 10.0
+LEARNED = {"rcth_lw": 55.0, "rcth_hw": 40.0, "rpth_lw": 65.0, "rpth_hw": 50.0}
+
+
+def storage_path(hass: HomeAssistant, key: str) -> str:
+    return hass.config.path(".storage", key)
+
+
+async def test_migrates_legacy_file(hass: HomeAssistant, start: datetime) -> None:
+    """Une instance sans section reprend son ancien fichier, supprimé après écriture."""
+    await Store(hass, ENTRY_STORAGE_VERSION, "smarthrt.entry_a").async_save(LEARNED)
+    clock = ManualClock(hass, start)
+    store = DomainStore(hass, delay=DELAY, clock=clock)
+
+    assert await store.async_load_entry("entry_a") == LEARNED
+    assert await store.async_load_entry("entry_b") is None
+    assert store.stats["migrations"] == 1
+    assert store.stats["pending"]
+    # L'ancien fichier reste en place tant que le document n'est pas écrit
+    assert os.path.exists(storage_path(hass, "smarthrt.entry_a"))
+
+    await clock.async_advance(DELAY)
+    assert store.writes == 1
+    assert not store.stats["pending"]
+    assert not os.path.exists(storage_path(hass, "smarthrt.entry_a"))
+
+    document = await Store(
+        hass, DOMAIN_STORAGE_VERSION, DOMAIN_STORAGE_KEY
+    ).async_load()
+    assert document == {"entries": {"entry_a": LEARNED}}
+
+    # Au démarrage suivant, la section est lue dans le document
+    reloaded = DomainStore(hass, delay=DELAY, clock=clock)
+    assert await reloaded.async_load_entry("entry_a") == LEARNED
+    assert reloaded.migrations == 0
+    await reloaded.async_shutdown()
+    await store.async_shutdown()
+
+
+async def test_saves_are_grouped(hass: HomeAssistant, start: datetime) -> None:
+    """Les sauvegardes reçues pendant le délai donnent une seule écriture."""
+    clock = ManualClock(hass, start)
+    store = DomainStore(hass, delay=DELAY, clock=clock)
+    sections = [store.section(f"entry_{i}") for i in range(5)]
+    for i, section in enumerate(sections):
+        assert await section.async_load() is None
+        await section.async_save({**LEARNED, "rcth_lw": 50.0 + i})
+
+    await clock.async_advance(DELAY / 2)
+    assert store.writes == 0
+    await clock.async_advance(DELAY / 2)
+    assert store.writes == 1
+    assert store.save_requests == 5
+    assert store.loads == 1
+
+    # Section retirée (instance supprimée): retirée du document
+    await sections[0].async_remove()
+    await clock.async_advance(DELAY)
+    document = await Store(
+        hass, DOMAIN_STORAGE_VERSION, DOMAIN_STORAGE_KEY
+    ).async_load()
+    assert sorted(document["entries"]) == [f"entry_{i}" for i in range(1, 5)]
+    await store.async_shutdown()
+
+
+async def test_entry_store_takes_back_section(
+    hass: HomeAssistant, start: datetime
+) -> None:
+    """Option désactivée: l'instance reprend sa section dans son propre fichier."""
+    clock = ManualClock(hass, start)
+    store = DomainStore(hass, delay=DELAY, clock=clock)
+    hass.data.setdefault(DOMAIN, {})[DATA_DOMAIN_STORE] = store
+    store.async_save_entry("entry_a", LEARNED)
+    await clock.async_advance(DELAY)
+    own = Store(hass, ENTRY_STORAGE_VERSION, "smarthrt.entry_a")
+    assert await async_load_entry_store(hass, own, "entry_a") == LEARNED
+    assert await own.async_load() == LEARNED
+    assert await store.async_pop_entry("entry_a") is None
+
+    await store.async_shutdown()
+    document = await Store(
+        hass, DOMAIN_STORAGE_VERSION, DOMAIN_STORAGE_KEY
+    ).async_load()
+    assert document == {"entries": {}}
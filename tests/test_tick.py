@@ -0,0 +1,54 @@
+"""Tests de l'horloge partagée des instances (tick.py)."""
+
+from datetime import datetime, timedelta
+
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant
+
+from custom_components.SmartHRT.tick import TickService
+
+from .clock import ClockAction, ManualClock
+
+MINUTE = timedelta(minutes=1)
+
+
+class LateClock(ManualClock):
+    """Horloge manuelle dont les minuteurs échoient avec un retard fixe."""
+
+    def __init__(self, hass: HomeAssistant, start: datetime, lateness: float) -> None:
+        super().__init__(hass, start)
+        self._lateness = timedelta(seconds=lateness)
+
+    def async_track_point_in_time(
+        self, action: ClockAction, when: datetime
+    ) -> CALLBACK_TYPE:
+        return super().async_track_point_in_time(action, when + self._lateness)
+
+
+async def test_ticks_on_aligned_deadlines(hass: HomeAssistant, start: datetime) -> None:
+    """Les ticks visent les minutes pleines; un retard ne se cumule pas."""
+    clock = LateClock(hass, start + timedelta(seconds=20), lateness=5)
+    ticks = TickService(hass, clock=clock)
+    seen: list[datetime] = []
+    ticks.async_register(MINUTE, seen.append)
+
+    await clock.async_advance(timedelta(minutes=3, seconds=30))
+    assert seen == [start + i * MINUTE + timedelta(seconds=5) for i in (1, 2, 3)]
+    assert ticks.stats["60"]["skipped"] == 0
+    ticks.async_shutdown()
+
+
+async def test_overdue_deadlines_are_skipped(
+    hass: HomeAssistant, start: datetime
+) -> None:
+    """Après un retard de plus d'une période, pas de rafale de rattrapage."""
+    clock = LateClock(hass, start, lateness=150)
+    ticks = TickService(hass, clock=clock)
+    seen: list[datetime] = []
+    ticks.async_register(MINUTE, seen.append)
+
+    await clock.async_advance(timedelta(minutes=7))
+    late = timedelta(seconds=150)
+    assert seen == [start + MINUTE + late, start + 4 * MINUTE + late]
+    # Chaque tick en retard de 2,5 périodes saute les deux échéances dépassées
+    assert ticks.stats["60"]["skipped"] == 4
+    ticks.async_shutdown()
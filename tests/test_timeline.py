@@ -0,0 +1,82 @@
+"""Tests de la série de prévisions (thermal/timeline.py)."""
+
+import pytest
+
+from custom_components.SmartHRT.thermal import ForecastTimeline
+
+HOUR = 3600.0
+T0 = 1_736_000_000.0
+
+
+def hourly(*values: float) -> ForecastTimeline:
+    return ForecastTimeline((T0 + i * HOUR, value) for i, value in enumerate(values))
+
+
+def brute_mean(points: list[tuple[float, float]], start: float, end: float) -> float:
+    """Moyenne par découpage fin (valeur constante jusqu'au point suivant)."""
+    samples = 20_000
+    width = (end - start) / samples
+    total = 0.0
+    for i in range(samples):
+        moment = start + (i + 0.5) * width
+        value = points[0][1]
+        for time, point_value in points:
+            if time <= moment:
+                value = point_value
+        total += value
+    return total / samples
+
+
+def test_value_at() -> None:
+    timeline = hourly(4.0, 2.0, 0.0)
+    assert timeline.value_at(T0) == 4.0
+    assert timeline.value_at(T0 + 1.5 * HOUR) == 2.0
+    # Prolongée par la première et la dernière valeur
+    assert timeline.value_at(T0 - 10 * HOUR) == 4.0
+    assert timeline.value_at(T0 + 10 * HOUR) == 0.0
+
+
+def test_mean_over_window() -> None:
+    timeline = hourly(4.0, 2.0, 0.0)
+    assert timeline.start == T0
+    assert timeline.end == T0 + 3 * HOUR
+    assert timeline.mean(T0, T0 + 3 * HOUR) == pytest.approx(2.0)
+    # Une demi-heure à 4 °C puis une heure à 2 °C
+    assert timeline.mean(T0 + 0.5 * HOUR, T0 + 2 * HOUR) == pytest.approx(8 / 3)
+    # Avant et après la série
+    assert timeline.mean(T0 - 2 * HOUR, T0) == pytest.approx(4.0)
+    assert timeline.mean(T0 + 3 * HOUR, T0 + 5 * HOUR) == pytest.approx(0.0)
+    assert timeline.mean(T0 - HOUR, T0 + 4 * HOUR) == pytest.approx(2.0)
+    # Fenêtre vide: valeur au début
+    assert timeline.mean(T0 + 1.5 * HOUR, T0 + HOUR) == 2.0
+
+
+def test_irregular_series() -> None:
+    """Pas irréguliers: recherche dichotomique, dernier pas = pas final."""
+    points = [
+        (T0, 5.0),
+        (T0 + HOUR, 3.0),
+        (T0 + 3 * HOUR, 1.0),
+        (T0 + 3.5 * HOUR, -1.0),
+    ]
+    timeline = ForecastTimeline(reversed(points))
+    assert len(timeline) == 4
+    assert timeline.end == T0 + 4 * HOUR
+    for start, end in [(T0, T0 + 4 * HOUR), (T0 + 0.25 * HOUR, T0 + 3.2 * HOUR)]:
+        assert timeline.mean(start, end) == pytest.approx(
+            brute_mean(points, start, end), abs=1e-3
+        )
+
+
+def test_duplicates_and_empty() -> None:
+    timeline = ForecastTimeline([(T0, 1.0), (T0 + HOUR, 2.0), (T0, 3.0)])
+    assert len(timeline) == 2
+    assert timeline.value_at(T0) == 3.0
+    assert timeline == ForecastTimeline([(T0, 3.0), (T0 + HOUR, 2.0)])
+
+    empty = ForecastTimeline([])
+    assert len(empty) == 0
+    assert empty.start is None
+    assert empty.end is None
+    assert empty.value_at(T0) is None
+    assert empty.mean(T0, T0 + HOUR) is None
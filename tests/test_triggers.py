@@ -0,0 +1,80 @@
+"""Tests des déclencheurs horaires (triggers.py) sur une horloge manuelle."""
+
+from datetime import datetime, timedelta
+
+from homeassistant.core import HomeAssistant
+
+from custom_components.SmartHRT.triggers import TriggerRegistry
+
+from .clock import ManualClock
+
+
+async def test_one_timer_per_key(hass: HomeAssistant, start: datetime) -> None:
+    clock = ManualClock(hass, start)
+    registry = TriggerRegistry(hass, clock)
+    fired: list[tuple[str, datetime]] = []
+
+    def action(key: str):
+        return lambda now: fired.append((key, now))
+
+    registry.async_schedule("target", action("target"), start + timedelta(hours=6))
+    registry.async_schedule("recovery", action("recovery"), start + timedelta(hours=2))
+    # Reprogrammer un type remplace son minuteur
+    registry.async_schedule("recovery", action("recovery"), start + timedelta(hours=3))
+
+    assert registry.armed == 2
+    assert registry.scheduled_time("recovery") == start + timedelta(hours=3)
+    assert registry.stats["replaced"] == 1
+
+    await clock.async_advance(timedelta(hours=2, minutes=30))
+    assert fired == []
+
+    await clock.async_advance_to(start + timedelta(hours=12))
+    assert fired == [
+        ("recovery", start + timedelta(hours=3)),
+        ("target", start + timedelta(hours=6)),
+    ]
+    # Un déclencheur exécuté libère son emplacement
+    assert registry.armed == 0
+    assert registry.scheduled_time("target") is None
+    assert registry.stats["fired"] == 2
+    assert clock.next_timer is None
+
+
+async def test_cancel(hass: HomeAssistant, start: datetime) -> None:
+    clock = ManualClock(hass, start)
+    registry = TriggerRegistry(hass, clock)
+    fired: list[str] = []
+
+    for key in ("cutoff", "target", "update"):
+        registry.async_schedule(
+            key, lambda now, key=key: fired.append(key), start + timedelta(hours=1)
+        )
+    assert registry.async_cancel("cutoff")
+    assert not registry.async_cancel("cutoff")
+    assert registry.armed == 2
+
+    registry.async_cancel_all()
+    assert registry.armed == 0
+    assert registry.stats["cancelled"] == 3
+
+    await clock.async_advance(timedelta(hours=2))
+    assert fired == []
+
+
+async def test_reschedule_from_action(hass: HomeAssistant, start: datetime) -> None:
+    """Une action peut reprogrammer son propre type (déclencheur récurrent)."""
+    clock = ManualClock(hass, start)
+    registry = TriggerRegistry(hass, clock)
+    fired: list[datetime] = []
+
+    def update(now: datetime) -> None:
+        fired.append(now)
+        registry.async_schedule("update", update, now + timedelta(minutes=15))
+
+    registry.async_schedule("update", update, start + timedelta(minutes=15))
+    await clock.async_advance(timedelta(hours=1))
+
+    assert fired == [start + timedelta(minutes=15 * i) for i in range(1, 5)]
+    assert registry.armed == 1
+    assert registry.scheduled_time("update") == start + timedelta(hours=1, minutes=15)
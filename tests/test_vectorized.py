@@ -0,0 +1,69 @@
+"""Tests du solveur vectorisé (thermal/vectorized.py) contre le solveur scalaire."""
+
+import math
+
+import numpy as np
+import pytest
+
+from custom_components.SmartHRT.thermal import (
+    interpolate_coefficient,
+    solve_recovery_duration,
+)
+from custom_components.SmartHRT.thermal.vectorized import (
+    interpolate_wind,
+    solve_recovery_durations,
+)
+
+from .test_solver import nights
+
+
+def test_interpolate_wind_matches_scalar() -> None:
+    winds = np.array([-5.0, 0.0, 4.0, 10.0, 25.0, 60.0, 100.0])
+    batch = interpolate_wind(50.0, 30.0, winds, 10.0, 60.0)
+    expected = [interpolate_coefficient(50.0, 30.0, w, 10.0, 60.0) for w in winds]
+    assert batch.tolist() == pytest.approx(expected, abs=1e-12)
+
+
+def test_batch_matches_scalar() -> None:
+    """Chaque élément reprend la durée, les itérations et la convergence."""
+    cases = nights(2000, seed=7)
+    tint, text, tsp, rcth, rpth, remaining = np.array(cases).T
+    max_duration = np.maximum(remaining - 1 / 6, 0)
+    batch = solve_recovery_durations(
+        tint, text, tsp, rcth, rpth, remaining, max_duration
+    )
+
+    for i, case in enumerate(cases):
+        scalar = solve_recovery_duration(*case, max_duration[i])
+        assert batch.duration[i] == pytest.approx(scalar.duration, abs=1e-9)
+        assert batch.iterations[i] == scalar.iterations
+        assert bool(batch.converged[i]) == scalar.converged
+
+
+def test_batch_warm_start_matches_scalar() -> None:
+    """Démarrage à chaud élément par élément, NaN pour les démarrages à froid."""
+    cases = nights(500, seed=11)
+    tint, text, tsp, rcth, rpth, remaining = np.array(cases).T
+    max_duration = np.maximum(remaining - 1 / 6, 0)
+    initial = np.where(np.arange(len(cases)) % 2 == 0, max_duration / 2, np.nan)
+    batch = solve_recovery_durations(
+        tint, text, tsp, rcth, rpth, remaining, max_duration, initial=initial
+    )
+
+    for i, case in enumerate(cases):
+        scalar = solve_recovery_duration(
+            *case,
+            max_duration[i],
+            initial=None if math.isnan(initial[i]) else float(initial[i]),
+        )
+        assert batch.duration[i] == pytest.approx(scalar.duration, abs=1e-9)
+        assert bool(batch.converged[i]) == scalar.converged
+
+
+def test_broadcasts_scalar_arguments() -> None:
+    """Les paramètres communs (consigne, coefficients) peuvent être des scalaires."""
+    tint = np.linspace(15.0, 21.0, 7)
+    batch = solve_recovery_durations(tint, 2.0, 19.0, 50.0, 60.0, 7.0, 7.0 - 1 / 6)
+    assert batch.duration.shape == (7,)
+    # Plus il fait chaud à l'intérieur, plus la relance est courte
+    assert np.all(np.diff(batch.duration) <= 0)